@@ -0,0 +1,240 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+try:
+    from .main import FlappyBirdAI
+    from .budget import peak_rss_mb
+except ImportError:
+    # Executado como script: python src/main.py
+    from main import FlappyBirdAI
+    from budget import peak_rss_mb
+
+
+# Candidatos de cada etapa da calibração
+BIRD_COUNTS: tuple[int, ...] = (100, 250, 500, 1000, 2000, 5000)
+BATCH_SIZES: tuple[int | None, ...] = (None, 256, 1024, 4096)
+
+# Escolhe-se o primeiro candidato (o menor, para NUM_BIRDS e processos) com ao
+# menos esta fração da maior vazão: ganhos menores não compensam mais memória
+# e gerações mais longas, e estão dentro do ruído das medições curtas
+BIRDS_TOLERANCE: float = 0.9
+TOLERANCE: float = 0.95
+
+# Fração da memória disponível que os processos simultâneos podem ocupar
+MEMORY_FRACTION: float = 0.8
+
+# Parâmetros desativados nas calibrações, que só medem a simulação e a evolução
+_TRIAL_OVERRIDES = {
+    'MAX_GENERATIONS': 10 ** 9,
+    'MAX_TOTAL_STEPS': None,
+    'MAX_RSS_MB': None,
+    'TARGET_SCORE': None,
+    'CHECKPOINT_PATH': None,
+    'METRICS_PORT': None,
+    'RUN_LOG_PATH': None,
+    'MEMORY_REPORT': False,
+    'PROFILE': None,
+    'TIMING': False,
+}
+
+
+class Trial(NamedTuple):
+    """Resultado de uma calibração."""
+
+    stage: str
+    num_birds: int
+    batch_size: int | None
+    workers: int
+    bird_steps_per_second: float    # Soma dos processos
+    peak_rss_mb: float | None       # Maior pico de memória entre os processos
+    generations: int                # Menor número de gerações concluídas entre os processos
+
+    def __str__(self) -> str:
+        rss = f'{self.peak_rss_mb:.0f} MB' if self.peak_rss_mb is not None else '? MB'
+        return (
+            f'{self.num_birds} pássaros, lote {self.batch_size or "-"}, {self.workers} processo(s): '
+            f'{self.bird_steps_per_second:,.0f} steps de pássaros/s, {rss}, {self.generations} geração(ões)'
+        )
+
+
+def available_cpus() -> int:
+    """Número de CPUs que o processo pode usar."""
+
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def available_memory_mb() -> float | None:
+    """Memória disponível no sistema, em MB (None se a plataforma não a informar)."""
+
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def measure_throughput(config: dict, seconds: float, seed: int = 0) -> dict:
+    """Treina sem interface gráfica por cerca de `seconds` segundos e retorna
+    os steps de pássaros vivos por segundo (simulação, inferência e evolução),
+    o pico de memória do processo e o número de gerações concluídas.
+
+    :param config: Parâmetros de FlappyBirdAI.
+    :param seconds: Duração da medição; a geração em andamento é interrompida ao fim.
+    :param seed: Semente do treinamento.
+    """
+
+    ai = FlappyBirdAI(gui = False, verbose = False, config = config | _TRIAL_OVERRIDES | {'MAX_WALL_TIME': seconds, 'SEED': seed})
+    ai.budget.start()
+    bird_steps, generation = 0, 0
+    while ai.budget.exhausted() is None:
+        generation += 1
+        ai.run_generation(generation)
+        bird_steps += ai.generation_bird_steps
+    elapsed = ai.budget.elapsed
+    ai.env.close()
+
+    return {'bird_steps_per_second': bird_steps / elapsed, 'peak_rss_mb': peak_rss_mb(), 'generations': generation}
+
+
+def run_trial(stage: str, config: dict, workers: int, seconds: float) -> Trial:
+    """Mede `workers` treinamentos simultâneos, em processos separados.
+
+    :param stage: Nome da etapa da calibração.
+    :param config: Parâmetros de FlappyBirdAI.
+    :param workers: Número de processos.
+    :param seconds: Duração da medição.
+    """
+
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        futures = [executor.submit(measure_throughput, config, seconds, seed) for seed in range(workers)]
+        results = [future.result() for future in futures]
+
+    rss = [r['peak_rss_mb'] for r in results if r['peak_rss_mb'] is not None]
+    return Trial(
+        stage,
+        config['NUM_BIRDS'],
+        config.get('INFERENCE_BATCH_SIZE'),
+        workers,
+        sum(r['bird_steps_per_second'] for r in results),
+        max(rss) if rss else None,
+        min(r['generations'] for r in results)
+    )
+
+
+def choose(trials: list[Trial], tolerance: float = TOLERANCE) -> Trial:
+    """Primeiro resultado com ao menos `tolerance` da maior vazão."""
+
+    best = max(trial.bird_steps_per_second for trial in trials)
+    return next(trial for trial in trials if trial.bird_steps_per_second >= tolerance * best)
+
+
+def autotune(
+        config: dict | None = None,
+        seconds: float = 1.5,
+        bird_counts: tuple[int, ...] = BIRD_COUNTS,
+        batch_sizes: tuple[int | None, ...] = BATCH_SIZES,
+        max_workers: int | None = None,
+        verbose: bool = True
+) -> dict:
+    """Calibra o número de pássaros, o tamanho do lote de inferência e o
+    número de processos simultâneos (buscas de hiperparâmetros e ilhas)
+    com treinamentos curtos sem interface gráfica.
+
+    As etapas são sequenciais: primeiro NUM_BIRDS, com um processo; depois
+    INFERENCE_BATCH_SIZE, com o NUM_BIRDS escolhido; por fim, o número de
+    processos (potências de 2 até as CPUs disponíveis), descartando os que
+    excederiam MEMORY_FRACTION da memória disponível. Com os padrões, leva
+    cerca de 1,5 s por calibração e menos de um minuto no total.
+
+    :param config: Demais parâmetros de FlappyBirdAI, mantidos nas calibrações.
+    :param seconds: Duração de cada calibração.
+    :param bird_counts: Candidatos a NUM_BIRDS.
+    :param batch_sizes: Candidatos a INFERENCE_BATCH_SIZE (None: sem lotes).
+    :param max_workers: Máximo de processos. Padrão: CPUs disponíveis.
+    :param verbose: Exibe cada calibração ao terminar.
+    :return: A configuração recomendada ('NUM_BIRDS', 'INFERENCE_BATCH_SIZE'
+        e 'workers') e as calibrações ('trials').
+    """
+
+    config = dict(config or {})
+    trials: list[Trial] = []
+    start = time.perf_counter()
+
+    def measure(stage: str, overrides: dict, workers: int = 1) -> Trial:
+        trial = run_trial(stage, config | overrides, workers, seconds)
+        trials.append(trial)
+        if verbose:
+            print(f'[{stage}] {trial}')
+        return trial
+
+    # Pássaros por população, com um processo e sem lotes
+    birds = choose([measure('pássaros', {'NUM_BIRDS': n, 'INFERENCE_BATCH_SIZE': None}) for n in bird_counts], BIRDS_TOLERANCE)
+    num_birds = birds.num_birds
+
+    # Lotes menores que a população; sem lotes, reaproveita a etapa anterior
+    batch = choose([
+        birds if size is None else measure('lote', {'NUM_BIRDS': num_birds, 'INFERENCE_BATCH_SIZE': size})
+        for size in batch_sizes
+        if size is None or size < num_birds
+    ] or [birds])
+    batch_size = batch.batch_size
+
+    # Processos simultâneos que cabem na memória disponível
+    max_workers = max_workers or available_cpus()
+    memory = available_memory_mb()
+    counts = sorted({w for w in (2 ** i for i in range(max_workers.bit_length())) if w <= max_workers} | {max_workers})
+    worker_trials = [batch]
+    for workers in counts[1:]:
+        if memory is not None and batch.peak_rss_mb is not None and workers * batch.peak_rss_mb > MEMORY_FRACTION * memory:
+            break
+        worker_trials.append(measure('processos', {'NUM_BIRDS': num_birds, 'INFERENCE_BATCH_SIZE': batch_size}, workers))
+    workers = choose(worker_trials).workers
+
+    if verbose:
+        print(
+            f'Recomendado: NUM_BIRDS={num_birds}, INFERENCE_BATCH_SIZE={batch_size}, '
+            f'{workers} processo(s) ({time.perf_counter() - start:.1f}s)'
+        )
+
+    return {
+        'NUM_BIRDS': num_birds,
+        'INFERENCE_BATCH_SIZE': batch_size,
+        'workers': workers,
+        'cpus': available_cpus(),
+        'seconds': seconds,
+        'trials': [trial._asdict() for trial in trials],
+    }
+
+
+def save_config(recommendation: dict, path: str | Path) -> None:
+    """Grava a recomendação de `autotune` em JSON."""
+
+    with open(path, 'w') as f:
+        json.dump(recommendation, f, indent = 4)
+
+
+def load_config(path: str | Path) -> tuple[dict, int | None]:
+    """Lê um arquivo de configuração em JSON, como o gravado por `save_config`.
+
+    As chaves em maiúsculas são parâmetros de FlappyBirdAI; 'workers' é o
+    número de processos simultâneos recomendado; as demais são ignoradas.
+
+    :return: Os parâmetros de FlappyBirdAI e o número de processos (ou None).
+    """
+
+    with open(path) as f:
+        data = json.load(f)
+
+    config = {name: value for name, value in data.items() if name.isupper()}
+    unknown = [name for name in config if not hasattr(FlappyBirdAI, name)]
+    if unknown:
+        raise ValueError(f'Parâmetros de treinamento desconhecidos: {unknown}')
+    return config, data.get('workers')
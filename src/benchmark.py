@@ -0,0 +1,345 @@
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, NamedTuple
+try:
+    from .env import FlappyBird, Bird, VectorFlappyBird
+    from .env.pipe import Pipe, Pipes
+    from .nn import NeuralNetwork, PopulationPolicy, crossover, mutate, crossover_genomes, mutate_genomes
+except ImportError:
+    # Executado como script: python src/benchmark.py
+    from env import FlappyBird, Bird, VectorFlappyBird
+    from env.pipe import Pipe, Pipes
+    from nn import NeuralNetwork, PopulationPolicy, crossover, mutate, crossover_genomes, mutate_genomes
+
+
+SIZES = (100, 1_000, 10_000, 100_000)
+QUICK_SIZES = (100, 1_000, 10_000)
+
+
+class Case(NamedTuple):
+    """Operação medida por um benchmark."""
+
+    call: Callable[[], object]                  # Operação medida
+    reset: Callable[[], object] | None = None   # Executado antes de cada amostra, fora da medição
+    max_calls: int | None = None                # Máximo de chamadas por amostra (ex.: antes dos pássaros morrerem)
+
+
+def _env_step(size: int, rng: np.random.Generator) -> Case:
+    env = FlappyBird(num_birds = size, gui = False)
+    actions = np.zeros(size, dtype = int)
+    # Sem pular, os pássaros levam ~30 steps para cair no chão
+    return Case(lambda: env.step(actions), env.reset, max_calls = 20)
+
+
+def _vector_step(size: int, rng: np.random.Generator) -> Case:
+    env = VectorFlappyBird(num_birds = size)
+    actions = np.zeros(size, dtype = int)
+    return Case(lambda: env.step(actions), env.reset, max_calls = 20)
+
+
+def _env_get_states(size: int, rng: np.random.Generator) -> Case:
+    env = FlappyBird(num_birds = size, gui = False)
+    return Case(env.get_states)
+
+
+def _bird_collided(size: int, rng: np.random.Generator) -> Case:
+    # Cano sobreposto aos pássaros, para que as máscaras sejam comparadas
+    pipe = Pipe(Bird.X, Pipe.random_y())
+    birds = [Bird(int(y)) for y in rng.integers(0, Bird.FLOOR, size)]
+    return Case(lambda: [bird._collided(pipe) for bird in birds])
+
+
+def _pipes_update(size: int, rng: np.random.Generator) -> Case:
+    pipes = Pipes()
+    return Case(pipes.update)
+
+
+def _pipes_get_next_pipes(size: int, rng: np.random.Generator) -> Case:
+    pipes = Pipes()
+    return Case(lambda: pipes.get_next_pipes(Bird.X))
+
+
+def _nn_predict(size: int, rng: np.random.Generator) -> Case:
+    nns = [NeuralNetwork() for _ in range(size)]
+    states = rng.random((size, NeuralNetwork.LAYERS[0], 1))
+    return Case(lambda: [nn.predict(state) for nn, state in zip(nns, states)])
+
+
+def _policy_predict(size: int, rng: np.random.Generator) -> Case:
+    policy = PopulationPolicy([NeuralNetwork() for _ in range(size)])
+    states = rng.random((size, NeuralNetwork.LAYERS[0]))
+    return Case(lambda: policy.predict(states))
+
+
+def _crossover(size: int, rng: np.random.Generator) -> Case:
+    nns = [NeuralNetwork() for _ in range(size)]
+    return Case(lambda: [crossover(nn1, nn2, rng) for nn1, nn2 in zip(nns, nns[1:] + nns[:1])])
+
+
+def _mutate(size: int, rng: np.random.Generator) -> Case:
+    nns = [NeuralNetwork() for _ in range(size)]
+    return Case(lambda: [mutate(nn, rate = 1.0, rng = rng) for nn in nns])
+
+
+def _crossover_genomes(size: int, rng: np.random.Generator) -> Case:
+    genomes = rng.standard_normal((size, NeuralNetwork().num_parameters))
+    parents = np.roll(genomes, 1, axis = 0)
+    return Case(lambda: crossover_genomes(genomes, parents, rng))
+
+
+def _mutate_genomes(size: int, rng: np.random.Generator) -> Case:
+    genomes = rng.standard_normal((size, NeuralNetwork().num_parameters))
+    return Case(lambda: mutate_genomes(genomes, rate = 1.0, rng = rng))
+
+
+# Nome -> (construtor do caso, se depende do tamanho da população)
+BENCHMARKS: dict[str, tuple[Callable[[int, np.random.Generator], Case], bool]] = {
+    'env.step': (_env_step, True),
+    'vector.step': (_vector_step, True),
+    'env.get_states': (_env_get_states, True),
+    'bird.collided': (_bird_collided, True),
+    'pipes.update': (_pipes_update, False),
+    'pipes.get_next_pipes': (_pipes_get_next_pipes, False),
+    'nn.predict': (_nn_predict, True),
+    'policy.predict': (_policy_predict, True),
+    'genetic.crossover': (_crossover, True),
+    'genetic.mutate': (_mutate, True),
+    'genetic.crossover_genomes': (_crossover_genomes, True),
+    'genetic.mutate_genomes': (_mutate_genomes, True),
+}
+
+
+def measure(case: Case, min_time: float = 0.2, repeat: int = 5) -> tuple[float, float]:
+    """Mede uma operação e retorna a mediana e o mínimo, em segundos por chamada.
+
+    Cada uma das `repeat` amostras executa a operação quantas vezes forem
+    necessárias para durar cerca de `min_time` (limitado por `case.max_calls`).
+    """
+
+    def sample(number: int) -> float:
+        if case.reset is not None:
+            case.reset()
+        start = time.perf_counter()
+        for _ in range(number):
+            case.call()
+        return (time.perf_counter() - start) / number
+
+    # Calibração, que também aquece caches (imagens, máscaras)
+    once = sample(1)
+    number = max(int(min_time / max(once, 1e-9)), 1)
+    if case.max_calls is not None:
+        number = min(number, case.max_calls)
+
+    samples = [sample(number) for _ in range(repeat)]
+    return float(np.median(samples)), float(np.min(samples))
+
+
+def measure_allocations(case: Case, calls: int = 20) -> tuple[float, float]:
+    """Mede as alocações de uma operação com o tracemalloc e retorna o
+    número de blocos de memória retidos por chamada (vazamentos e caches que
+    crescem) e o maior pico de bytes alocados em uma chamada (temporários).
+
+    :param case: Operação medida.
+    :param calls: Número de chamadas (limitado por `case.max_calls`).
+    """
+
+    if case.max_calls is not None:
+        calls = min(calls, case.max_calls)
+
+    # Aquecimento, para não contar caches preenchidos na primeira chamada
+    if case.reset is not None:
+        case.reset()
+    case.call()
+    if case.reset is not None:
+        case.reset()
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        peak = 0
+        for _ in range(calls):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            case.call()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+        gc.collect()
+        retained = sys.getallocatedblocks() - blocks
+    finally:
+        if started:
+            tracemalloc.stop()
+    return retained / calls, float(peak)
+
+
+def run_benchmarks(
+        sizes: tuple[int, ...] = SIZES,
+        names: list[str] | None = None,
+        min_time: float = 0.2,
+        repeat: int = 5,
+        seed: int = 0,
+        verbose: bool = True,
+        allocations: bool = False
+) -> list[dict]:
+    """Executa os benchmarks e retorna um resultado por (benchmark, tamanho).
+
+    :param sizes: Tamanhos de população.
+    :param names: Benchmarks a executar. Padrão: todos.
+    :param min_time: Duração aproximada de cada amostra, em segundos.
+    :param repeat: Número de amostras.
+    :param seed: Semente dos dados de entrada.
+    :param verbose: Exibe cada resultado ao terminar.
+    :param allocations: Mede também as alocações (ver `measure_allocations`).
+    """
+
+    names = list(BENCHMARKS) if names is None else names
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f'Benchmarks desconhecidos: {unknown}. Opções: {", ".join(BENCHMARKS)}')
+
+    results = []
+    for name in names:
+        factory, scales = BENCHMARKS[name]
+        for size in sizes if scales else (1,):
+            case = factory(size, np.random.default_rng(seed))
+            median, best = measure(case, min_time, repeat)
+            result = {'name': name, 'size': size, 'seconds': median, 'min_seconds': best, 'per_item': median / size}
+            if allocations:
+                result['blocks_per_call'], result['peak_bytes'] = measure_allocations(factory(size, np.random.default_rng(seed)))
+            results.append(result)
+            if verbose:
+                print(format_result(result))
+    return results
+
+
+def format_result(result: dict) -> str:
+    line = (
+        f"{result['name']:<28}{result['size']:>9}{1e6 * result['seconds']:>14.1f} µs"
+        f"{1e9 * result['per_item']:>14.1f} ns/item"
+    )
+    if 'peak_bytes' in result:
+        line += f"{result['peak_bytes'] / 1024:>12.1f} KB/chamada{result['blocks_per_call']:>+10.1f} blocos"
+    return line
+
+
+def save_results(results: list[dict], path: str | Path) -> None:
+    """Salva os resultados em JSON, com a descrição do ambiente."""
+
+    data = {
+        'meta': {
+            'date': datetime.now().isoformat(timespec = 'seconds'),
+            'python': sys.version.split()[0],
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+        },
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent = 2)
+
+
+def load_results(path: str | Path) -> list[dict]:
+    """Lê os resultados salvos com `save_results`."""
+
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def compare(baseline: list[dict], current: list[dict], threshold: float = 0.1) -> list[dict]:
+    """Compara dois conjuntos de resultados, por benchmark e tamanho.
+
+    Retorna, para cada par presente em ambos, a razão entre o tempo
+    atual e o de referência e se é uma regressão (razão > 1 + threshold).
+    Se ambos mediram as alocações, também é regressão o pico de bytes por
+    chamada crescer além de `threshold` ou passar a reter blocos a cada chamada.
+
+    :param baseline: Resultados de referência.
+    :param current: Resultados atuais.
+    :param threshold: Variação tolerada.
+    """
+
+    reference = {(r['name'], r['size']): r for r in baseline}
+    comparison = []
+    for result in current:
+        key = (result['name'], result['size'])
+        if key not in reference:
+            continue
+        base = reference[key]
+        ratio = result['seconds'] / base['seconds']
+        row = {
+            'name': result['name'],
+            'size': result['size'],
+            'baseline': base['seconds'],
+            'current': result['seconds'],
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold,
+        }
+        if 'peak_bytes' in result and 'peak_bytes' in base:
+            # 1 KB de folga para operações que quase não alocam
+            row['peak_bytes_ratio'] = (result['peak_bytes'] + 1024) / (base['peak_bytes'] + 1024)
+            row['blocks_per_call'] = result['blocks_per_call']
+            row['regression'] |= (
+                row['peak_bytes_ratio'] > 1 + threshold
+                or result['blocks_per_call'] > max(base['blocks_per_call'], 0) + 1
+            )
+        comparison.append(row)
+    return comparison
+
+
+def format_comparison(comparison: list[dict]) -> str:
+    lines = [f"{'Benchmark':<28}{'Tamanho':>9}{'Referência (µs)':>18}{'Atual (µs)':>14}{'Razão':>9}"]
+    for row in comparison:
+        lines.append(
+            f"{row['name']:<28}{row['size']:>9}{1e6 * row['baseline']:>18.1f}{1e6 * row['current']:>14.1f}"
+            f"{row['ratio']:>8.2f}x"
+            + (f"  memória {row['peak_bytes_ratio']:.2f}x, {row['blocks_per_call']:+.1f} blocos" if 'peak_bytes_ratio' in row else '')
+            + ('  REGRESSÃO' if row['regression'] else '')
+        )
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+
+    parser = argparse.ArgumentParser(description = 'Benchmarks do ambiente, da inferência e do algoritmo genético.')
+    commands = parser.add_subparsers(dest = 'command', required = True)
+
+    run = commands.add_parser('run', help = 'executa os benchmarks')
+    run.add_argument('--sizes', type = int, nargs = '+', default = None, help = f'tamanhos de população (padrão: {SIZES})')
+    run.add_argument('--quick', action = 'store_true', help = f'apenas os tamanhos {QUICK_SIZES}')
+    run.add_argument('--only', nargs = '+', default = None, metavar = 'NOME', help = 'benchmarks a executar')
+    run.add_argument('--min-time', type = float, default = 0.2, help = 'duração de cada amostra, em segundos')
+    run.add_argument('--repeat', type = int, default = 5, help = 'número de amostras')
+    run.add_argument('--allocations', action = 'store_true', help = 'mede também as alocações de memória (tracemalloc)')
+    run.add_argument('--output', default = 'benchmark.json', help = 'arquivo JSON com os resultados')
+
+    comp = commands.add_parser('compare', help = 'compara resultados com uma referência')
+    comp.add_argument('baseline', help = 'resultados de referência')
+    comp.add_argument('current', help = 'resultados atuais')
+    comp.add_argument('--threshold', type = float, default = 0.1, help = 'variação tolerada antes de acusar regressão')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        sizes = tuple(args.sizes) if args.sizes else QUICK_SIZES if args.quick else SIZES
+        results = run_benchmarks(sizes, args.only, args.min_time, args.repeat, allocations = args.allocations)
+        save_results(results, args.output)
+        print(f'Resultados salvos em {args.output}')
+        return 0
+
+    comparison = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+    print(format_comparison(comparison))
+    return 1 if any(row['regression'] for row in comparison) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
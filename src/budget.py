@@ -0,0 +1,88 @@
+import os
+import sys
+import time
+try:
+    import resource
+except ImportError:
+    # Indisponível no Windows
+    resource = None
+
+
+def peak_rss_mb() -> float | None:
+    """Retorna o pico de memória residente do processo, em MB,
+    ou None se a plataforma não o informar."""
+
+    if resource is None:
+        return None
+    # ru_maxrss é dado em bytes no macOS e em KB no Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 1024
+
+
+def current_rss_mb() -> float | None:
+    """Retorna a memória residente atual do processo, em MB. No Linux
+    é lida de /proc; nas demais plataformas, retorna o pico (peak_rss_mb)."""
+
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return peak_rss_mb()
+    return pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+
+class Budget:
+
+    def __init__(
+            self,
+            wall_time: float | None = None,
+            total_steps: int | None = None,
+            max_rss_mb: float | None = None
+    ) -> None:
+        """Limites de recursos de um treinamento. None desativa o limite.
+
+        :param wall_time: Tempo total de execução, em segundos.
+        :param total_steps: Total de steps simulados, somando todas as gerações.
+        :param max_rss_mb: Pico de memória residente, em MB.
+        """
+
+        self.wall_time: float | None = wall_time
+        self.total_steps: int | None = total_steps
+        self.max_rss_mb: float | None = max_rss_mb
+
+        self.steps: int = 0
+        self._start: float = time.perf_counter()
+
+    def start(self) -> None:
+        """Reinicia a contagem de tempo e de steps."""
+
+        self.steps = 0
+        self._start = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Segundos desde o início."""
+        return time.perf_counter() - self._start
+
+    def add_steps(self, steps: int) -> None:
+        """Contabiliza os steps simulados de uma geração."""
+        self.steps += steps
+
+    def exhausted(self, pending_steps: int = 0) -> str | None:
+        """Retorna o motivo do orçamento estar esgotado, ou None.
+
+        :param pending_steps: Steps da geração em andamento, ainda não contabilizados.
+        """
+
+        if self.wall_time is not None and self.elapsed >= self.wall_time:
+            return f'tempo limite de {self.wall_time:g}s'
+        if self.total_steps is not None and self.steps + pending_steps >= self.total_steps:
+            return f'limite de {self.total_steps} steps'
+        if self.max_rss_mb is not None:
+            rss = peak_rss_mb()
+            if rss is not None and rss >= self.max_rss_mb:
+                return f'limite de memória de {self.max_rss_mb:g} MB ({rss:.0f} MB)'
+        return None
+
+    def __repr__(self) -> str:
+        return f'Budget(wall_time={self.wall_time}, total_steps={self.total_steps}, max_rss_mb={self.max_rss_mb})'
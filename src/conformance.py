@@ -0,0 +1,231 @@
+import argparse
+import random
+import sys
+from functools import partial
+import numpy as np
+from numpy.typing import NDArray
+from typing import Callable, NamedTuple
+try:
+    from .env import FlappyBird
+    from .env.vector import VectorFlappyBird
+except ImportError:
+    # Executado como script: python src/conformance.py
+    from env import FlappyBird
+    from env.vector import VectorFlappyBird
+
+
+FIELDS = ('y', 'velocity', 'alive', 'steps', 'score')
+
+
+class Snapshot(NamedTuple):
+    """Estado dos pássaros de um ambiente em um step."""
+
+    y: NDArray
+    velocity: NDArray
+    alive: NDArray
+    steps: NDArray
+    score: NDArray
+
+
+class Divergence(NamedTuple):
+    """Primeira diferença entre o simulador de referência e o candidato."""
+
+    seed: int
+    step: int
+    field: str
+    birds: NDArray      # Índices dos pássaros divergentes
+    expected: NDArray   # Valores da referência nesses pássaros
+    actual: NDArray     # Valores do candidato nesses pássaros
+
+    def __str__(self) -> str:
+        shown = slice(0, 5)
+        return (
+            f"Divergência na semente {self.seed}, step {self.step}, campo '{self.field}' "
+            f"em {len(self.birds)} pássaro(s) {self.birds[shown].tolist()}: "
+            f"esperado {self.expected[shown].tolist()}, obtido {self.actual[shown].tolist()}"
+        )
+
+
+def snapshot(env) -> Snapshot:
+    """Estado dos pássaros de um `FlappyBird` ou de um motor com vetores
+    `ys`, `velocities`, `is_alive`, `bird_steps` e `bird_scores`."""
+
+    if isinstance(env, FlappyBird):
+        birds = env.birds
+        return Snapshot(
+            y = np.array([bird.y for bird in birds], dtype = float),
+            velocity = np.array([bird.velocity_y for bird in birds], dtype = float),
+            alive = np.array([bird.is_alive for bird in birds]),
+            steps = np.array([bird.steps for bird in birds]),
+            score = np.array([bird.score for bird in birds]),
+        )
+    return Snapshot(
+        y = np.asarray(env.ys, dtype = float),
+        velocity = np.asarray(env.velocities, dtype = float),
+        alive = np.asarray(env.is_alive),
+        steps = np.asarray(env.bird_steps),
+        score = np.asarray(env.bird_scores),
+    )
+
+
+def compare_snapshots(expected: Snapshot, actual: Snapshot, seed: int, step: int) -> Divergence | None:
+    """Compara dois estados campo a campo, exigindo igualdade exata."""
+
+    for field in FIELDS:
+        a, b = getattr(expected, field), getattr(actual, field)
+        if a.shape != b.shape:
+            return Divergence(seed, step, field, np.arange(0), np.array(a.shape), np.array(b.shape))
+        birds = np.flatnonzero(a != b)
+        if len(birds):
+            return Divergence(seed, step, field, birds, a[birds], b[birds])
+    return None
+
+
+def random_actions(
+        states: NDArray,
+        rng: np.random.Generator,
+        margins: NDArray,
+        flap_probability: float = 0.1,
+        noise: float = 0.02
+) -> NDArray:
+    """Sorteia as ações de um step. Os pássaros pares pulam ao acaso; os
+    ímpares seguem um controlador simples (pular ao cair abaixo de `margins`
+    da abertura de baixo) com ruído, para que passem por canos e os testes
+    cubram pontuação e colisões com os canos, não só com o chão e o teto.
+
+    :param states: Estados (N, 4) do simulador de referência.
+    :param rng: Gerador aleatório das ações.
+    :param margins: Margem (N,) de cada pássaro controlado, na escala dos estados.
+    :param flap_probability: Probabilidade de pulo dos pássaros aleatórios.
+    :param noise: Probabilidade de inverter a ação dos pássaros controlados.
+    """
+
+    n = len(states)
+    guided = (states[:, 2] < margins) & (states[:, 3] >= 0)
+    guided ^= rng.random(n) < noise
+    actions = np.where(np.arange(n) % 2 == 1, guided, rng.random(n) < flap_probability)
+    return actions.astype(int)
+
+
+class _Course:
+
+    def __init__(self, seed: int) -> None:
+        """Sequência aleatória própria de um ambiente, para que os dois
+        simuladores sorteiem os mesmos canos mesmo com os steps intercalados."""
+
+        saved = random.getstate()
+        random.seed(seed)
+        self._state = random.getstate()
+        random.setstate(saved)
+
+    def __enter__(self) -> None:
+        self._saved = random.getstate()
+        random.setstate(self._state)
+
+    def __exit__(self, *exc) -> None:
+        self._state = random.getstate()
+        random.setstate(self._saved)
+
+
+def run_conformance(
+        make_candidate: Callable[[int], object],
+        make_reference: Callable[[int], object] = FlappyBird,
+        num_birds: int = 64,
+        seed: int = 0,
+        max_steps: int = 2000,
+        flap_probability: float = 0.1,
+        noise: float = 0.02
+) -> Divergence | None:
+    """Executa o simulador de referência e o candidato lado a lado em um
+    percurso e uma sequência de ações sorteados a partir de `seed`, e retorna
+    a primeira divergência, ou None se forem idênticos.
+
+    :param make_candidate: Cria o simulador candidato, dado o número de pássaros.
+    :param make_reference: Cria o simulador de referência.
+    :param num_birds: Número de pássaros.
+    :param seed: Semente do percurso e das ações.
+    :param max_steps: Máximo de steps comparados.
+    :param flap_probability: Probabilidade de pulo dos pássaros aleatórios.
+    :param noise: Probabilidade de inverter a ação dos pássaros controlados (ver `random_actions`).
+    """
+
+    reference_course, candidate_course = _Course(seed), _Course(seed)
+    with reference_course:
+        reference = make_reference(num_birds)
+    with candidate_course:
+        candidate = make_candidate(num_birds)
+
+    divergence = compare_snapshots(snapshot(reference), snapshot(candidate), seed, 0)
+    rng = np.random.default_rng(seed)
+    margins = rng.uniform(0.03, 0.06, num_birds)
+    states = reference.get_states()
+    step = 0
+    while divergence is None and step < max_steps and snapshot(reference).alive.any():
+        actions = random_actions(states, rng, margins, flap_probability, noise)
+        step += 1
+        with reference_course:
+            states = reference.step(actions)
+        with candidate_course:
+            candidate.step(actions)
+        divergence = compare_snapshots(snapshot(reference), snapshot(candidate), seed, step)
+
+    return divergence
+
+
+def check_conformance(
+        make_candidate: Callable[[int], object],
+        seeds: range | list[int] = range(10),
+        **options
+) -> list[Divergence]:
+    """Executa `run_conformance` em várias sementes e retorna as divergências encontradas.
+
+    :param make_candidate: Cria o simulador candidato, dado o número de pássaros.
+    :param seeds: Sementes dos percursos.
+    :param options: Demais parâmetros de `run_conformance`.
+    """
+
+    divergences = []
+    for seed in seeds:
+        divergence = run_conformance(make_candidate, seed = seed, **options)
+        if divergence is not None:
+            divergences.append(divergence)
+    return divergences
+
+
+# Simuladores alternativos verificáveis pela linha de comando
+ENGINES: dict[str, Callable[[int], object]] = {
+    'vector': VectorFlappyBird,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+
+    parser = argparse.ArgumentParser(description = 'Compara um simulador alternativo com o FlappyBird de referência.')
+    parser.add_argument('--engine', choices = list(ENGINES), default = 'vector', help = 'simulador verificado')
+    parser.add_argument('--seeds', type = int, default = 20, help = 'número de percursos')
+    parser.add_argument('--birds', type = int, default = 64, help = 'pássaros por percurso')
+    parser.add_argument('--steps', type = int, default = 2000, help = 'máximo de steps por percurso')
+    parser.add_argument('--flap-probability', type = float, default = 0.1, help = 'probabilidade de pulo dos pássaros aleatórios')
+    parser.add_argument('--noise', type = float, default = 0.02, help = 'probabilidade de inverter a ação dos pássaros controlados')
+    parser.add_argument('--decision-interval', type = int, default = 1, help = 'ticks de física por step nos dois simuladores')
+    parser.add_argument('--flap-once', action = 'store_true', help = 'pulo apenas no primeiro tick de cada step')
+    args = parser.parse_args(argv)
+
+    interval = {'decision_interval': args.decision_interval, 'flap_once': args.flap_once}
+    divergences = check_conformance(
+        partial(ENGINES[args.engine], **interval),
+        make_reference = partial(FlappyBird, **interval),
+        seeds = range(args.seeds),
+        num_birds = args.birds,
+        max_steps = args.steps,
+        flap_probability = args.flap_probability,
+        noise = args.noise
+    )
+    for divergence in divergences:
+        print(divergence)
+    print(f'{args.seeds - len(divergences)}/{args.seeds} percursos idênticos')
+    return 1 if divergences else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
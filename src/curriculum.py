@@ -0,0 +1,86 @@
+import numpy as np
+from numpy.typing import NDArray
+try:
+    from .env import Difficulty
+except ImportError:
+    # Executado como script: python src/main.py
+    from env import Difficulty
+
+
+class Curriculum:
+
+    def __init__(
+            self,
+            easy: Difficulty,
+            target: Difficulty = Difficulty(),
+            levels: int = 3,
+            promote_score: float = 5,
+            patience: int | None = 5
+    ) -> None:
+        """Currículo de dificuldade: o percurso começa fácil (`easy`) e fica
+        mais difícil em `levels` níveis, interpolados até `target`, o percurso
+        padrão, onde permanece.
+
+        A cada geração, o nível sobe quando a melhor pontuação alcança
+        `promote_score` ou, para que o percurso padrão seja sempre alcançado,
+        após `patience` gerações no mesmo nível.
+
+        :param easy: Parâmetros do primeiro nível.
+        :param target: Parâmetros do último nível.
+        :param levels: Número de níveis, incluindo o primeiro e o último.
+        :param promote_score: Melhor pontuação (canos) que sobe o nível.
+        :param patience: Gerações no mesmo nível até subir mesmo sem
+            alcançar `promote_score` (None desativa).
+        """
+
+        if levels < 1:
+            raise ValueError(f'O currículo deve ter ao menos um nível, não {levels}')
+        if patience is not None and patience < 1:
+            raise ValueError(f'A paciência deve ser ao menos uma geração, não {patience}')
+
+        self.easy: Difficulty = easy
+        self.target: Difficulty = target
+        self.levels: int = levels
+        self.promote_score: float = promote_score
+        self.patience: int | None = patience
+
+        self.level: int = 0
+        self.generations_at_level: int = 0
+
+    @property
+    def final(self) -> bool:
+        """Se o nível atual é o percurso padrão."""
+        return self.level == self.levels - 1
+
+    @property
+    def difficulty(self) -> Difficulty:
+        """Parâmetros do percurso no nível atual."""
+
+        if self.final:
+            return self.target
+        t = self.level / (self.levels - 1)
+        return Difficulty(*(round(easy + t * (target - easy)) for easy, target in zip(self.easy, self.target)))
+
+    def update(self, scores: NDArray) -> bool:
+        """Registra o resultado de uma geração no nível atual e retorna se o nível subiu.
+
+        :param scores: Pontuação de cada genoma na geração.
+        """
+
+        if self.final:
+            return False
+        self.generations_at_level += 1
+        if np.max(scores) >= self.promote_score or (
+            self.patience is not None and self.generations_at_level >= self.patience
+        ):
+            self.level += 1
+            self.generations_at_level = 0
+            return True
+        return False
+
+    def as_dict(self) -> dict:
+        """Nível e parâmetros atuais, para o log estruturado."""
+        return {'level': self.level, 'levels': self.levels} | self.difficulty._asdict()
+
+    def __repr__(self) -> str:
+        return f'Curriculum(level={self.level}/{self.levels - 1}, difficulty={self.difficulty})'
@@ -1,10 +1,18 @@
 from .env import FlappyBird
 from .bird import Bird
-from .pipe import Pipe
+from .pipe import Pipe, Difficulty
+from .timing import PhaseTimer
+from .vector import VectorFlappyBird, CollisionTable
+from .history import ObservationHistory
 
 
 __all__ = [
     "FlappyBird",
     "Bird",
-    "Pipe"
+    "Pipe",
+    "Difficulty",
+    "PhaseTimer",
+    "VectorFlappyBird",
+    "CollisionTable",
+    "ObservationHistory"
 ]
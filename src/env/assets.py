@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import numpy as np
+import pygame as pg
+from numpy.typing import NDArray
+from pathlib import Path
+from typing import Callable
+from .utils import load_img
+
+
+# Incrementar ao mudar o formato do arquivo ou o conteúdo das entradas
+CACHE_VERSION: int = 1
+
+
+def default_cache_path() -> Path | None:
+    """Caminho do cache de assets: a variável de ambiente FLAPPY_ASSET_CACHE
+    (vazia desativa o cache) ou ~/.cache/flappy-neural/assets.bin."""
+
+    path = os.environ.get('FLAPPY_ASSET_CACHE')
+    if path is not None:
+        return Path(path) if path else None
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'flappy-neural' / 'assets.bin'
+
+
+def asset_key(*parts) -> str:
+    """Chave de uma entrada do cache: hash da versão do cache, da versão do
+    pygame e de `parts`, em que caminhos de arquivos contribuem com seu conteúdo."""
+
+    digest = hashlib.sha256(f'{CACHE_VERSION}|{pg.version.ver}'.encode())
+    for part in parts:
+        if isinstance(part, Path):
+            digest.update(part.read_bytes())
+        else:
+            digest.update(f'|{part!r}'.encode())
+    return digest.hexdigest()
+
+
+class AssetCache:
+
+    MAGIC: bytes = b'FLAPPYAC'
+    ALIGNMENT: int = 64
+
+    def __init__(self, path: str | Path) -> None:
+        """Cache em disco de dados derivados dos assets (pixels redimensionados,
+        tabelas de colisão), em um único arquivo binário versionado.
+
+        O arquivo tem um cabeçalho JSON com a chave, o formato e a posição de
+        cada entrada, seguido dos dados alinhados; é aberto com `np.memmap`
+        (cópia na escrita), de modo que processos que iniciam ao mesmo tempo
+        compartilham as páginas em vez de decodificar e recalcular os assets.
+        Uma entrada cuja chave mudou (asset ou tamanho diferente) é refeita e
+        o arquivo regravado atomicamente.
+
+        :param path: Caminho do arquivo.
+        """
+
+        self.path: Path = Path(path)
+        self._entries: dict[str, dict] | None = None
+        self._data: np.memmap | None = None
+        self._start: int = 0
+
+    def get(self, name: str, key: str, build: Callable[[], NDArray]) -> NDArray:
+        """Retorna a entrada `name` se sua chave for `key`; senão, a calcula com
+        `build` e a grava no arquivo.
+
+        :param name: Nome da entrada.
+        :param key: Chave da entrada (ver `asset_key`).
+        :param build: Calcula o array da entrada.
+        """
+
+        if self._entries is None:
+            self._load()
+
+        entry = self._entries.get(name)
+        if entry is not None and entry['key'] == key:
+            return self._view(entry)
+
+        array = np.ascontiguousarray(build())
+        arrays = {other: (entry['key'], self._view(entry)) for other, entry in self._entries.items() if other != name}
+        arrays[name] = (key, array)
+        try:
+            self._write(arrays)
+        except OSError:
+            # Sem permissão de escrita: segue sem cache
+            return array
+        self._load()
+        return array
+
+    def _view(self, entry: dict) -> NDArray:
+        offset, size = self._start + entry['offset'], entry['nbytes']
+        return self._data[offset:offset + size].view(entry['dtype']).reshape(entry['shape'])
+
+    def _load(self) -> None:
+        """Lê o cabeçalho e mapeia o arquivo; um arquivo ausente, de outra
+        versão ou corrompido é tratado como vazio."""
+
+        self._entries, self._data = {}, None
+        try:
+            with open(self.path, 'rb') as f:
+                if f.read(len(self.MAGIC)) != self.MAGIC:
+                    return
+                header_size = int.from_bytes(f.read(4), 'little')
+                header = json.loads(f.read(header_size))
+            if header.get('version') != CACHE_VERSION:
+                return
+            data = np.memmap(self.path, dtype = np.uint8, mode = 'c')
+        except (OSError, ValueError):
+            return
+
+        start = self._align(len(self.MAGIC) + 4 + header_size)
+        entries = header['entries']
+        if any(start + entry['offset'] + entry['nbytes'] > len(data) for entry in entries.values()):
+            return
+        self._entries, self._data, self._start = entries, data, start
+
+    def _write(self, arrays: dict[str, tuple[str, NDArray]]) -> None:
+        """Grava todas as entradas em um arquivo temporário e o renomeia."""
+
+        # Posições relativas ao início dos dados, logo após o cabeçalho
+        entries, offset = {}, 0
+        for name, (key, array) in arrays.items():
+            entries[name] = {'key': key, 'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset, 'nbytes': array.nbytes}
+            offset = self._align(offset + array.nbytes)
+        header = json.dumps({'version': CACHE_VERSION, 'entries': entries}).encode()
+        start = self._align(len(self.MAGIC) + 4 + len(header))
+
+        self.path.parent.mkdir(parents = True, exist_ok = True)
+        temporary = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        try:
+            with open(temporary, 'wb') as f:
+                f.write(self.MAGIC + len(header).to_bytes(4, 'little') + header)
+                for name, (_, array) in arrays.items():
+                    f.seek(start + entries[name]['offset'])
+                    f.write(array.tobytes())
+            os.replace(temporary, self.path)
+        finally:
+            if temporary.exists():
+                temporary.unlink()
+
+    @classmethod
+    def _align(cls, n: int) -> int:
+        return -(-n // cls.ALIGNMENT) * cls.ALIGNMENT
+
+    def __repr__(self) -> str:
+        return f'AssetCache({str(self.path)!r})'
+
+
+_CACHE: AssetCache | None = None
+
+
+def get_cache() -> AssetCache | None:
+    """Cache de assets do processo, em `default_cache_path` (None se desativado)."""
+
+    global _CACHE
+    path = default_cache_path()
+    if path is None:
+        return None
+    if _CACHE is None or _CACHE.path != path:
+        _CACHE = AssetCache(path)
+    return _CACHE
+
+
+def load_image(path: Path, size: tuple[int, int] | None = None) -> pg.Surface:
+    """Como `load_img`, mas lendo os pixels já redimensionados do cache de
+    assets quando disponível.
+
+    :param path: Arquivo da imagem.
+    :param size: Tamanho final da imagem.
+    """
+
+    cache = get_cache()
+    if cache is None:
+        return load_img(path, size)
+
+    def pixels() -> NDArray:
+        # Imagens sem transparência, como o fundo, são guardadas em RGB
+        image = load_img(path, size)
+        fmt = 'RGBA' if image.get_flags() & pg.SRCALPHA else 'RGB'
+        width, height = image.get_size()
+        return np.frombuffer(pg.image.tobytes(image, fmt), dtype = np.uint8).reshape(height, width, len(fmt))
+
+    path = Path(path)
+    array = cache.get(f'image:{path.name}', asset_key(path, size), pixels)
+    height, width, channels = array.shape
+    return pg.image.frombuffer(array, (width, height), 'RGBA' if channels == 4 else 'RGB')
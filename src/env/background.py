@@ -1,5 +1,6 @@
 import pygame as pg
-from .utils import load_img, Image
+from .assets import load_image
+from .utils import Image
 
 
 class Background:
@@ -7,7 +8,12 @@ class Background:
     WIDTH: int = 800
     HEIGHT: int = 600
     SIZE: tuple[int, int] = (WIDTH, HEIGHT)
-    IMAGE: pg.Surface = load_img(Image.BACKGROUND, SIZE)
+    IMAGE: pg.Surface = load_image(Image.BACKGROUND, SIZE)
+
+    @classmethod
+    def convert_image(cls) -> None:
+        """Converte a imagem para o formato da tela. Requer uma tela criada."""
+        cls.IMAGE = cls.IMAGE.convert()
 
     def __init__(self) -> None:
 
@@ -23,7 +29,10 @@ class Background:
         if self.x < -Background.WIDTH:
             self.x = 0
 
+    def blits(self) -> list[tuple[pg.Surface, tuple[int, int]]]:
+        """Retorna os blits do fundo, para `Surface.blits`."""
+        return [(Background.IMAGE, (self.x, 0)), (Background.IMAGE, (self.x + Background.WIDTH, 0))]
+
     def render(self, screen: pg.Surface) -> None:
 
-        screen.blit(Background.IMAGE, (self.x, 0))
-        screen.blit(Background.IMAGE, (self.x + Background.WIDTH, 0))
+        screen.blits(self.blits(), doreturn = False)
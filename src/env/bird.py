@@ -1,6 +1,8 @@
 import pygame as pg
 from .pipe import Pipe
-from .utils import load_img, Image, centralize_x, SCREEN_CENTER_X, SCREEN_CENTER_Y, SCREEN_HEIGHT
+from .timing import PhaseTimer
+from .assets import load_image
+from .utils import Image, centralize_x, SCREEN_CENTER_X, SCREEN_CENTER_Y, SCREEN_HEIGHT
 from typing import Literal
 
 
@@ -38,8 +40,14 @@ class Bird:
     @classmethod
     def get_image(cls) -> pg.Surface:
         if cls._IMAGE is None:
-            cls._IMAGE = load_img(Image.BIRD, cls.SIZE)
+            cls._IMAGE = load_image(Image.BIRD, cls.SIZE)
         return cls._IMAGE
+
+    @classmethod
+    def convert_image(cls) -> None:
+        """Converte a imagem para o formato da tela, para que os blits
+        não convertam pixels a cada quadro. Requer uma tela criada."""
+        cls._IMAGE = cls.get_image().convert_alpha()
     
     @classmethod
     def get_mask(cls) -> pg.Mask:
@@ -47,11 +55,12 @@ class Bird:
             cls._MASK = pg.mask.from_surface(cls.get_image())
         return cls._MASK
 
-    def update(self, action: bool | Literal[0, 1], next_pipe: Pipe, scored: bool) -> None:
+    def update(self, action: bool | Literal[0, 1], next_pipe: Pipe, scored: bool, timer: PhaseTimer | None = None) -> None:
         """Atualiza um pássaro.
 
         :param action: 1 para pular, ou 0.
         :param next_pipe: O cano à sua frente.
+        :param timer: Timer das colisões, o do ambiente (None desativa).
         """
 
         if not self.is_alive:
@@ -66,7 +75,14 @@ class Bird:
             self.velocity_y += Bird.GRAVITY
         self.y += self.velocity_y
 
-        if self._collided(next_pipe):
+        if timer is None:
+            collided = self._collided(next_pipe)
+        else:
+            start = timer.now()
+            collided = self._collided(next_pipe)
+            timer.add('step.birds_update.collisions', start)
+
+        if collided:
             self.is_alive = False
         else:
             self.steps += 1
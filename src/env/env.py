@@ -2,7 +2,8 @@ import numpy as np
 from numpy.typing import NDArray
 from .ui import FlappyBirdUI
 from .bird import Bird
-from .pipe import Pipes, Pipe
+from .pipe import Pipes, Pipe, Difficulty
+from .timing import PhaseTimer
 from .utils import SCREEN_WIDTH, SCREEN_HEIGHT
 from typing import Literal
 
@@ -12,17 +13,48 @@ class EnvClosedError(BaseException): ...
 
 class FlappyBird:
 
-    def __init__(self, num_birds: int, gui: bool = False) -> None:
+    def __init__(
+            self,
+            num_birds: int,
+            gui: bool = False,
+            decision_interval: int = 1,
+            flap_once: bool = False,
+            rng: np.random.Generator | None = None,
+            difficulty: Difficulty | None = None
+    ) -> None:
+        """Ambiente do Flappy Bird com vários pássaros no mesmo percurso.
+
+        :param num_birds: Número de pássaros.
+        :param gui: Se True, cria a janela para renderizar.
+        :param decision_interval: Ticks de física por ação (k). Cada `step`
+            avança k ticks e retorna uma única observação.
+        :param flap_once: Se True, o pulo é aplicado apenas no primeiro tick
+            de cada step; senão, a ação se repete nos k ticks.
+        :param rng: Gerador dos percursos, compartilhado pelos resets.
+            Padrão: o gerador global do módulo random.
+        :param difficulty: Abertura, distância e velocidade dos canos,
+            aplicadas a cada reset. Padrão: os valores padrões do jogo.
+        """
+
+        if decision_interval < 1:
+            raise ValueError(f'O intervalo de decisão deve ser ao menos 1, não {decision_interval}')
 
         self.num_birds: int = num_birds
+        self.decision_interval: int = decision_interval
+        self.flap_once: bool = flap_once
+        self.rng: np.random.Generator | None = rng
+        self.difficulty: Difficulty = difficulty or Difficulty()
 
         self.birds: list[Bird] = [Bird() for _ in range(num_birds)]
-        self.pipes: Pipes = Pipes()
+        self.pipes: Pipes = Pipes.from_difficulty(self.difficulty, rng)
 
         self.score: int = 0
         self.steps: int = 0
         self._next_pipes: tuple[Pipe, Pipe] = self.pipes.get_next_pipes(Bird.X)
 
+        # Timer das fases de step (None desativa a medição)
+        self.timer: PhaseTimer | None = None
+
         if gui:
             self.ui: FlappyBirdUI = FlappyBirdUI()
 
@@ -34,11 +66,11 @@ class FlappyBird:
     def done(self) -> bool:
         return len(self.birds_alive) == 0
     
-    def reset(self) -> list[NDArray]:
+    def reset(self) -> NDArray:
         """Reinicia o ambiente."""
 
         self.birds = [Bird() for _ in range(self.num_birds)]
-        self.pipes = Pipes()
+        self.pipes = Pipes.from_difficulty(self.difficulty, self.rng)
 
         self._next_pipes = self.pipes.get_next_pipes(Bird.X)
         self.steps = 0
@@ -49,51 +81,114 @@ class FlappyBird:
 
         return self.get_states()
 
-    def step(self, actions: list[Literal[0, 1] | bool]) -> list[NDArray]:
+    def respawn(self, indices: list[int] | NDArray) -> NDArray:
+        """Substitui os pássaros `indices` por pássaros novos, sem reiniciar
+        o percurso, e retorna o estado do jogo.
+
+        Os pássaros novos começam centralizados na abertura do próximo cano,
+        pois no meio da tela poderiam surgir dentro de um cano e morrer no
+        primeiro tick.
+
+        :param indices: Posições dos pássaros substituídos.
+        """
+
+        y = self.spawn_y(self._next_pipes[0])
+        for i in indices:
+            self.birds[i] = Bird(y)
+        return self.get_states()
+
+    @staticmethod
+    def spawn_y(pipe: Pipe) -> int:
+        """y de um pássaro centralizado na abertura de `pipe`."""
+        return (pipe.y_upper + Pipe.HEIGHT + pipe.y_lower) // 2 - Bird.HEIGHT // 2
+
+    def step(self, actions: list[Literal[0, 1] | bool] | NDArray, ticks: int | None = None) -> NDArray:
         """Executa uma etapa no ambiente retorna o estado do jogo.
 
+        Com `decision_interval` k > 1, avança k ticks com as mesmas ações
+        (ou pulando apenas no primeiro, com `flap_once`), parando antes se
+        todos os pássaros morrerem; `steps` e `score` contam ticks.
+
         :param actions: lista com as ações de cada pássaro.
+        :param ticks: Ticks desta etapa, ao menos 1 (ex.: o restante até um
+            limite de steps). Padrão: `decision_interval`.
         """
 
         self._check_is_not_closed()
         if len(actions) != len(self.birds):
             raise ValueError(f'O número de ações deve ser igual ao número de pássaros. {len(actions)} != {len(self.birds)}')
 
+        timer = self.timer
+        if timer is not None:
+            start = timer.now()
+
+        self._tick(actions)
+        for _ in range((self.decision_interval if ticks is None else ticks) - 1):
+            if self.done:
+                break
+            self._tick([0] * len(actions) if self.flap_once else actions)
+
+        if timer is not None:
+            t = timer.now()
+        states = self.get_states()
+        if timer is not None:
+            timer.add('step.get_states', t)
+            timer.add('step', start)
+        return states
+
+    def _tick(self, actions: list[Literal[0, 1] | bool] | NDArray) -> None:
+        """Avança um tick de física."""
+
+        timer = self.timer
+        if timer is not None:
+            t = timer.now()
+
         self.pipes.update()
+        if timer is not None:
+            t = timer.add('step.pipes_update', t)
 
         next_pipes = self.pipes.get_next_pipes(Bird.X)
         scored = self._next_pipes[0] != next_pipes[0]
         self._next_pipes = next_pipes
+        if timer is not None:
+            t = timer.add('step.get_next_pipes', t)
 
         self.score += scored
         self.steps += 1
 
         for bird, action in zip(self.birds, actions):
             if bird.is_alive:
-                bird.update(bool(action), next_pipes[0], scored)
+                bird.update(bool(action), next_pipes[0], scored, timer)
+        if timer is not None:
+            t = timer.add('step.birds_update', t)
 
         if hasattr(self, 'ui'):
             self.ui.update(len(self.birds_alive), self.score)
-        return self.get_states()
+            if timer is not None:
+                timer.add('step.ui_update', t)
+
+    @property
+    def alive(self) -> NDArray:
+        """Máscara booleana (N,) com os pássaros vivos."""
+        return np.fromiter((bird.is_alive for bird in self.birds), dtype = bool, count = self.num_birds)
 
-    def get_states(self) -> list[NDArray]:
+    def get_states(self) -> NDArray:
+        """Retorna uma matriz (N, 4) com o estado de cada pássaro."""
 
         distance_x: float = (self._next_pipes[0].x - (Bird.X + Bird.WIDTH)) / SCREEN_WIDTH
         distance_x = max(distance_x, 0)
         y_upper: float = self._next_pipes[0].y_upper + Pipe.HEIGHT
         y_lower: float = self._next_pipes[0].y_lower
 
-        states: list[NDArray] = []
-        for bird in self.birds:
-            bird_middle_right = bird.y + Bird.HEIGHT // 2
-            states.append(np.array([
-                distance_x,                                         # Distância horizontal para o próximo cano
-                (y_upper - bird_middle_right) / SCREEN_HEIGHT,      # Distância vertical para a abertura de cima
-                (y_lower - bird_middle_right) / SCREEN_HEIGHT,      # Distância vertical para a abertura de baixo
-                bird.velocity_y / SCREEN_HEIGHT,                    # Velocidade vertical do pássaro
-                ])
-            )
+        ys = np.fromiter((bird.y for bird in self.birds), dtype = float, count = self.num_birds)
+        velocities = np.fromiter((bird.velocity_y for bird in self.birds), dtype = float, count = self.num_birds)
+        bird_middle_right = ys + Bird.HEIGHT // 2
 
+        states = np.empty((self.num_birds, 4))
+        states[:, 0] = distance_x                                       # Distância horizontal para o próximo cano
+        states[:, 1] = (y_upper - bird_middle_right) / SCREEN_HEIGHT    # Distância vertical para a abertura de cima
+        states[:, 2] = (y_lower - bird_middle_right) / SCREEN_HEIGHT    # Distância vertical para a abertura de baixo
+        states[:, 3] = velocities / SCREEN_HEIGHT                       # Velocidade vertical do pássaro
         return states
 
     def render(self) -> None:
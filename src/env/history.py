@@ -0,0 +1,78 @@
+import numpy as np
+from numpy.typing import NDArray
+
+
+class ObservationHistory:
+
+    def __init__(self, num_birds: int, length: int, num_features: int = 4) -> None:
+        """Últimas `length` observações de cada pássaro, em um buffer circular.
+
+        Cada observação é escrita duas vezes, nas posições i e i + length de
+        um buffer (N, 2 × length, features); assim as `length` observações
+        mais recentes estão sempre contíguas e `stacked` é apenas uma fatia
+        do buffer, sem cópia do histórico a cada step.
+
+        :param num_birds: Número de pássaros.
+        :param length: Número de observações guardadas (K).
+        :param num_features: Número de valores de cada observação.
+        """
+
+        if length < 1:
+            raise ValueError(f'O histórico deve guardar ao menos uma observação, não {length}')
+
+        self.num_birds: int = num_birds
+        self.length: int = length
+        self.num_features: int = num_features
+
+        self._buffer: NDArray = np.zeros((num_birds, 2 * length, num_features))
+        self._next: int = 0
+
+    def reset(self, states: NDArray) -> NDArray:
+        """Reinicia o histórico repetindo a observação inicial em todas as
+        posições e retorna a visão achatada (ver `flat`).
+
+        :param states: Matriz (N, features) com a observação inicial.
+        """
+
+        self._buffer[:] = states[:, None, :]
+        self._next = 0
+        return self.flat
+
+    def reset_rows(self, rows: NDArray, states: NDArray) -> NDArray:
+        """Reinicia o histórico apenas dos pássaros `rows` (ex.: recém-criados)
+        e retorna a visão achatada (ver `flat`).
+
+        :param rows: Índices dos pássaros.
+        :param states: Matriz (N, features) com a observação atual de todos os pássaros.
+        """
+
+        self._buffer[rows] = states[rows][:, None, :]
+        return self.flat
+
+    def push(self, states: NDArray) -> NDArray:
+        """Acrescenta uma observação, descartando a mais antiga,
+        e retorna a visão achatada (ver `flat`).
+
+        :param states: Matriz (N, features) com a observação mais recente.
+        """
+
+        i = self._next
+        self._buffer[:, i] = states
+        self._buffer[:, i + self.length] = states
+        self._next = (i + 1) % self.length
+        return self.flat
+
+    @property
+    def stacked(self) -> NDArray:
+        """Visão (N, K, features) do histórico, da observação mais antiga à mais recente."""
+
+        start = self._next
+        return self._buffer[:, start:start + self.length]
+
+    @property
+    def flat(self) -> NDArray:
+        """Visão (N, K × features) do histórico, a entrada das redes neurais."""
+        return self.stacked.reshape(self.num_birds, self.length * self.num_features)
+
+    def __repr__(self) -> str:
+        return f'ObservationHistory(num_birds={self.num_birds}, length={self.length}, num_features={self.num_features})'
@@ -1,8 +1,10 @@
 import pygame as pg
-from .utils import SCREEN_HEIGHT, load_img, Image, SCREEN_WIDTH
+import numpy as np
+from .assets import load_image
+from .utils import SCREEN_HEIGHT, Image, SCREEN_WIDTH
 import random
 from collections import deque
-from typing import Self, Iterator
+from typing import Self, Iterator, NamedTuple
 
 
 class Pipe:
@@ -22,21 +24,25 @@ class Pipe:
     MAX_Y: int = SCREEN_HEIGHT - GAP
     VELOCITY_X: int = -3
 
-    def __init__(self, x: int, y_lower: int) -> None:
+    def __init__(self, x: int, y_lower: int, gap: int | None = None, velocity_x: int | None = None) -> None:
         """Inicializa um cano.
 
         :param x: Posição x do cano
         :param y_lower: Posição y do cano inferior.
+        :param gap: Abertura entre os canos de cima e de baixo. Padrão: GAP.
+        :param velocity_x: Deslocamento horizontal por tick. Padrão: VELOCITY_X.
         """
 
         self.x: int = x
+        self.gap: int = Pipe.GAP if gap is None else gap
+        self.velocity_x: int = Pipe.VELOCITY_X if velocity_x is None else velocity_x
         self.y_lower: int = y_lower
-        self.y_upper: int = y_lower - Pipe.GAP - Pipe.get_image_upper().get_height()
+        self.y_upper: int = y_lower - self.gap - Pipe.get_image_upper().get_height()
 
     @classmethod
     def get_image_upper(cls) -> pg.Surface:
         if cls._IMAGE_UPPER is None:
-            cls._IMAGE_UPPER = load_img(Image.PIPE, cls.SIZE)
+            cls._IMAGE_UPPER = load_image(Image.PIPE, cls.SIZE)
         return cls._IMAGE_UPPER
     
     @classmethod
@@ -44,6 +50,13 @@ class Pipe:
         if cls._IMAGE_LOWER is None:
             cls._IMAGE_LOWER = pg.transform.flip(cls.get_image_upper(), False, True)
         return cls._IMAGE_LOWER
+
+    @classmethod
+    def convert_images(cls) -> None:
+        """Converte as imagens para o formato da tela, para que os blits
+        não convertam pixels a cada quadro. Requer uma tela criada."""
+        cls._IMAGE_UPPER = cls.get_image_upper().convert_alpha()
+        cls._IMAGE_LOWER = pg.transform.flip(cls._IMAGE_UPPER, False, True)
     
     @classmethod
     def get_mask_upper(cls) -> pg.Mask:
@@ -58,21 +71,39 @@ class Pipe:
         return cls._MASK_LOWER
 
     @classmethod
-    def new_pipe(cls, x: int) -> Self:
+    def new_pipe(cls, x: int, rng: np.random.Generator | None = None) -> Self:
         """Retorna um Pipe com um y aleatório.
 
         :param x: Posição x do cano.
+        :param rng: Gerador do y. Padrão: o gerador global do módulo random.
         """
-        return cls(x, cls.random_y())
+        return cls(x, cls.random_y(rng))
 
     @classmethod
-    def random_y(cls) -> int:
-        """Retorna um y aleatório entre MIN_Y E MAX_Y."""
-        return random.randint(cls.MIN_Y, cls.MAX_Y)
+    def random_y(cls, rng: np.random.Generator | None = None, gap: int | None = None) -> int:
+        """Retorna um y aleatório entre MIN_Y E MAX_Y.
+
+        :param rng: Gerador do y. Padrão: o gerador global do módulo random.
+        :param gap: Abertura entre os canos; os limites passam a ser gap e
+            SCREEN_HEIGHT - gap. Padrão: GAP.
+        """
+
+        low, high = cls.y_range(gap)
+        if rng is None:
+            return random.randint(low, high)
+        return int(rng.integers(low, high, endpoint = True))
+
+    @classmethod
+    def y_range(cls, gap: int | None = None) -> tuple[int, int]:
+        """Menor e maior y do cano de baixo para a abertura `gap` (padrão: GAP)."""
+
+        if gap is None:
+            return cls.MIN_Y, cls.MAX_Y
+        return gap, SCREEN_HEIGHT - gap
 
     def update(self) -> None:
         """Atualiza o cano."""
-        self.x += Pipe.VELOCITY_X
+        self.x += self.velocity_x
 
     def render(self, screen: pg.Surface) -> None:
         """Renderiza o cano em screen."""
@@ -83,14 +114,51 @@ class Pipe:
         return f'Pipe(x={self.x}, y_lower={self.y_lower}, y_upper={self.y_upper})'
 
 
+class Difficulty(NamedTuple):
+    """Parâmetros do percurso: abertura entre os canos, distância
+    horizontal entre canos e deslocamento dos canos por tick."""
+
+    gap: int = Pipe.GAP
+    distance: int = 200
+    velocity_x: int = Pipe.VELOCITY_X
+
+
 class Pipes:
 
-    def __init__(self, x_start: int = SCREEN_WIDTH, distance: int = 200) -> None:
-        """Inicializa os canos."""
+    # Alturas sorteadas de uma vez quando há um gerador próprio
+    HEIGHTS_BLOCK: int = 64
+
+    def __init__(
+            self,
+            x_start: int = SCREEN_WIDTH,
+            distance: int = 200,
+            rng: np.random.Generator | None = None,
+            gap: int = Pipe.GAP,
+            velocity_x: int = Pipe.VELOCITY_X
+    ) -> None:
+        """Inicializa os canos.
+
+        :param x_start: Posição x do primeiro cano.
+        :param distance: Distância horizontal entre canos.
+        :param rng: Gerador das alturas, para percursos reproduzíveis; as
+            alturas são sorteadas em blocos de HEIGHTS_BLOCK.
+            Padrão: o gerador global do módulo random, uma altura por cano.
+        :param gap: Abertura entre os canos de cima e de baixo.
+        :param velocity_x: Deslocamento dos canos por tick.
+        """
 
         self.distance: int = distance
+        self.gap: int = gap
+        self.velocity_x: int = velocity_x
+        self.rng: np.random.Generator | None = rng
+        self._heights: list[int] = []
         self.pipes: deque[Pipe] = self._create_pipes(x_start)
 
+    @classmethod
+    def from_difficulty(cls, difficulty: Difficulty, rng: np.random.Generator | None = None) -> Self:
+        """Cria os canos de um percurso com os parâmetros de `difficulty`."""
+        return cls(distance = difficulty.distance, rng = rng, gap = difficulty.gap, velocity_x = difficulty.velocity_x)
+
     def update(self) -> None:
         """Atualiza os canos."""
 
@@ -100,7 +168,7 @@ class Pipes:
         if self.pipes[0].x < - Pipe.WIDTH:
             self.pipes.popleft()
         if self.pipes[-1].x + Pipe.WIDTH < SCREEN_WIDTH - self.distance:
-            self.pipes.append(Pipe.new_pipe(self.pipes[-1].x + Pipe.WIDTH + self.distance))
+            self.pipes.append(self._new_pipe(self.pipes[-1].x + Pipe.WIDTH + self.distance))
 
     def render(self, screen: pg.Surface) -> None:
         """Renderiza os canos em screen."""
@@ -127,10 +195,24 @@ class Pipes:
         x = x_start
         pipes = deque()
         while x <= SCREEN_WIDTH:
-            pipes.append(Pipe.new_pipe(x))
+            pipes.append(self._new_pipe(x))
             x += Pipe.WIDTH + self.distance
         return pipes
 
+    def _new_pipe(self, x: int) -> Pipe:
+        return Pipe(x, self._random_y(), self.gap, self.velocity_x)
+
+    def _random_y(self) -> int:
+        """Altura do próximo cano, do bloco pré-sorteado quando há um gerador próprio."""
+
+        if self.rng is None:
+            return Pipe.random_y(gap = self.gap)
+        if not self._heights:
+            low, high = Pipe.y_range(self.gap)
+            block = self.rng.integers(low, high, size = self.HEIGHTS_BLOCK, endpoint = True)
+            self._heights = block.tolist()[::-1]
+        return self._heights.pop()
+
     def __getitem__(self, index: int) -> Pipe:
         return self.pipes[index]
 
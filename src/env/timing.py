@@ -0,0 +1,69 @@
+from time import perf_counter
+
+
+class PhaseTimer:
+
+    def __init__(self) -> None:
+        """Acumula o tempo gasto em cada fase do treinamento.
+
+        Os pontos instrumentados só medem algo quando há um timer
+        configurado (ex.: `FlappyBird.timer`); sem ele o custo é uma
+        comparação com None. Fases aninhadas usam nomes com ponto,
+        ex.: 'step' e 'step.pipes_update'.
+        """
+
+        self.totals: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self._start: float = perf_counter()
+
+    @staticmethod
+    def now() -> float:
+        return perf_counter()
+
+    def add(self, phase: str, start: float) -> float:
+        """Soma à fase o tempo desde `start` e retorna o instante atual,
+        para encadear medições consecutivas.
+
+        :param phase: Nome da fase.
+        :param start: Instante inicial, obtido de `now` ou de um `add` anterior.
+        """
+
+        now = perf_counter()
+        self.totals[phase] = self.totals.get(phase, 0.0) + now - start
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+        return now
+
+    def reset(self) -> None:
+        """Zera as fases e reinicia o tempo total."""
+
+        self.totals.clear()
+        self.counts.clear()
+        self._start = perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Segundos desde a criação ou o último `reset`."""
+        return perf_counter() - self._start
+
+    def as_dict(self) -> dict[str, float]:
+        """Retorna o total de segundos de cada fase."""
+        return dict(self.totals)
+
+    def report(self) -> str:
+        """Retorna uma tabela com o tempo total, a fração do tempo
+        decorrido, o número de chamadas e o tempo médio de cada fase."""
+
+        elapsed = self.elapsed
+        width = max((len(phase) for phase in self.totals), default = 4) + 2
+        lines = [f"{'Fase':<{width}}{'Total (s)':>10}{'%':>8}{'Chamadas':>10}{'Média (µs)':>12}"]
+        for phase in sorted(self.totals):
+            total, count = self.totals[phase], self.counts[phase]
+            indent = '  ' * phase.count('.')
+            lines.append(
+                f"{indent + phase.rsplit('.', 1)[-1]:<{width}}{total:>10.3f}{100 * total / elapsed:>8.1f}"
+                f"{count:>10}{1e6 * total / count:>12.1f}"
+            )
+        return '\n'.join(lines)
+
+    def __repr__(self) -> str:
+        return f'PhaseTimer(phases={len(self.totals)})'
@@ -1,29 +1,68 @@
 import pygame as pg
 from .bird import Bird
-from .pipe import Pipes
+from .pipe import Pipes, Pipe
 from .background import Background
-from .utils import SCREEN_SIZE, centralize_x, SCREEN_CENTER_X
+from .utils import SCREEN_SIZE, SCREEN_RECT, SCREEN_CENTER_X
 from typing import Literal
 
 
+Blit = tuple[pg.Surface, tuple[float, float]] | tuple[pg.Surface, pg.Rect, pg.Rect]
+
+
+def _merge_columns(rects: list[pg.Rect]) -> list[pg.Rect]:
+    """Une os retângulos de mesma coluna (x e largura), como os pássaros
+    e os pares de canos, recortados à tela, para reduzir as regiões atualizadas."""
+
+    columns: dict[tuple[int, int], pg.Rect] = {}
+    for rect in rects:
+        key = (rect.x, rect.width)
+        column = columns.get(key)
+        columns[key] = rect.copy() if column is None else column.union(rect)
+    return [rect.clip(SCREEN_RECT) for rect in columns.values()]
+
+
 class FlappyBirdUI:
 
+    FPS: int = 60
+    TEXT_COLOR: tuple[int, int, int] = (255, 255, 255)
+
+    # Com o fundo parado, cada quadro redesenha e atualiza na tela apenas
+    # as regiões alteradas; com o fundo em movimento, a tela toda muda.
+    SCROLL_BACKGROUND: bool = True
+
     def __init__(self) -> None:
 
         pg.init()
 
-        self.background = Background()
-        self._font = pg.font.SysFont('Arial', 48)
-        self._surface_score = self._create_surface_score(0)
-        self._surface_birds_alive = self._create_surface_birds_alive([])
         self._screen = pg.display.set_mode(SCREEN_SIZE)
         self._clock = pg.time.Clock()
 
+        # Imagens no formato da tela, convertidas uma única vez
+        Background.convert_image()
+        Bird.convert_image()
+        Pipe.convert_images()
+
+        self.background = Background()
+        self._font = pg.font.SysFont('Arial', 48)
+        self._glyphs: dict[str, pg.Surface] = {}
+
+        self._score: int | None = None
+        self._birds_alive: int | None = None
+        self._text_score: list[Blit] = []
+        self._text_birds_alive: list[Blit] = []
+
+        # Regiões desenhadas no quadro anterior, a apagar no próximo
+        self._dirty: list[pg.Rect] = []
+        self._full_redraw: bool = True
+
+        self.reset()
+
     def reset(self) -> None:
 
         self.background.reset()
-        self._surface_score = self._create_surface_score(0)
-        self._surface_birds_alive = self._create_surface_birds_alive([])
+        self._set_score(0)
+        self._set_birds_alive(0)
+        self._full_redraw = True
 
     def update(self, birds_alive: int, score: int | None = None) -> None:
         """Executa uma etapa no ambiente retorna o estado do jogo.
@@ -32,38 +71,91 @@ class FlappyBirdUI:
         :param birds_alive: Número de pássaros vivos.
         """
 
-        self.background.update()
+        if self.SCROLL_BACKGROUND:
+            self.background.update()
         if score is not None:
-            self._surface_score = self._create_surface_score(score)
-        self._surface_birds_alive = self._create_surface_birds_alive(birds_alive)
+            self._set_score(score)
+        self._set_birds_alive(birds_alive)
 
     def render(self, birds: list[Bird], pipes: Pipes) -> None:
         """Renderiza o ambiente. Se o ambiente não
         estiver configurado para renderizar, lançará uma exceção."""
 
-        self._screen.fill((0, 0, 0))
-        self.background.render(self._screen)
+        sequence = self.blits(birds, pipes)
+
+        redraw = self._full_redraw or self.SCROLL_BACKGROUND
+        if redraw:
+            sequence = self.background.blits() + sequence
+            self._screen.blits(sequence, doreturn = False)
+            self._dirty = []
+        else:
+            # Apagar o quadro anterior com o fundo e desenhar o atual
+            erase = [(Background.IMAGE, rect, rect) for rect in self._dirty]
+            self._screen.blits(erase, doreturn = False)
+            drawn = _merge_columns(self._screen.blits(sequence))
+            previous, self._dirty = self._dirty, drawn
+
+        self._clock.tick(self.FPS)
+        if redraw:
+            pg.display.flip()
+            self._full_redraw = False
+        else:
+            pg.display.update(previous + drawn)
+
+    def blits(self, birds: list[Bird], pipes: Pipes) -> list[Blit]:
+        """Retorna os blits de canos, pássaros e textos de um quadro, sem o fundo.
+
+        Pássaros na mesma altura são desenhados uma única vez.
+        """
 
-        pipes.render(self._screen)
-        for bird in birds:
-            bird.render(self._screen)
+        image_upper, image_lower = Pipe.get_image_upper(), Pipe.get_image_lower()
+        sequence: list[Blit] = []
+        for pipe in pipes:
+            sequence.append((image_upper, (pipe.x, pipe.y_upper)))
+            sequence.append((image_lower, (pipe.x, pipe.y_lower)))
 
-        self._screen.blit(self._surface_score, (centralize_x(self._surface_score, SCREEN_CENTER_X)[0], 20))
-        self._screen.blit(self._surface_birds_alive, (centralize_x(self._surface_birds_alive, SCREEN_CENTER_X)[0], 60))
+        image = Bird.get_image()
+        sequence.extend((image, (Bird.X, y)) for y in dict.fromkeys(bird.y for bird in birds))
 
-        self._clock.tick(60)
-        pg.display.flip()
+        sequence.extend(self._text_score)
+        sequence.extend(self._text_birds_alive)
+        return sequence
 
     def close(self) -> None:
         pg.quit()
 
-    def _create_surface_score(self, score: int) -> pg.Surface:
-        """Atualiza o score."""
-        return self._font.render(str(score), True, (255, 255, 255))
-    
-    def _create_surface_birds_alive(self, birds_alive: int) -> pg.Surface:
-        """Atualiza o Surface do número de pássaros vivos."""
-        return self._font.render(str(birds_alive), True, (255, 255, 255))
+    def _set_score(self, score: int) -> None:
+        """Atualiza o texto da pontuação, se mudou."""
+
+        if score != self._score:
+            self._score = score
+            self._text_score = self._text_blits(str(score), 20)
+
+    def _set_birds_alive(self, birds_alive: int) -> None:
+        """Atualiza o texto do número de pássaros vivos, se mudou."""
+
+        if birds_alive != self._birds_alive:
+            self._birds_alive = birds_alive
+            self._text_birds_alive = self._text_blits(str(birds_alive), 60)
+
+    def _glyph(self, char: str) -> pg.Surface:
+        """Retorna a imagem de um caractere, renderizada uma única vez."""
+
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            glyph = self._glyphs[char] = self._font.render(char, True, self.TEXT_COLOR).convert_alpha()
+        return glyph
+
+    def _text_blits(self, text: str, y: int) -> list[Blit]:
+        """Blits de `text` centralizado horizontalmente na altura `y`."""
+
+        glyphs = [self._glyph(char) for char in text]
+        x = SCREEN_CENTER_X - sum(glyph.get_width() for glyph in glyphs) // 2
+        blits = []
+        for glyph in glyphs:
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        return blits
 
     def __repr__(self) -> str:
         return f'FlappyBirdUI()'
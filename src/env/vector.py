@@ -0,0 +1,312 @@
+import numpy as np
+import pygame as pg
+from numpy.typing import NDArray
+from .assets import asset_key, get_cache
+from .bird import Bird
+from .env import EnvClosedError
+from .pipe import Pipes, Pipe, Difficulty
+from .timing import PhaseTimer
+from .utils import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_CENTER_Y, Image
+
+
+class CollisionTable:
+
+    _TABLE: 'CollisionTable | None' = None
+
+    def __init__(self, bird_mask: pg.Mask, pipe_mask_upper: pg.Mask, pipe_mask_lower: pg.Mask, cached: bool = False) -> None:
+        """Tabela com o resultado de `Bird._collided` para cada deslocamento
+        inteiro entre o pássaro e os canos, calculada uma vez com as próprias
+        máscaras do pygame.
+
+        O pygame trunca deslocamentos fracionários em direção a zero; a
+        consulta faz o mesmo, de modo que o resultado é idêntico ao de
+        `Mask.overlap` para qualquer y.
+
+        Com `cached`, as tabelas são lidas do cache de assets (e gravadas nele
+        na primeira vez), evitando recalculá-las a cada processo.
+        """
+
+        self.bird_mask: pg.Mask = bird_mask
+        self.pipe_mask_upper: pg.Mask = pipe_mask_upper
+        self.pipe_mask_lower: pg.Mask = pipe_mask_lower
+
+        # Só há sobreposição com -Pipe.WIDTH < dx < Bird.WIDTH e -Pipe.HEIGHT < dy < Bird.HEIGHT
+        self.dx_min: int = -Pipe.WIDTH + 1
+        self.dy_min: int = -Pipe.HEIGHT + 1
+        dxs = range(self.dx_min, Bird.WIDTH)
+        dys = range(self.dy_min, Bird.HEIGHT)
+
+
+        def build() -> NDArray:
+            return np.array([
+                [[bird_mask.overlap(pipe_mask, (dx, dy)) is not None for dy in dys] for dx in dxs]
+                for pipe_mask in (pipe_mask_upper, pipe_mask_lower)
+            ])
+
+        masks = bird_mask, pipe_mask_upper, pipe_mask_lower
+        cache = get_cache() if cached and all(isinstance(mask, pg.Mask) for mask in masks) else None
+        if cache is None:
+            tables = build()
+        else:
+            # Tamanho, número de pixels e centroide identificam máscaras de outras imagens
+            signature = [(mask.get_size(), mask.count(), mask.centroid()) for mask in masks]
+            key = asset_key('collision', Image.BIRD, Image.PIPE, signature)
+            tables = cache.get('collision', key, build)
+        self.upper: NDArray = tables[0]
+        self.lower: NDArray = tables[1]
+
+    @classmethod
+    def get(cls) -> 'CollisionTable':
+        """Retorna a tabela das máscaras atuais de Bird e Pipe, recalculando-a se mudaram."""
+
+        masks = Bird.get_mask(), Pipe.get_mask_upper(), Pipe.get_mask_lower()
+        table = cls._TABLE
+        if table is None or (table.bird_mask, table.pipe_mask_upper, table.pipe_mask_lower) != masks:
+            table = cls._TABLE = cls(*masks, cached = True)
+        return table
+
+    def _lookup(self, table: NDArray, dx: NDArray, dy: NDArray) -> NDArray:
+        i = dx - self.dx_min
+        j = np.trunc(dy).astype(int) - self.dy_min
+        inside = (i >= 0) & (i < table.shape[0]) & (j >= 0) & (j < table.shape[1])
+        result = np.zeros(len(dy), dtype = bool)
+        result[inside] = table[i[inside], j[inside]]
+        return result
+
+    def collided_many(self, ys: NDArray, xs: NDArray, ys_upper: NDArray, ys_lower: NDArray) -> NDArray:
+        """Versão vetorizada de `Bird._collided`, com um cano por pássaro.
+
+        :param ys: Altura de cada pássaro.
+        :param xs: Posição x do cano de cada pássaro.
+        :param ys_upper: y do cano de cima de cada pássaro.
+        :param ys_lower: y do cano de baixo de cada pássaro.
+        """
+
+        collided = (ys < -Bird.HEIGHT//2) | (ys > Bird.FLOOR)
+        dx = np.broadcast_to(xs - Bird.X, ys.shape)
+        collided |= self._lookup(self.upper, dx, ys_upper - ys)
+        collided |= self._lookup(self.lower, dx, ys_lower - ys)
+        return collided
+
+    def collided(self, ys: NDArray, pipe: Pipe) -> NDArray:
+        """Versão vetorizada de `Bird._collided` para os pássaros nas alturas `ys`."""
+
+        if not self.dx_min <= pipe.x - Bird.X < Bird.WIDTH:
+            return (ys < -Bird.HEIGHT//2) | (ys > Bird.FLOOR)
+        return self.collided_many(ys, np.asarray(pipe.x), pipe.y_upper, pipe.y_lower)
+
+    def __repr__(self) -> str:
+        return f'CollisionTable(shape={self.upper.shape})'
+
+
+class VectorFlappyBird:
+
+    def __init__(
+            self,
+            num_birds: int,
+            num_courses: int = 1,
+            seeds: list[int] | None = None,
+            decision_interval: int = 1,
+            flap_once: bool = False,
+            difficulty: Difficulty | None = None
+    ) -> None:
+        """Versão vetorizada de `FlappyBird`, sem interface gráfica, com
+        um ou mais percursos simulados ao mesmo tempo.
+
+        Os canos continuam sendo objetos `Pipes`, um por percurso; a posição,
+        a velocidade e a situação de cada pássaro ficam em vetores,
+        atualizados de uma vez a cada step, e as colisões são consultadas
+        em uma `CollisionTable`. Com um percurso e a mesma sequência
+        aleatória, o resultado é idêntico ao de `FlappyBird`.
+
+        O pássaro i percorre o percurso i % num_courses: os vetores de
+        tamanho N = P × R, vistos como (P, R), têm uma linha por indivíduo.
+
+        :param num_birds: Número total de pássaros.
+        :param num_courses: Número de percursos (R).
+        :param seeds: Semente de cada percurso. Padrão: gerador global do módulo random.
+        :param decision_interval: Ticks de física por ação, como em `FlappyBird`.
+        :param flap_once: Pulo apenas no primeiro tick de cada step, como em `FlappyBird`.
+        :param difficulty: Parâmetros dos canos de todos os percursos, como em `FlappyBird`.
+        """
+
+        if decision_interval < 1:
+            raise ValueError(f'O intervalo de decisão deve ser ao menos 1, não {decision_interval}')
+
+        self.num_birds: int = num_birds
+        self.num_courses: int = num_courses
+        self.decision_interval: int = decision_interval
+        self.flap_once: bool = flap_once
+        self.difficulty: Difficulty = difficulty or Difficulty()
+        self.timer: PhaseTimer | None = None
+        self._table: CollisionTable = CollisionTable.get()
+        self._course: NDArray = np.arange(num_birds) % num_courses
+        self.reset(seeds)
+
+    @property
+    def alive(self) -> NDArray:
+        """Máscara booleana (N,) com os pássaros vivos."""
+        return self.is_alive
+
+    @property
+    def num_alive(self) -> int:
+        return int(self.is_alive.sum())
+
+    @property
+    def done(self) -> bool:
+        return not self.is_alive.any()
+
+    @property
+    def pipes(self) -> Pipes:
+        """Canos do primeiro percurso."""
+        return self.courses[0]
+
+    @property
+    def score(self) -> int:
+        """Maior pontuação entre os percursos."""
+        return int(self.scores.max())
+
+    def reset(self, seeds: list[int] | None = None) -> NDArray:
+        """Reinicia o ambiente.
+
+        :param seeds: Semente de cada percurso. Padrão: gerador global do módulo random.
+        """
+
+        if seeds is not None and len(seeds) != self.num_courses:
+            raise ValueError(f'O número de sementes deve ser igual ao número de percursos. {len(seeds)} != {self.num_courses}')
+
+        n = self.num_birds
+        self.ys: NDArray = np.full(n, float(SCREEN_CENTER_Y))
+        self.velocities: NDArray = np.zeros(n)
+        self.is_alive: NDArray = np.ones(n, dtype = bool)
+        self.bird_steps: NDArray = np.zeros(n, dtype = int)
+        self.bird_scores: NDArray = np.zeros(n, dtype = int)
+
+        self.courses: list[Pipes] = [
+            Pipes.from_difficulty(self.difficulty, None if seeds is None else np.random.default_rng(int(seed)))
+            for seed in (seeds if seeds is not None else range(self.num_courses))
+        ]
+        self._next_pipes: list[Pipe] = [pipes.get_next_pipes(Bird.X)[0] for pipes in self.courses]
+        self._update_pipe_arrays()
+
+        self.scores: NDArray = np.zeros(self.num_courses, dtype = int)
+        self.steps: int = 0
+        return self.get_states()
+
+    def respawn(self, indices: list[int] | NDArray) -> NDArray:
+        """Recoloca os pássaros `indices`, vivos e sem steps, centralizados na
+        abertura do próximo cano do seu percurso, sem reiniciar os percursos,
+        como `FlappyBird.respawn`.
+
+        :param indices: Posições dos pássaros.
+        """
+
+        course = self._course[indices]
+        self.ys[indices] = (self._pipe_y_upper[course] + Pipe.HEIGHT + self._pipe_y_lower[course]) // 2 - Bird.HEIGHT // 2
+        self.velocities[indices] = 0
+        self.is_alive[indices] = True
+        self.bird_steps[indices] = 0
+        self.bird_scores[indices] = 0
+        return self.get_states()
+
+    def _update_pipe_arrays(self) -> None:
+        """Posição do próximo cano de cada percurso."""
+
+        self._pipe_x: NDArray = np.array([pipe.x for pipe in self._next_pipes])
+        self._pipe_y_upper: NDArray = np.array([pipe.y_upper for pipe in self._next_pipes])
+        self._pipe_y_lower: NDArray = np.array([pipe.y_lower for pipe in self._next_pipes])
+
+    def step(self, actions: NDArray, ticks: int | None = None) -> NDArray:
+        """Executa uma etapa no ambiente e retorna o estado do jogo.
+
+        Avança `decision_interval` ticks, como `FlappyBird.step`.
+
+        :param actions: Vetor (N,) com a ação de cada pássaro (1 para pular).
+        :param ticks: Ticks desta etapa (ver `FlappyBird.step`).
+        """
+
+        actions = np.asarray(actions).reshape(-1)
+        if len(actions) != self.num_birds:
+            raise ValueError(f'O número de ações deve ser igual ao número de pássaros. {len(actions)} != {self.num_birds}')
+        if self.done:
+            raise EnvClosedError('Ambiente já fechado.')
+
+        timer = self.timer
+        if timer is not None:
+            start = timer.now()
+
+        self._tick(actions)
+        for _ in range((self.decision_interval if ticks is None else ticks) - 1):
+            if self.done:
+                break
+            self._tick(np.zeros_like(actions) if self.flap_once else actions)
+
+        if timer is not None:
+            t = timer.now()
+        states = self.get_states()
+        if timer is not None:
+            timer.add('step.get_states', t)
+            timer.add('step', start)
+        return states
+
+    def _tick(self, actions: NDArray) -> None:
+        """Avança um tick de física."""
+
+        timer = self.timer
+        if timer is not None:
+            t = timer.now()
+
+        scored = np.empty(self.num_courses, dtype = bool)
+        for c, pipes in enumerate(self.courses):
+            pipes.update()
+            next_pipe = pipes.get_next_pipes(Bird.X)[0]
+            scored[c] = self._next_pipes[c] is not next_pipe
+            self._next_pipes[c] = next_pipe
+        self._update_pipe_arrays()
+        self.scores += scored
+        self.steps += 1
+        if timer is not None:
+            t = timer.add('step.pipes_update', t)
+
+        # Física apenas dos pássaros vivos
+        alive = np.flatnonzero(self.is_alive)
+        velocities = np.where(actions[alive] != 0, float(Bird.LIFT), self.velocities[alive] + Bird.GRAVITY)
+        ys = self.ys[alive] + velocities
+        self.velocities[alive] = velocities
+        self.ys[alive] = ys
+
+        course = self._course[alive]
+        collided = self._table.collided_many(ys, self._pipe_x[course], self._pipe_y_upper[course], self._pipe_y_lower[course])
+        self.is_alive[alive[collided]] = False
+        survivors = alive[~collided]
+        self.bird_steps[survivors] += 1
+        self.bird_scores[survivors] += scored[self._course[survivors]]
+        if timer is not None:
+            timer.add('step.birds_update', t)
+
+    def get_states(self) -> NDArray:
+        """Retorna uma matriz (N, 4) com o estado de cada pássaro, como `FlappyBird.get_states`."""
+
+        distance_x = np.maximum((self._pipe_x - (Bird.X + Bird.WIDTH)) / SCREEN_WIDTH, 0)
+        y_upper = self._pipe_y_upper + Pipe.HEIGHT
+        y_lower = self._pipe_y_lower
+        bird_middle_right = self.ys + Bird.HEIGHT // 2
+
+        states = np.empty((self.num_birds, 4))
+        if self.num_courses == 1:
+            states[:, 0] = distance_x[0]
+            states[:, 1] = (y_upper[0] - bird_middle_right) / SCREEN_HEIGHT
+            states[:, 2] = (y_lower[0] - bird_middle_right) / SCREEN_HEIGHT
+        else:
+            course = self._course
+            states[:, 0] = distance_x[course]
+            states[:, 1] = (y_upper[course] - bird_middle_right) / SCREEN_HEIGHT
+            states[:, 2] = (y_lower[course] - bird_middle_right) / SCREEN_HEIGHT
+        states[:, 3] = self.velocities / SCREEN_HEIGHT
+        return states
+
+    def close(self) -> None:
+        self.is_alive[:] = False
+
+    def __repr__(self) -> str:
+        return f'VectorFlappyBird(birds_alive={self.num_alive}, courses={self.num_courses}, score={self.score})'
@@ -0,0 +1,40 @@
+import numpy as np
+from numpy.typing import NDArray
+
+
+AGGREGATIONS = ('mean', 'min', 'trimmed_mean')
+
+
+def trimmed_mean(values: NDArray, trim: float = 0.2, axis: int = -1) -> NDArray:
+    """Média após descartar a fração `trim` dos menores e dos maiores valores.
+
+    :param values: Valores a agregar.
+    :param trim: Fração descartada em cada extremo, em [0, 0.5).
+    :param axis: Eixo agregado.
+    """
+
+    if not 0 <= trim < 0.5:
+        raise ValueError(f'A fração descartada deve estar em [0, 0.5), não {trim}')
+
+    values = np.sort(values, axis = axis)
+    n = values.shape[axis]
+    k = int(n * trim)
+    return np.take(values, np.arange(k, n - k), axis = axis).mean(axis = axis)
+
+
+def aggregate_fitness(values: NDArray, method: str = 'mean', trim: float = 0.2) -> NDArray:
+    """Agrega a aptidão de cada indivíduo em vários percursos.
+
+    :param values: Matriz (P, R) com a aptidão de cada indivíduo em cada percurso.
+    :param method: 'mean', 'min' ou 'trimmed_mean'.
+    :param trim: Fração descartada em cada extremo por 'trimmed_mean'.
+    """
+
+    values = np.asarray(values, dtype = float)
+    if method == 'mean':
+        return values.mean(axis = 1)
+    if method == 'min':
+        return values.min(axis = 1)
+    if method == 'trimmed_mean':
+        return trimmed_mean(values, trim, axis = 1)
+    raise ValueError(f"Agregação desconhecida '{method}'. Opções: {', '.join(AGGREGATIONS)}")
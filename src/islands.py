@@ -0,0 +1,198 @@
+import multiprocessing as mp
+import queue
+import numpy as np
+from numpy.typing import NDArray
+from typing import NamedTuple
+try:
+    from .main import FlappyBirdAI
+except ImportError:
+    # Executado como script: python src/main.py
+    from main import FlappyBirdAI
+
+
+MIGRATION_TOPOLOGIES = ('ring', 'full')
+
+
+class IslandStats(NamedTuple):
+    """Estatísticas de uma geração de uma ilha."""
+
+    island: int
+    generation: int
+    best_steps: int
+    best_score: int
+    mean_steps: float
+    best_steps_ever: int
+    best_score_ever: int
+
+
+class IslandResult(NamedTuple):
+    """Resultado final de uma ilha."""
+
+    island: int
+    best_steps_ever: int
+    best_score_ever: int
+    best_genome: NDArray | None
+
+
+def neighbors(island: int, num_islands: int, topology: str) -> list[int]:
+    """Retorna as ilhas que recebem os migrantes de `island`.
+
+    :param island: Índice da ilha de origem.
+    :param num_islands: Número de ilhas.
+    :param topology: 'ring' (envia para a próxima ilha) ou 'full' (envia para todas).
+    """
+
+    if topology not in MIGRATION_TOPOLOGIES:
+        raise ValueError(f"Topologia de migração desconhecida '{topology}'. Opções: {', '.join(MIGRATION_TOPOLOGIES)}")
+    if num_islands < 2:
+        return []
+    if topology == 'ring':
+        return [(island + 1) % num_islands]
+    return [i for i in range(num_islands) if i != island]
+
+
+def _run_island(
+        island: int,
+        seed: np.random.SeedSequence,
+        generations: int,
+        config: dict,
+        inboxes: list,
+        results,
+        migration_interval: int,
+        migration_size: int,
+        topology: str
+) -> None:
+    """Evolui uma ilha em um processo próprio."""
+
+    # Fluxos aleatórios independentes por ilha, inclusive para os cursos
+    ai = FlappyBirdAI(gui = False, verbose = False, config = config | {'MAX_GENERATIONS': generations, 'SEED': seed})
+    targets = neighbors(island, len(inboxes), topology)
+    sources = sum(island in neighbors(i, len(inboxes), topology) for i in range(len(inboxes)))
+
+    for generation in range(1, generations + 1):
+
+        ai.run_generation(generation)
+        steps = ai.steps
+        best = int(np.argmax(steps))
+        results.put(IslandStats(
+            island, generation, steps[best].item(), ai.scores[best].item(), float(np.mean(steps)),
+            ai.best_steps_ever, ai.best_score_ever
+        ))
+
+        # Migração: envia as elites aos vizinhos e recebe as dos que enviam para esta ilha
+        if generation < generations and generation % migration_interval == 0:
+            for target in targets:
+                inboxes[target].put([opt.emigrants(migration_size) for opt in ai.optimizers])
+            for _ in range(sources):
+                for optimizer, genomes in zip(ai.optimizers, inboxes[island].get()):
+                    optimizer.immigrate(genomes)
+
+    best_genome = ai.best_nn.genome() if ai.best_nn is not None else None
+    results.put(IslandResult(island, ai.best_steps_ever, ai.best_score_ever, best_genome))
+    ai.env.close()
+
+
+class IslandModel:
+
+    def __init__(
+            self,
+            num_islands: int = 4,
+            migration_interval: int = 5,
+            migration_size: int = 2,
+            topology: str = 'ring',
+            config: dict | None = None,
+            seed: int | None = None
+    ) -> None:
+        """Várias populações evoluindo em paralelo, uma por processo,
+        que trocam suas melhores redes a cada `migration_interval` gerações.
+
+        Cada ilha é um FlappyBirdAI sem interface gráfica com o
+        algoritmo genético ('ga') e sua própria semente.
+
+        :param num_islands: Número de ilhas (processos).
+        :param migration_interval: Gerações entre migrações.
+        :param migration_size: Número de elites enviadas a cada vizinho.
+        :param topology: 'ring' ou 'full'.
+        :param config: Parâmetros de treinamento de cada ilha (ver FlappyBirdAI).
+        :param seed: Semente de onde derivam os fluxos aleatórios das ilhas.
+        """
+
+        config = dict(config or {})
+        if config.get('OPTIMIZER', FlappyBirdAI.OPTIMIZER) != 'ga':
+            raise ValueError('O modelo de ilhas requer o otimizador genético (ga).')
+        if migration_interval < 1:
+            raise ValueError(f'migration_interval deve ser positivo, não {migration_interval}')
+        neighbors(0, num_islands, topology)
+
+        self.num_islands: int = num_islands
+        self.migration_interval: int = migration_interval
+        self.migration_size: int = migration_size
+        self.topology: str = topology
+        self.config: dict = config
+        self.seeds: list[np.random.SeedSequence] = np.random.SeedSequence(seed).spawn(num_islands)
+
+        self.history: list[IslandStats] = []
+        self.results: list[IslandResult] = []
+
+    def run(self, generations: int, verbose: bool = True) -> list[IslandResult]:
+        """Executa `generations` gerações em todas as ilhas e
+        retorna o resultado de cada uma, ordenado pela ilha.
+
+        :param generations: Número de gerações de cada ilha.
+        :param verbose: Exibe as estatísticas de cada ilha a cada geração.
+        """
+
+        ctx = mp.get_context()
+        inboxes = [ctx.Queue() for _ in range(self.num_islands)]
+        results = ctx.Queue()
+
+        processes = [
+            ctx.Process(
+                target = _run_island,
+                args = (
+                    i, self.seeds[i], generations, self.config, inboxes, results,
+                    self.migration_interval, self.migration_size, self.topology
+                ),
+                daemon = True
+            )
+            for i in range(self.num_islands)
+        ]
+        for process in processes:
+            process.start()
+
+        self.history, self.results = [], []
+        try:
+            while len(self.results) < self.num_islands:
+                try:
+                    item = results.get(timeout = 1)
+                except queue.Empty:
+                    failed = [i for i, p in enumerate(processes) if p.exitcode not in (None, 0)]
+                    if failed:
+                        raise RuntimeError(f'Ilhas {failed} terminaram com erro.')
+                    continue
+                if isinstance(item, IslandResult):
+                    self.results.append(item)
+                    continue
+                self.history.append(item)
+                if verbose:
+                    print(
+                        f"Ilha {item.island} | Geração {item.generation}/{generations} | "
+                        f"Melhor: {item.best_steps} steps, {item.best_score} pontos | "
+                        f"Média: {item.mean_steps:.1f} steps"
+                    )
+        finally:
+            for process in processes:
+                process.join(timeout = 1)
+                if process.is_alive():
+                    process.terminate()
+
+        self.results.sort(key = lambda r: r.island)
+        return self.results
+
+    @property
+    def best(self) -> IslandResult | None:
+        """Melhor resultado entre todas as ilhas."""
+        return max(self.results, key = lambda r: r.best_steps_ever, default = None)
+
+    def __repr__(self) -> str:
+        return f'IslandModel(num_islands={self.num_islands}, topology={self.topology})'
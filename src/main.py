@@ -1,11 +1,35 @@
+import argparse
 import pygame as pg
-from env import FlappyBird
-from nn import NeuralNetwork
-from nn import crossover, mutate
+try:
+    from .env import FlappyBird, VectorFlappyBird, PhaseTimer, ObservationHistory, Difficulty
+    from .nn import NeuralNetwork, PopulationPolicy
+    from .nn import Optimizer, make_optimizer, genome_size, SteadyStateEvolution, OutOfCoreGeneticOptimizer
+    from .nn import Diversity, diversity
+    from .budget import Budget
+    from .metrics import Metrics, MetricsServer, rate_collector, memory_collector
+    from .runlog import RunLog, fitness_summary
+    from .memory import MemoryProfiler, format_memory_report
+    from .profiling import GenerationProfiler, MODES as PROFILE_MODES
+    from .fitness import AGGREGATIONS, aggregate_fitness
+    from .curriculum import Curriculum
+except ImportError:
+    # Executado como script: python src/main.py
+    from env import FlappyBird, VectorFlappyBird, PhaseTimer, ObservationHistory, Difficulty
+    from nn import NeuralNetwork, PopulationPolicy
+    from nn import Optimizer, make_optimizer, genome_size, SteadyStateEvolution, OutOfCoreGeneticOptimizer
+    from nn import Diversity, diversity
+    from budget import Budget
+    from metrics import Metrics, MetricsServer, rate_collector, memory_collector
+    from runlog import RunLog, fitness_summary
+    from memory import MemoryProfiler, format_memory_report
+    from profiling import GenerationProfiler, MODES as PROFILE_MODES
+    from fitness import AGGREGATIONS, aggregate_fitness
+    from curriculum import Curriculum
 import numpy as np
 import os
 from pathlib import Path
 import pickle
+import time
 from datetime import datetime
 
 
@@ -15,92 +39,580 @@ class FlappyBirdAI:
 
     NUM_BIRDS = 100
     MAX_GENERATIONS = 50
-    MAX_TIME = 60 * 60  # 60 frames * 60 segundos = 1 minuto
+    MAX_TIME = 60 * 60  # Limite de steps por geração: 60 frames * 60 segundos = 1 minuto
     ELITE_PERCENTAGE = 0.2  # Percentual dos melhores a serem mantidos
     RANDOM_PERCENTAGE = 0.1  # Percentual de novos pássaros aleatórios
     MUTATION_RATE = 0.1  # Taxa de mutação
     MUTATION_STRENGTH = 0.2  # Força da mutação
 
-    def __init__(self) -> None:
+    # Arquiteturas da população: (tamanho das camadas, ativações).
+    # Com mais de uma, a população é dividida igualmente entre elas,
+    # cada parte evoluída por um otimizador próprio.
+    TOPOLOGIES = [
+        ((4, 16, 2), ('relu', 'sigmoid')),
+    ]
 
-        # Inicializar ambiente e redes neurais
-        self.env = FlappyBird(num_birds = FlappyBirdAI.NUM_BIRDS, gui = True)
-        self.nns = [NeuralNetwork() for _ in range(FlappyBirdAI.NUM_BIRDS)]
+    # Observações recentes vistas pelas redes (K). Com K > 1, a entrada de
+    # cada arquitetura de TOPOLOGIES passa a ser 4 × K, as K últimas
+    # observações do pássaro em ordem cronológica.
+    HISTORY_LENGTH = 1
+
+    # Ticks de física por decisão das redes (k). Com k > 1, cada ação se
+    # repete por k ticks (ou, com FLAP_ONCE, pula apenas no primeiro) e a
+    # inferência roda uma vez a cada k ticks; steps e pontuação contam ticks.
+    DECISION_INTERVAL = 1
+    FLAP_ONCE = False
+
+    # Máximo de redes por multiplicação na inferência em lote (None: toda a
+    # população de cada arquitetura de uma vez). Ver `python src/main.py --autotune`.
+    INFERENCE_BATCH_SIZE = None
+
+    # Poda no treinamento (None desativa): ao fim da geração PRUNE_GENERATION,
+    # a melhor rede de cada arquitetura é podada até a fração PRUNE_SPARSITY
+    # dos pesos de cada camada, e sua máscara passa a valer para a população:
+    # os pesos podados ficam nulos nos genomas aleatórios, filhos e mutações,
+    # e a inferência em lote deixa de calcular os neurônios sem conexões até
+    # a saída. Requer OPTIMIZER = 'ga', sem STEADY_STATE e POPULATION_PATH.
+    PRUNE_SPARSITY = None
+    PRUNE_GENERATION = 10
+
+    # Percursos avaliados por genoma a cada geração (R). Com R > 1, toda a
+    # população percorre os mesmos R percursos sorteados em uma única simulação
+    # vetorizada (sem interface gráfica) e a aptidão de cada genoma é a
+    # agregação ('mean', 'min' ou 'trimmed_mean') dos seus steps nos percursos.
+    NUM_COURSES = 1
+    FITNESS_AGGREGATION = 'mean'
+    FITNESS_TRIM = 0.2
+
+    # Currículo de dificuldade: os percursos começam com os parâmetros de
+    # CURRICULUM_EASY (abertura, distância e velocidade dos canos) e ficam mais
+    # difíceis em CURRICULUM_LEVELS níveis até o percurso padrão. O nível sobe
+    # quando a melhor pontuação da geração alcança CURRICULUM_PROMOTE_SCORE ou
+    # após CURRICULUM_PATIENCE gerações. Só pontuações no percurso padrão
+    # contam para o melhor desempenho e para TARGET_SCORE.
+    CURRICULUM = False
+    CURRICULUM_EASY = {'gap': 220, 'distance': 260, 'velocity_x': -3}
+    CURRICULUM_LEVELS = 3
+    CURRICULUM_PROMOTE_SCORE = 5
+    CURRICULUM_PATIENCE = 5
+
+    # Semente dos fluxos aleatórios (int ou np.random.SeedSequence; None sorteia).
+    # O ambiente e cada otimizador recebem um Generator independente dela.
+    SEED = None
+
+    # Otimizador: 'ga' (algoritmo genético elitista), 'es' (OpenAI-ES) ou 'cmaes'.
+    # OPTIMIZER_OPTIONS são repassados ao otimizador ('ga' usa as constantes acima).
+    OPTIMIZER = 'ga'
+    OPTIMIZER_OPTIONS = {}
+
+    # Evolução em regime permanente, sem barreira entre gerações: cada pássaro
+    # que morre (ou chega a MAX_TIME steps) é substituído na hora, no percurso
+    # em andamento, por um filho das elites do arquivo da sua arquitetura,
+    # com os parâmetros do 'ga'. Uma geração passa a ser um período de
+    # NUM_BIRDS nascimentos, com as estatísticas dos genomas avaliados nele.
+    # STEADY_ARCHIVE_SIZE: elites guardadas por arquitetura (None: ELITE_PERCENTAGE
+    # das vagas); STEADY_REEVALUATION: fração dos nascimentos que reavaliam uma elite.
+    STEADY_STATE = False
+    STEADY_ARCHIVE_SIZE = None
+    STEADY_REEVALUATION = 0.3
+
+    # População fora da memória: com POPULATION_PATH (um diretório), os genomas
+    # de cada arquitetura ficam em arquivos mapeados em memória, e os NUM_BIRDS
+    # genomas (até milhões) são avaliados em blocos de EVALUATION_CHUNK
+    # pássaros, todos nos mesmos percursos, sorteados a cada geração; seleção e
+    # cruzamento também são feitos em blocos (ver OutOfCoreGeneticOptimizer).
+    # Requer gui=False e OPTIMIZER = 'ga'. DIVERSITY_SAMPLE: genomas de cada
+    # população usados nas métricas de diversidade.
+    POPULATION_PATH = None
+    EVALUATION_CHUNK = 10_000
+    DIVERSITY_SAMPLE = 10_000
+
+    # Pontuação que encerra o treinamento ao ser alcançada (None desativa)
+    TARGET_SCORE = None
+
+    # Orçamento do treinamento (None desativa): tempo total em segundos,
+    # total de steps simulados em todas as gerações e pico de memória em MB.
+    # Ao esgotar, o treinamento termina e, com CHECKPOINT_PATH, salva um checkpoint.
+    MAX_WALL_TIME = None
+    MAX_TOTAL_STEPS = None
+    MAX_RSS_MB = None
+    CHECKPOINT_PATH = None
+    BUDGET_CHECK_INTERVAL = 256  # Steps entre verificações do orçamento dentro de uma geração
+
+    # Calcula a diversidade dos genomas de cada arquitetura a cada geração
+    DIVERSITY_METRICS = True
+
+    # Porta local do endpoint /metrics no formato do Prometheus (None desativa)
+    METRICS_PORT = None
+
+    # Mede o tempo de cada fase (inferência, step, colisões, renderização, ...)
+    # e o exibe a cada geração. Desativado, os pontos medidos custam uma comparação.
+    TIMING = False
+
+    # Log JSON-lines com um registro por geração (None desativa), rotacionado
+    # ao passar de RUN_LOG_MAX_BYTES, mantendo RUN_LOG_BACKUPS arquivos antigos
+    RUN_LOG_PATH = None
+    RUN_LOG_MAX_BYTES = 64 * 2 ** 20
+    RUN_LOG_BACKUPS = 5
+    RUN_LOG_HISTOGRAM_BINS = 16
+
+    # Relatório de memória por geração (pico de RSS, maiores locais de
+    # alocação do tracemalloc e objetos vivos), exibido e gravado no log
+    # estruturado. Deixa o treinamento mais lento: apenas para diagnóstico.
+    MEMORY_REPORT = False
+    MEMORY_REPORT_TOP = 10
+
+    # Perfilamento de uma janela de gerações: 'cprofile' (todas as chamadas)
+    # ou 'sample' (amostragem da pilha, pouco custo); None desativa. Grava
+    # PROFILE_OUTPUT.pstats/.txt e PROFILE_OUTPUT.collapsed (flame graphs).
+    PROFILE = None
+    PROFILE_START = 1
+    PROFILE_GENERATIONS = 5
+    PROFILE_OUTPUT = 'profile'
+    PROFILE_INTERVAL = 0.005
+
+    def __init__(self, gui: bool = True, verbose: bool = True, config: dict | None = None) -> None:
+        """Treinamento de redes neurais para o Flappy Bird.
+
+        :param gui: Se False, treina sem janela, eventos e limite de FPS.
+        :param verbose: Se False, não exibe estatísticas a cada geração.
+        :param config: Valores que sobrescrevem, nesta instância, as
+            constantes de treinamento da classe (ex.: {'NUM_BIRDS': 50}).
+        """
+
+        for name, value in (config or {}).items():
+            if not name.isupper() or not hasattr(FlappyBirdAI, name):
+                raise ValueError(f"Parâmetro de treinamento desconhecido '{name}'")
+            setattr(self, name, value)
+
+        if self.NUM_COURSES > 1 and gui:
+            raise ValueError('A avaliação em vários percursos (NUM_COURSES > 1) requer gui=False')
+        if self.STEADY_STATE and (self.NUM_COURSES > 1 or self.OPTIMIZER != 'ga'):
+            raise ValueError("A evolução em regime permanente requer NUM_COURSES = 1 e OPTIMIZER = 'ga'")
+        if self.POPULATION_PATH is not None and (gui or self.STEADY_STATE or self.OPTIMIZER != 'ga'):
+            raise ValueError("A população fora da memória requer gui=False e OPTIMIZER = 'ga', sem STEADY_STATE")
+        if self.PRUNE_SPARSITY is not None and (self.STEADY_STATE or self.POPULATION_PATH is not None or self.OPTIMIZER != 'ga'):
+            raise ValueError("A poda no treinamento requer OPTIMIZER = 'ga', sem STEADY_STATE e POPULATION_PATH")
+        if self.FITNESS_AGGREGATION not in AGGREGATIONS:
+            raise ValueError(f"Agregação desconhecida '{self.FITNESS_AGGREGATION}'. Opções: {', '.join(AGGREGATIONS)}")
+
+        self.gui = gui
+        self.verbose = verbose
+
+        # Pássaros simulados de uma vez: a população inteira ou um bloco dela
+        out_of_core = self.POPULATION_PATH is not None
+        birds = min(self.NUM_BIRDS, self.EVALUATION_CHUNK) if out_of_core else self.NUM_BIRDS
+
+        # Histórico de observações e tamanho de entrada das redes
+        self.history: ObservationHistory | None = None
+        if self.HISTORY_LENGTH > 1:
+            self.history = ObservationHistory(birds * self.NUM_COURSES, self.HISTORY_LENGTH)
+            self.TOPOLOGIES = [
+                ((self.history.num_features * self.HISTORY_LENGTH, *layers[1:]), activations)
+                for layers, activations in self.TOPOLOGIES
+            ]
+
+        # Fluxos aleatórios independentes do ambiente e de cada otimizador
+        self.seed_sequence: np.random.SeedSequence = (
+            self.SEED if isinstance(self.SEED, np.random.SeedSequence) else np.random.SeedSequence(self.SEED)
+        )
+        self.rng: np.random.Generator = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+
+        # Currículo de dificuldade dos percursos
+        self.curriculum: Curriculum | None = None
+        if self.CURRICULUM:
+            self.curriculum = Curriculum(
+                Difficulty(**self.CURRICULUM_EASY),
+                levels = self.CURRICULUM_LEVELS,
+                promote_score = self.CURRICULUM_PROMOTE_SCORE,
+                patience = self.CURRICULUM_PATIENCE
+            )
+        difficulty = self.curriculum.difficulty if self.curriculum is not None else None
+
+        # Inicializar ambiente e otimizadores
+        self.env: FlappyBird | VectorFlappyBird
+        if self.NUM_COURSES > 1 or out_of_core:
+            # Os percursos semeados se repetem em todos os blocos da população
+            self.env = VectorFlappyBird(
+                birds * self.NUM_COURSES, self.NUM_COURSES,
+                decision_interval = self.DECISION_INTERVAL, flap_once = self.FLAP_ONCE,
+                difficulty = difficulty
+            )
+        else:
+            self.env = FlappyBird(
+                num_birds = self.NUM_BIRDS, gui = gui,
+                decision_interval = self.DECISION_INTERVAL, flap_once = self.FLAP_ONCE,
+                rng = self.rng, difficulty = difficulty
+            )
+        self.optimizers = self.create_optimizers()
+        # Fluxo próprio das estimativas de diversidade, depois dos otimizadores
+        self.diversity_rng: np.random.Generator = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+        self.nns: list[NeuralNetwork] = []
+        self.genomes: list[np.ndarray] = []
+        self.diversity: list[Diversity] = []
+
+        # Aptidão (steps) e pontuação de cada genoma na última geração
+        self.steps: np.ndarray = np.zeros(0)
+        self.scores: np.ndarray = np.zeros(0)
+
+        # Steps do ambiente (ticks) e steps de pássaros simulados na última geração
+        self.generation_steps: int = 0
+        self.generation_bird_steps: int = 0
+
+        # Vagas da evolução em regime permanente: arquitetura, identificador,
+        # genoma e rede de cada pássaro vivo, mantidos entre as gerações
+        slots = self.NUM_BIRDS if self.STEADY_STATE else 0
+        self._policy: PopulationPolicy | None = None
+        self._states: np.ndarray | None = None
+        self._slot_topology: np.ndarray = np.repeat(
+            np.arange(len(self.optimizers)), [optimizer.population_size for optimizer in self.optimizers]
+        )[:slots]
+        self._slot_ids: np.ndarray = np.zeros(slots, dtype = np.int64)
+        self._slot_genomes: list[np.ndarray | None] = [None] * slots
+        self._slot_nns: list[NeuralNetwork | None] = [None] * slots
 
         # Inicializar melhores desempenhos e rede neural
         self.best_score_ever = 0
         self.best_steps_ever = 0
+        self.best_nn: NeuralNetwork | None = None
+        self.time_to_target: float | None = None
+
+        # Última geração concluída e orçamento do treinamento
+        self.generation = 0
+        self.budget = Budget(self.MAX_WALL_TIME, self.MAX_TOTAL_STEPS, self.MAX_RSS_MB)
+        self.stop_reason: str | None = None
+
+        # Métricas para o Prometheus
+        self.metrics: Metrics | None = None
+        self.metrics_server: MetricsServer | None = None
+        if self.METRICS_PORT is not None:
+            self.metrics = self.create_metrics()
+            self.metrics_server = MetricsServer(self.metrics, port = self.METRICS_PORT).start()
+
+        # Tempo por fase de cada geração
+        self.timer: PhaseTimer | None = None
+        self.timings: list[dict[str, float]] = []
+        if self.TIMING:
+            self.timer = PhaseTimer()
+            self.env.timer = self.timer
+
+        # Log estruturado do treinamento
+        self.run_log: RunLog | None = None
+        if self.RUN_LOG_PATH is not None:
+            self.run_log = RunLog(self.RUN_LOG_PATH, self.RUN_LOG_MAX_BYTES, self.RUN_LOG_BACKUPS)
+
+        # Relatório de memória da última geração
+        self.memory: MemoryProfiler | None = None
+        self.memory_report: dict | None = None
+        if self.MEMORY_REPORT:
+            self.memory = MemoryProfiler(self.MEMORY_REPORT_TOP).start()
+
+        # Perfilamento de uma janela de gerações
+        self.profiler: GenerationProfiler | None = None
+        if self.PROFILE is not None:
+            self.profiler = GenerationProfiler(
+                self.PROFILE, self.PROFILE_START, self.PROFILE_GENERATIONS,
+                self.PROFILE_OUTPUT, self.PROFILE_INTERVAL
+            )
 
         self._pause = False
 
     def run(self) -> None:
 
         print("-"*40)
-        print(f"Iniciando treinamento com {FlappyBirdAI.NUM_BIRDS} pássaros")
-        print(f"Elite: {FlappyBirdAI.ELITE_PERCENTAGE:0%}%, Aleatórios: {FlappyBirdAI.RANDOM_PERCENTAGE:0%}%")
-        print(f"Taxa de mutação: {FlappyBirdAI.MUTATION_RATE}, Força: {FlappyBirdAI.MUTATION_STRENGTH}")
+        print(f"Iniciando treinamento com {self.NUM_BIRDS} pássaros")
+        print(f"Elite: {self.ELITE_PERCENTAGE:0%}%, Aleatórios: {self.RANDOM_PERCENTAGE:0%}%")
+        print(f"Taxa de mutação: {self.MUTATION_RATE}, Força: {self.MUTATION_STRENGTH}")
+        print(f"Otimizadores: {', '.join(map(repr, self.optimizers))}")
 
-        generation = 1
+        generation = self.generation + 1
+        self.budget.start()
 
-        while generation <= FlappyBirdAI.MAX_GENERATIONS and self.env.steps < FlappyBirdAI.MAX_TIME:
-            print(f"\n--- Geração {generation}/{FlappyBirdAI.MAX_GENERATIONS} ---")
+        while generation <= self.MAX_GENERATIONS:
+            print(f"\n--- Geração {generation}/{self.MAX_GENERATIONS} ---")
+            if self.profiler is not None:
+                self.profiler.before_generation(generation)
             try:
                 self.run_generation(generation)
             except QuitPygame:
                 print('Ambiente fechado...')
                 break
+            finally:
+                if self.profiler is not None:
+                    self.profiler.after_generation(generation)
+
+            if self.TARGET_SCORE is not None and self.best_score_ever >= self.TARGET_SCORE:
+                self.time_to_target = self.budget.elapsed
+                print(f"Pontuação alvo {self.TARGET_SCORE} alcançada em {self.time_to_target:.1f}s")
+                break
+
+            self.stop_reason = self.budget.exhausted()
+            if self.stop_reason is not None:
+                print(f"Orçamento esgotado: {self.stop_reason}")
+                break
             generation += 1
 
         # Fim do treinamento
         print("\n--- Treinamento concluído ---")
+        print(f"Gerações: {self.generation}, steps simulados: {self.budget.steps}, tempo: {self.budget.elapsed:.1f}s")
         print(f"Melhor pontuação alcançada: {self.best_steps_ever}")
 
+        if self.CHECKPOINT_PATH is not None:
+            self.save_checkpoint(self.CHECKPOINT_PATH)
+            print(f"Checkpoint salvo em {self.CHECKPOINT_PATH}")
+
+        if self.metrics_server is not None:
+            self.metrics_server.close()
+        if self.run_log is not None:
+            self.run_log.close()
+        if self.memory is not None:
+            self.memory.stop()
+        if self.profiler is not None:
+            # Grava o perfil se a janela foi interrompida antes do fim (orçamento, alvo, janela fechada)
+            files = self.profiler.close()
+            if files:
+                print(f"Perfil salvo em {', '.join(map(str, files))}")
         self.env.close()
 
     def run_generation(self, generation: int) -> None:
 
-        self.simulate_generation()
+        timer = self.timer or PhaseTimer()
+        timer.reset()
+        t = timer.now()
+
+        # Percurso do nível atual do currículo, aplicado no reset do ambiente
+        if self.curriculum is not None:
+            self.env.difficulty = self.curriculum.difficulty
+
+        if self.STEADY_STATE:
+            # Os genomas são criados e avaliados durante a simulação
+            self.simulate_steady()
+            self.generation_steps = self.env.steps
+            t = timer.add('simulate', t)
+        elif self.POPULATION_PATH is not None:
+            # Genomas lidos dos arquivos e avaliados em blocos
+            genomes = self.genomes = [optimizer.ask() for optimizer in self.optimizers]
+            self.simulate_chunks()
+            t = timer.add('simulate', t)
+        else:
+            # Genomas a avaliar, convertidos em redes de cada arquitetura
+            genomes = self.genomes = [optimizer.ask() for optimizer in self.optimizers]
+            self.nns = [
+                NeuralNetwork.from_genome(genome, layers, activations, optimizer.mask)
+                for (layers, activations), optimizer, population in zip(self.TOPOLOGIES, self.optimizers, genomes)
+                for genome in population
+            ]
+            t = timer.add('decode', t)
+
+            self.simulate_generation()
+            self.generation_steps = self.env.steps
+            self.generation_bird_steps = int(self.bird_results()[0].sum())
+            t = timer.add('simulate', t)
+
+        self.budget.add_steps(self.generation_steps)
         self.update_stats()
+        self.generation = generation
+        t = timer.add('stats', t)
+
+        # Preparar para a próxima geração, com o número de steps como aptidão
+        steps = self.steps
+        if generation < self.MAX_GENERATIONS and not self.STEADY_STATE:
+            start = 0
+            for optimizer, population in zip(self.optimizers, genomes):
+                optimizer.tell(steps[start:start + len(population)])
+                start += len(population)
+            if generation == self.PRUNE_GENERATION and self.PRUNE_SPARSITY is not None:
+                self.prune_population()
+        timer.add('breed', t)
+
+        if self.timer is not None:
+            self.timings.append(timer.as_dict())
+            if self.verbose:
+                print(timer.report())
+
+        if self.memory is not None:
+            self.memory_report = self.memory.report()
+            if self.verbose:
+                print(format_memory_report(self.memory_report))
 
-        # Ordenar por número de steps
-        steps = [bird.steps for bird in self.env.birds]
+        if self.metrics is not None:
+            self.metrics.inc('generations_total')
+            # Somados uma vez por geração, sem percorrer os pássaros a cada decisão
+            self.metrics.inc('bird_steps_total', self.generation_bird_steps)
+            self.metrics.set('generation', generation)
+            self.metrics.set('fitness_best', float(steps.max()))
+            self.metrics.set('fitness_mean', float(steps.mean()))
+            self.metrics.set('fitness_best_ever', self.best_steps_ever)
+            self.metrics.set('score_best_ever', self.best_score_ever)
+            for phase, seconds in timer.as_dict().items():
+                self.metrics.set('phase_seconds', seconds, phase = phase)
+            if timer.totals['simulate'] > 0:
+                self.metrics.set('generation_steps_per_second', self.generation_steps / timer.totals['simulate'])
 
-        # Ordenar índices dos melhores steps, do maior para o menor
-        ordered_idx = np.argsort(steps)[::-1]
+        if self.run_log is not None:
+            self.run_log.write(self.generation_record(timer))
 
-        # Preparar para a próxima geração
-        if generation < FlappyBirdAI.MAX_GENERATIONS:
+        if self.curriculum is not None and self.curriculum.update(self.scores):
+            # Em regime permanente, o percurso só muda ao ser reiniciado
+            self._policy = None
+            if self.metrics is not None:
+                self.metrics.set('curriculum_level', self.curriculum.level)
+            if self.verbose:
+                print(f"Currículo: nível {self.curriculum.level}/{self.curriculum.levels - 1}, {self.curriculum.difficulty}")
 
-            # Calcular quantidades
-            elite_count = int(FlappyBirdAI.NUM_BIRDS * FlappyBirdAI.ELITE_PERCENTAGE)
-            random_count = int(FlappyBirdAI.NUM_BIRDS * FlappyBirdAI.RANDOM_PERCENTAGE)
-            crossover_count = FlappyBirdAI.NUM_BIRDS - elite_count - random_count
+    def generation_record(self, timer: PhaseTimer) -> dict:
+        """Registro da geração recém-avaliada para o log estruturado.
 
-            print(f"Elite: {elite_count}, Aleatórios: {random_count}, Descendentes: {crossover_count}")
+        :param timer: Timer com as fases da geração.
+        """
 
-            # Seleção de elite
-            elite_nns = [self.nns[i] for i in ordered_idx[:elite_count]]
+        steps, scores = self.steps, self.scores
+        bird_steps = self.generation_bird_steps
+        simulate = timer.totals.get('simulate', 0.0)
 
-            # Iniciar nova população repetindo os melhores
-            new_population = []
-            new_population.extend(elite_nns)
+        return {
+            'generation': self.generation,
+            'time': time.time(),
+            'birds': len(steps),
+            'courses': self.NUM_COURSES,
+            'decision_interval': self.DECISION_INTERVAL,
+            'difficulty': self.curriculum.as_dict() if self.curriculum is not None else self.env.difficulty._asdict(),
+            'steps': self.generation_steps,
+            'best_steps': steps.max().item(),
+            'mean_steps': float(steps.mean()),
+            'best_score': scores.max().item(),
+            'mean_score': float(scores.mean()),
+            'best_steps_ever': self.best_steps_ever,
+            'best_score_ever': self.best_score_ever,
+            'fitness': fitness_summary(steps, self.RUN_LOG_HISTOGRAM_BINS),
+            'optimizers': [
+                {
+                    'name': type(optimizer).__name__,
+                    'population': optimizer.population_size,
+                    'elite': getattr(optimizer, 'elite_count', None),
+                    'random': getattr(optimizer, 'random_count', None),
+                    'crossover': getattr(optimizer, 'crossover_count', None),
+                }
+                for optimizer in self.optimizers
+            ],
+            'wall_time': timer.elapsed,
+            'steps_per_second': self.generation_steps / simulate if simulate > 0 else None,
+            'bird_steps_per_second': bird_steps / simulate if simulate > 0 else None,
+            'phases': timer.as_dict(),
+        } | ({'memory': self.memory_report} if self.memory_report is not None else {})
 
-            # Adicionar alguns aleatórios para diversidade
-            new_population.extend([NeuralNetwork() for _ in range(random_count)])
+    def create_metrics(self) -> Metrics:
+        """Cria as métricas publicadas pelo endpoint do Prometheus."""
 
-            for _ in range(crossover_count):
+        metrics = Metrics()
+        metrics.describe('generations_total', 'Gerações concluídas.')
+        metrics.describe('steps_total', 'Steps do ambiente simulados.')
+        metrics.describe('bird_steps_total', 'Steps de pássaros vivos simulados, somados ao fim de cada geração.')
+        metrics.describe('decisions_total', 'Decisões (inferências da população) tomadas.')
+        metrics.describe('steps_per_second', 'Steps do ambiente por segundo desde a última coleta.')
+        metrics.describe('generation_steps_per_second', 'Steps do ambiente por segundo na última geração.')
+        metrics.describe('birds_alive', 'Pássaros vivos na geração atual.')
+        metrics.describe('fitness_best', 'Maior aptidão (steps) da última geração.')
+        metrics.describe('fitness_mean', 'Aptidão (steps) média da última geração.')
+        metrics.describe('phase_seconds', 'Duração de cada fase da última geração.')
+        metrics.describe('memory_rss_mb', 'Memória residente do processo em MB.')
+        metrics.describe('curriculum_level', 'Nível do currículo de dificuldade.')
+        metrics.add_collector(rate_collector(metrics, 'steps_total', 'steps_per_second'))
+        metrics.add_collector(memory_collector)
+        return metrics
 
-                parent1, parent2 = np.random.choice(elite_nns, 2, replace = False)
-                child = crossover(parent1, parent2)
-                mutate(child, FlappyBirdAI.MUTATION_RATE, FlappyBirdAI.MUTATION_STRENGTH)
+    def save_checkpoint(self, path: str | Path) -> None:
+        """Salva o estado dos otimizadores e o melhor desempenho em `path`."""
 
-                new_population.append(child)
+        checkpoint = {
+            'generation': self.generation,
+            'optimizers': self.optimizers,
+            'best_nn': self.best_nn,
+            'best_steps_ever': self.best_steps_ever,
+            'best_score_ever': self.best_score_ever,
+            'rng': self.rng,
+            'diversity_rng': self.diversity_rng,
+            'curriculum': self.curriculum,
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(checkpoint, f)
 
-            # Atualizar população
-            self.nns = new_population
+    def load_checkpoint(self, path: str | Path) -> None:
+        """Restaura um checkpoint salvo com `save_checkpoint`;
+        `run` continua a partir da geração seguinte."""
 
-        # Próxima geração
-        generation += 1
+        with open(path, 'rb') as f:
+            checkpoint = pickle.load(f)
+
+        self.generation = checkpoint['generation']
+        self.optimizers = checkpoint['optimizers']
+        self.best_nn = checkpoint['best_nn']
+        self.best_steps_ever = checkpoint['best_steps_ever']
+        self.best_score_ever = checkpoint['best_score_ever']
+        if checkpoint.get('curriculum') is not None:
+            self.curriculum = checkpoint['curriculum']
+        if 'rng' in checkpoint:
+            self.rng = checkpoint['rng']
+            if isinstance(self.env, FlappyBird):
+                self.env.rng = self.rng
+        if 'diversity_rng' in checkpoint:
+            self.diversity_rng = checkpoint['diversity_rng']
+
+    def create_optimizers(self) -> list[Optimizer]:
+        """Cria um otimizador para cada arquitetura de TOPOLOGIES,
+        dividindo os NUM_BIRDS pássaros igualmente entre elas."""
+
+        n = len(self.TOPOLOGIES)
+        seeds = self.seed_sequence.spawn(n)
+        sizes = [self.NUM_BIRDS // n + (i < self.NUM_BIRDS % n) for i in range(n)]
+
+        if self.STEADY_STATE:
+            return [
+                SteadyStateEvolution(
+                    genome_size(layers), size,
+                    archive_size = self.STEADY_ARCHIVE_SIZE or max(int(size * self.ELITE_PERCENTAGE), 2),
+                    random_percentage = self.RANDOM_PERCENTAGE,
+                    reevaluation = self.STEADY_REEVALUATION,
+                    mutation_rate = self.MUTATION_RATE,
+                    mutation_strength = self.MUTATION_STRENGTH,
+                    rng = np.random.default_rng(seed)
+                )
+                for (layers, _), size, seed in zip(self.TOPOLOGIES, sizes, seeds)
+            ]
+
+        options = dict(self.OPTIMIZER_OPTIONS)
+        if self.OPTIMIZER == 'ga':
+            options = {
+                'elite_percentage': self.ELITE_PERCENTAGE,
+                'random_percentage': self.RANDOM_PERCENTAGE,
+                'mutation_rate': self.MUTATION_RATE,
+                'mutation_strength': self.MUTATION_STRENGTH,
+            } | options
+
+        if self.POPULATION_PATH is not None:
+            return [
+                OutOfCoreGeneticOptimizer(
+                    genome_size(layers), size, Path(self.POPULATION_PATH) / f'topology-{i}',
+                    rng = np.random.default_rng(seed), **options
+                )
+                for i, ((layers, _), size, seed) in enumerate(zip(self.TOPOLOGIES, sizes, seeds))
+            ]
+
+        return [
+            make_optimizer(self.OPTIMIZER, genome_size(layers), size, rng = np.random.default_rng(seed), **options)
+            for (layers, _), size, seed in zip(self.TOPOLOGIES, sizes, seeds)
+        ]
+
+    def prune_population(self) -> None:
+        """Poda a melhor rede de cada arquitetura até PRUNE_SPARSITY e
+        restringe o otimizador às conexões que restaram."""
+
+        for (layers, activations), optimizer in zip(self.TOPOLOGIES, self.optimizers):
+            nn = NeuralNetwork.from_genome(optimizer.best_genome, layers, activations, optimizer.mask)
+            nn.prune(sparsity = self.PRUNE_SPARSITY)
+            optimizer.set_mask(nn.genome_mask())
+            if self.verbose:
+                print(f"Poda: {layers}, {nn.num_parameters}/{genome_size(layers)} parâmetros ativos")
 
     def run_events(self) -> None:
         """Executa eventos do pygame."""
@@ -109,6 +621,7 @@ class FlappyBirdAI:
 
             if event.type == pg.QUIT:
                 # Salvar o melhor modelo antes de sair
+                self.collect_fitness()
                 self.update_stats()
                 self.env.close()
                 raise QuitPygame
@@ -118,47 +631,478 @@ class FlappyBirdAI:
 
     def simulate_generation(self) -> None:
 
-        # Simulação da geração atual
-        states = self.env.reset()
+        # Simulação da geração atual, nos mesmos percursos para toda a população
+        courses = self.NUM_COURSES
+        if courses > 1:
+            states = self.env.reset(self.rng.integers(2 ** 31, size = courses).tolist())
+        else:
+            states = self.env.reset()
+        if self.history is not None:
+            states = self.history.reset(states)
+        policy = PopulationPolicy(self.nns, self.INFERENCE_BATCH_SIZE)
+
+        self._simulate(policy, states)
+        self.collect_fitness()
+
+    def _simulate(self, policy: PopulationPolicy, states: np.ndarray, pending_steps: int = 0) -> None:
+        """Loop principal da simulação, uma iteração por decisão das redes,
+        a partir do ambiente recém-reiniciado, até todos morrerem, MAX_TIME
+        steps ou o orçamento se esgotar.
+
+        :param policy: Política das redes, uma por pássaro (por percurso).
+        :param states: Estados iniciais (com o histórico, se houver).
+        :param pending_steps: Steps da geração ainda não somados ao orçamento.
+        """
+
+        courses = self.NUM_COURSES
+        timer = self.timer
+        decisions = 0
+        while not self.env.done:
+            if timer is not None:
+                t = timer.now()
+
+            if self.gui:
+                self.run_events()
+                if timer is not None:
+                    t = timer.add('simulate.events', t)
+
+            if self._pause:
+                continue
+
+            # Limite de steps da geração e orçamento do treinamento
+            if self.env.steps >= self.MAX_TIME or (
+                decisions % self.BUDGET_CHECK_INTERVAL == 0
+                and self.budget.exhausted(pending_steps + self.env.steps) is not None
+            ):
+                break
+            decisions += 1
+
+            # Coletar ações de todas as redes neurais, em lote por arquitetura
+            alive = self.env.alive
+            if courses > 1:
+                # (P × R, entradas) -> (P, R, entradas): os R percursos de cada rede em uma multiplicação
+                actions = policy.predict(states.reshape(len(policy), courses, -1), alive.reshape(len(policy), courses)).reshape(-1)
+            else:
+                actions = policy.predict(states, alive)
+            if timer is not None:
+                t = timer.add('simulate.inference', t)
+
+            # Executar passo na simulação (fases internas medidas pelo próprio ambiente),
+            # que avança DECISION_INTERVAL ticks de física, sem passar de MAX_TIME
+            steps = self.env.steps
+            states = self.env.step(actions, min(self.DECISION_INTERVAL, self.MAX_TIME - steps))
+
+            if self.metrics is not None:
+                self.metrics.set('birds_alive', int(alive.sum()))
+                self.metrics.inc('steps_total', self.env.steps - steps)
+                self.metrics.inc('decisions_total')
+            if self.history is not None:
+                states = self.history.push(states)
+            if timer is not None:
+                t = timer.now()
+
+            # Renderizar com informações
+            if self.gui:
+                self.env.render()
+                if timer is not None:
+                    timer.add('simulate.render', t)
+
+    def simulate_chunks(self) -> None:
+        """Simula uma geração da população fora da memória: cada bloco de
+        EVALUATION_CHUNK genomas é lido do arquivo, convertido direto em uma
+        política em lote e avaliado nos percursos da geração, sorteados uma
+        vez, de modo que a aptidão não depende da divisão em blocos. Com o
+        orçamento esgotado, os blocos restantes ficam com aptidão 0."""
+
+        courses = self.NUM_COURSES
+        seeds = self.rng.integers(2 ** 31, size = courses).tolist()
+        chunk = self.env.num_birds // courses
+        steps = np.zeros(self.NUM_BIRDS, dtype = int)
+        scores = np.zeros(self.NUM_BIRDS, dtype = int)
+        timer = self.timer
+
+        # (início na população, arquitetura, genomas, início no arquivo) de cada bloco
+        blocks, start = [], 0
+        for topology, population in zip(self.TOPOLOGIES, self.genomes):
+            blocks.extend((start + offset, topology, population, offset) for offset in range(0, len(population), chunk))
+            start += len(population)
+
+        self.generation_steps, self.generation_bird_steps = 0, 0
+        for start, (layers, activations), population, offset in blocks:
+            if self.budget.exhausted(self.generation_steps) is not None:
+                break
+            if timer is not None:
+                t = timer.now()
+
+            # O último bloco é completado com redes nulas, cujos resultados são descartados
+            genomes = np.asarray(population[offset:offset + chunk], dtype = float)
+            n = len(genomes)
+            if n < chunk:
+                genomes = np.concatenate([genomes, np.zeros((chunk - n, genomes.shape[1]))])
+            policy = PopulationPolicy.from_genomes(genomes, layers, activations, self.INFERENCE_BATCH_SIZE)
+
+            states = self.env.reset(seeds)
+            if self.history is not None:
+                states = self.history.reset(states)
+            if timer is not None:
+                timer.add('simulate.decode', t)
 
-        # Loop principal da simulação
-        while self.env.birds_alive:
-            self.run_events()
+            self._simulate(policy, states, self.generation_steps)
+            self.collect_fitness()
+            steps[start:start + n] = self.steps[:n]
+            scores[start:start + n] = self.scores[:n]
+            self.generation_steps += self.env.steps
+            self.generation_bird_steps += int(self.bird_results()[0][:n * courses].sum())
+
+        self.steps, self.scores = steps, scores
+        self.nns = []
+
+    def simulate_steady(self) -> None:
+        """Simula uma geração da evolução em regime permanente: o percurso
+        não é reiniciado e cada pássaro que morre ou chega a MAX_TIME steps
+        tem seu resultado informado ao arquivo de elites e é substituído na
+        hora por um genoma novo, até NUM_BIRDS nascimentos."""
+
+        if self._policy is None:
+            # Primeira geração (ou retomada de um checkpoint): todas as vagas recebem genomas
+            states = self.env.reset()
+            slots = np.arange(self.NUM_BIRDS)
+            self._spawn(slots)
+            self._policy = PopulationPolicy(self._slot_nns, self.INFERENCE_BATCH_SIZE)
+            self._states = self.history.reset(states) if self.history is not None else states
+
+        # Os steps do ambiente contam os ticks desta geração (orçamento, métricas e log)
+        self.env.steps = 0
+        self.nns = self._slot_nns
+        states = self._states
+        bird_steps = self.bird_results()[0]
+        steps_start = int(bird_steps.sum())
+        finished_steps, finished_scores, finished_nns = [], [], []
+
+        # Steps do pássaro mais antigo, que limita cada intervalo de decisão a MAX_TIME
+        oldest = int(bird_steps.max(initial = 0))
+
+        timer = self.timer
+        births, decisions = 0, 0
+        while births < self.NUM_BIRDS:
+            if timer is not None:
+                t = timer.now()
+
+            if self.gui:
+                self.run_events()
+                if timer is not None:
+                    t = timer.add('simulate.events', t)
 
             if self._pause:
                 continue
 
-            # Coletar ações de todas as redes neurais
-            actions = []
-            for nn, state, bird in zip(self.nns, states, self.env.birds):
-                if bird.is_alive:
-                    actions.append(nn.predict(state.reshape(-1, 1)))
-                else:
-                    actions.append(0)
+            # Orçamento do treinamento
+            if decisions % self.BUDGET_CHECK_INTERVAL == 0 and self.budget.exhausted(self.env.steps) is not None:
+                break
+            decisions += 1
+
+            actions = self._policy.predict(states)
+            if timer is not None:
+                t = timer.add('simulate.inference', t)
+
+            steps = self.env.steps
+            states = self.env.step(actions, min(self.DECISION_INTERVAL, self.MAX_TIME - oldest))
+            if self.metrics is not None:
+                self.metrics.set('birds_alive', self.NUM_BIRDS)
+                self.metrics.inc('steps_total', self.env.steps - steps)
+                self.metrics.inc('decisions_total')
+            if self.history is not None:
+                states = self.history.push(states)
+            if timer is not None:
+                t = timer.now()
 
-            # Executar passo na simulação
-            states = self.env.step(actions)
+            # Resultados dos pássaros que terminaram e substituição por genomas novos
+            bird_steps, bird_scores = self.bird_results()
+            finished = ~self.env.alive | (bird_steps >= self.MAX_TIME)
+            oldest = int(bird_steps.max(initial = 0, where = ~finished))
+            done = np.flatnonzero(finished)
+            if len(done):
+                for topology, optimizer in enumerate(self.optimizers):
+                    rows = done[self._slot_topology[done] == topology]
+                    if len(rows):
+                        genomes = np.stack([self._slot_genomes[i] for i in rows])
+                        optimizer.report(self._slot_ids[rows], genomes, bird_steps[rows])
+                finished_steps.append(bird_steps[done])
+                finished_scores.append(bird_scores[done])
+                finished_nns.extend(self._slot_nns[i] for i in done)
+
+                births += len(done)
+                self._policy.replace(done, self._spawn(done))
+                states = self.env.respawn(done)
+                if self.history is not None:
+                    states = self.history.reset_rows(done, states)
+                if timer is not None:
+                    t = timer.add('simulate.breed', t)
 
             # Renderizar com informações
-            self.env.render()
+            if self.gui:
+                self.env.render()
+                if timer is not None:
+                    timer.add('simulate.render', t)
+
+        # Steps de pássaros da geração: os dos que terminaram e o avanço dos que seguem vivos
+        self._states = states
+        self.generation_bird_steps = sum(int(s.sum()) for s in finished_steps) + int(self.bird_results()[0].sum()) - steps_start
+        if finished_nns:
+            self.steps, self.scores = np.concatenate(finished_steps), np.concatenate(finished_scores)
+            self.nns = finished_nns
+        else:
+            # Orçamento esgotado antes de algum pássaro terminar: resultados parciais
+            self.collect_fitness()
+            self.nns = list(self._slot_nns)
+        self.genomes = [optimizer.genomes for optimizer in self.optimizers]
+
+    def _spawn(self, slots: np.ndarray) -> list[NeuralNetwork]:
+        """Cria genomas novos para as vagas `slots`, com o otimizador da
+        arquitetura de cada vaga, e retorna suas redes na ordem de `slots`."""
+
+        for topology, ((layers, activations), optimizer) in enumerate(zip(self.TOPOLOGIES, self.optimizers)):
+            rows = slots[self._slot_topology[slots] == topology]
+            if not len(rows):
+                continue
+            ids, genomes = optimizer.spawn(len(rows))
+            self._slot_ids[rows] = ids
+            for i, genome in zip(rows, genomes):
+                self._slot_genomes[i] = genome
+                self._slot_nns[i] = NeuralNetwork.from_genome(genome, layers, activations)
+        return [self._slot_nns[i] for i in slots]
+
+    def bird_results(self) -> tuple[np.ndarray, np.ndarray]:
+        """Retorna os steps e a pontuação de cada pássaro do ambiente."""
+
+        if isinstance(self.env, VectorFlappyBird):
+            return self.env.bird_steps, self.env.bird_scores
+
+        birds = self.env.birds
+        steps = np.fromiter((bird.steps for bird in birds), dtype = int, count = len(birds))
+        scores = np.fromiter((bird.score for bird in birds), dtype = int, count = len(birds))
+        return steps, scores
+
+    def collect_fitness(self) -> None:
+        """Calcula a aptidão e a pontuação de cada genoma, agregando os percursos."""
+
+        steps, scores = self.bird_results()
+        if self.NUM_COURSES > 1:
+            shape = (-1, self.NUM_COURSES)
+            steps = aggregate_fitness(steps.reshape(shape), self.FITNESS_AGGREGATION, self.FITNESS_TRIM)
+            scores = aggregate_fitness(scores.reshape(shape), self.FITNESS_AGGREGATION, self.FITNESS_TRIM)
+        self.steps, self.scores = steps, scores
+
+    def network(self, index: int) -> NeuralNetwork:
+        """Rede do genoma `index` da última geração avaliada."""
+
+        if self.POPULATION_PATH is None:
+            return self.nns[index]
+
+        # Fora da memória, apenas a rede pedida é criada, a partir do arquivo
+        for (layers, activations), population in zip(self.TOPOLOGIES, self.genomes):
+            if index < len(population):
+                return NeuralNetwork.from_genome(np.asarray(population[index], dtype = float), layers, activations)
+            index -= len(population)
+        raise IndexError(f'Genoma {index} fora da população')
 
     def update_stats(self) -> None:
 
         # Avaliar desempenho
-        scores = [bird.score for bird in self.env.birds]
-        steps = [bird.steps for bird in self.env.birds]
+        scores = self.scores
+        steps = self.steps
         best_index = np.argmax(steps)
 
-        # Atualizar melhor de todos os tempos
-        if steps[best_index] > self.best_steps_ever:
-            self.best_steps_ever = steps[best_index]
-            self.best_score_ever = scores[best_index]
+        # Atualizar melhor de todos os tempos, apenas no percurso padrão
+        standard = self.curriculum is None or self.curriculum.final
+        if standard and steps[best_index] > self.best_steps_ever:
+            self.best_steps_ever = steps[best_index].item()
+            self.best_score_ever = scores[best_index].item()
+            self.best_nn = self.network(best_index)
+
+        # Diversidade dos genomas de cada arquitetura (de uma amostra, fora da memória)
+        if self.DIVERSITY_METRICS:
+            populations = self.genomes
+            if self.POPULATION_PATH is not None:
+                populations = [p[::max(len(p) // self.DIVERSITY_SAMPLE, 1)] for p in populations]
+            self.diversity = [diversity(population, rng = self.diversity_rng) for population in populations]
 
         # Exibir estatísticas
-        print(f"Melhor pontuação: {scores[best_index]}")
-        print(f"Melhor pontuação de todos os tempos: {self.best_score_ever}")
+        if self.verbose:
+            print(f"Melhor pontuação: {scores[best_index]:g}")
+            print(f"Melhor pontuação de todos os tempos: {self.best_score_ever}")
+            for stats in self.diversity:
+                print(stats)
+
+
+def main(argv: list[str] | None = None) -> None:
+
+    parser = argparse.ArgumentParser(prog = 'flappy-neural', description = 'Treina redes neurais para jogar Flappy Bird.')
+    parser.add_argument('--headless', action = 'store_true', help = 'treina sem interface gráfica')
+    parser.add_argument('--generations', type = int, default = FlappyBirdAI.MAX_GENERATIONS, help = 'número máximo de gerações')
+    parser.add_argument('--seed', type = int, default = None, help = 'semente aleatória')
+    parser.add_argument('--config', default = None, metavar = 'ARQUIVO', help = 'parâmetros de treinamento em JSON (ex.: gerado por --autotune)')
+
+    islands = parser.add_argument_group('modelo de ilhas')
+    islands.add_argument('--islands', type = int, default = 0, help = 'número de ilhas em processos paralelos (0 desativa)')
+    islands.add_argument('--migration-interval', type = int, default = 5, help = 'gerações entre migrações')
+    islands.add_argument('--migration-size', type = int, default = 2, help = 'elites enviadas a cada vizinho')
+    islands.add_argument('--migration-topology', choices = ('ring', 'full'), default = 'ring')
+
+    sweep = parser.add_argument_group('busca de hiperparâmetros')
+    sweep.add_argument('--sweep', default = None, help = 'especificação da busca em JSON (ver sweep.load_spec)')
+    sweep.add_argument('--workers', type = int, default = None, help = 'treinamentos simultâneos (padrão: número de CPUs)')
+    sweep.add_argument('--output', default = 'sweep.csv', help = 'arquivo CSV com os resultados da busca')
+
+    autotune = parser.add_argument_group('calibração')
+    autotune.add_argument('--autotune', default = None, metavar = 'ARQUIVO', help = 'calibra pássaros, lote e processos e grava a configuração recomendada')
+    autotune.add_argument('--autotune-seconds', type = float, default = 1.5, help = 'duração de cada calibração em segundos')
+
+    budget = parser.add_argument_group('orçamento')
+    budget.add_argument('--max-wall-time', type = float, default = None, help = 'tempo total em segundos')
+    budget.add_argument('--max-steps', type = int, default = None, help = 'total de steps simulados')
+    budget.add_argument('--generation-steps', type = int, default = FlappyBirdAI.MAX_TIME, help = 'limite de steps por geração')
+    budget.add_argument('--max-rss-mb', type = float, default = None, help = 'pico de memória residente em MB')
+    budget.add_argument('--checkpoint', default = None, help = 'arquivo do checkpoint salvo ao final')
+    budget.add_argument('--resume', default = None, help = 'continua a partir de um checkpoint')
+
+    population = parser.add_argument_group('população fora da memória')
+    population.add_argument('--population-path', default = None, metavar = 'DIRETÓRIO', help = 'guarda os genomas em arquivos mapeados em memória e avalia a população em blocos')
+    population.add_argument('--evaluation-chunk', type = int, default = FlappyBirdAI.EVALUATION_CHUNK, help = 'pássaros simulados por bloco')
+
+    parser.add_argument('--history', type = int, default = 1, metavar = 'K', help = 'número de observações recentes vistas pelas redes')
+    parser.add_argument('--courses', type = int, default = 1, metavar = 'R', help = 'percursos avaliados por genoma a cada geração')
+    parser.add_argument('--decision-interval', type = int, default = 1, metavar = 'K', help = 'ticks de física por decisão das redes')
+    parser.add_argument('--flap-once', action = 'store_true', help = 'com --decision-interval, pula apenas no primeiro tick')
+    parser.add_argument('--curriculum', action = 'store_true', help = 'começa com percursos fáceis e aumenta a dificuldade até o padrão')
+    parser.add_argument('--prune-sparsity', type = float, default = None, metavar = 'S', help = 'fração dos pesos podados durante o treinamento')
+    parser.add_argument('--prune-generation', type = int, default = FlappyBirdAI.PRUNE_GENERATION, help = 'geração ao fim da qual a população é podada')
+    parser.add_argument('--steady-state', action = 'store_true', help = 'substitui cada pássaro que morre sem esperar o fim da geração')
+    parser.add_argument('--aggregation', choices = AGGREGATIONS, default = FlappyBirdAI.FITNESS_AGGREGATION, help = 'agregação da aptidão nos percursos')
+    parser.add_argument('--timing', action = 'store_true', help = 'mede e exibe o tempo de cada fase por geração')
+    parser.add_argument('--memory-report', action = 'store_true', help = 'relatório de memória e alocações por geração (mais lento)')
+    profile = parser.add_argument_group('perfilamento')
+    profile.add_argument('--profile', choices = PROFILE_MODES, default = None, help = 'perfila uma janela de gerações')
+    profile.add_argument('--profile-start', type = int, default = FlappyBirdAI.PROFILE_START, help = 'primeira geração perfilada')
+    profile.add_argument('--profile-generations', type = int, default = FlappyBirdAI.PROFILE_GENERATIONS, help = 'gerações perfiladas')
+    profile.add_argument('--profile-output', default = FlappyBirdAI.PROFILE_OUTPUT, help = 'prefixo dos arquivos do perfil')
+    profile.add_argument('--profile-interval', type = float, default = FlappyBirdAI.PROFILE_INTERVAL, help = 'intervalo de amostragem em segundos (sample)')
+
+    parser.add_argument('--run-log', default = None, metavar = 'ARQUIVO', help = 'log JSON-lines com um registro por geração')
+    parser.add_argument('--metrics-port', type = int, default = None, help = 'porta do endpoint /metrics (Prometheus)')
+
+    args = parser.parse_args(argv)
+    # Opções dadas explicitamente na linha de comando: um segundo parse sem valores padrão
+    missing = object()
+    parser.set_defaults(**dict.fromkeys(vars(args), missing))
+    explicit = {name for name, value in vars(parser.parse_args(argv)).items() if value is not missing}
+
+    options = {
+        'MAX_GENERATIONS': 'generations',
+        'MAX_TIME': 'generation_steps',
+        'MAX_WALL_TIME': 'max_wall_time',
+        'MAX_TOTAL_STEPS': 'max_steps',
+        'MAX_RSS_MB': 'max_rss_mb',
+        'CHECKPOINT_PATH': 'checkpoint',
+        'METRICS_PORT': 'metrics_port',
+        'HISTORY_LENGTH': 'history',
+        'NUM_COURSES': 'courses',
+        'DECISION_INTERVAL': 'decision_interval',
+        'FLAP_ONCE': 'flap_once',
+        'CURRICULUM': 'curriculum',
+        'STEADY_STATE': 'steady_state',
+        'PRUNE_SPARSITY': 'prune_sparsity',
+        'PRUNE_GENERATION': 'prune_generation',
+        'POPULATION_PATH': 'population_path',
+        'EVALUATION_CHUNK': 'evaluation_chunk',
+        'FITNESS_AGGREGATION': 'aggregation',
+        'TIMING': 'timing',
+        'RUN_LOG_PATH': 'run_log',
+        'MEMORY_REPORT': 'memory_report',
+        'PROFILE': 'profile',
+        'PROFILE_START': 'profile_start',
+        'PROFILE_GENERATIONS': 'profile_generations',
+        'PROFILE_OUTPUT': 'profile_output',
+        'PROFILE_INTERVAL': 'profile_interval',
+    }
+    # Opções dadas na linha de comando, que prevalecem sobre o arquivo de configuração
+    overrides = {name: getattr(args, dest) for name, dest in options.items() if dest in explicit}
+
+    workers = args.workers
+    if args.config is not None:
+        try:
+            from .autotune import load_config
+        except ImportError:
+            from autotune import load_config
+
+        loaded, recommended_workers = load_config(args.config)
+        overrides = loaded | overrides
+        workers = workers or recommended_workers
+    config = {name: getattr(args, dest) for name, dest in options.items()} | overrides
+
+    # Saídas e portas de um único processo, que ilhas e execuções da busca não podem compartilhar
+    shared = [f'--{options[name].replace("_", "-")}' for name in (
+        'CHECKPOINT_PATH', 'RUN_LOG_PATH', 'METRICS_PORT', 'PROFILE', 'POPULATION_PATH'
+    ) if overrides.get(name) is not None] + (['--resume'] if args.resume is not None else [])
+
+    if args.autotune is not None:
+        try:
+            from .autotune import autotune, save_config
+        except ImportError:
+            from autotune import autotune, save_config
+
+        recommendation = autotune(config, args.autotune_seconds, max_workers = workers)
+        save_config(recommendation, args.autotune)
+        print(f"Configuração salva em {args.autotune}; use --config {args.autotune}")
+        return
+
+    if args.sweep is not None:
+        try:
+            from .sweep import load_spec, spec_configs, run_sweep
+        except ImportError:
+            from sweep import load_spec, spec_configs, run_sweep
+
+        if shared:
+            parser.error(f"{', '.join(shared)} não pode ser usado com --sweep")
+        configs = spec_configs(load_spec(args.sweep))
+        run_sweep([overrides | c for c in configs], args.output, workers, seed = args.seed or 0)
+        return
+
+    if args.islands:
+        if shared:
+            parser.error(f"{', '.join(shared)} não pode ser usado com --islands")
+        try:
+            from .islands import IslandModel
+        except ImportError:
+            from islands import IslandModel
+
+        model = IslandModel(
+            num_islands = args.islands,
+            migration_interval = args.migration_interval,
+            migration_size = args.migration_size,
+            topology = args.migration_topology,
+            config = config,
+            seed = args.seed
+        )
+        model.run(config['MAX_GENERATIONS'])
+        best = model.best
+        print(f"\nMelhor ilha: {best.island}, {best.best_steps_ever} steps, {best.best_score_ever} pontos")
+        return
+
+    if not args.headless:
+        # Modos que simulam vários percursos ou blocos de uma vez não têm interface gráfica
+        if config['NUM_COURSES'] > 1:
+            parser.error('--courses maior que 1 requer --headless')
+        if config['POPULATION_PATH'] is not None:
+            parser.error('--population-path requer --headless')
+
+    config['SEED'] = args.seed
+    ai = FlappyBirdAI(gui = not args.headless, config = config)
+    if args.resume is not None:
+        ai.load_checkpoint(args.resume)
+    ai.run()
 
 
 if __name__ == '__main__':
-    FlappyBirdAI().run()
+    main()
     
\ No newline at end of file
@@ -0,0 +1,156 @@
+import gc
+import tracemalloc
+import numpy as np
+try:
+    from .env import Bird, Pipe
+    from .nn import NeuralNetwork
+    from .budget import peak_rss_mb, current_rss_mb
+except ImportError:
+    # Executado como script: python src/main.py
+    from env import Bird, Pipe
+    from nn import NeuralNetwork
+    from budget import peak_rss_mb, current_rss_mb
+
+
+# Classes contadas em `live_objects`, além de np.ndarray
+TRACKED_TYPES: dict[str, type] = {
+    'Bird': Bird,
+    'Pipe': Pipe,
+    'NeuralNetwork': NeuralNetwork,
+}
+
+# Alocações do próprio tracemalloc e do mecanismo de importação não são reportadas
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+def live_objects(types: dict[str, type] = TRACKED_TYPES) -> dict[str, float]:
+    """Conta os objetos vivos de cada classe em `types` e os np.ndarray.
+
+    Arrays não são rastreados pelo coletor de lixo: são contados os
+    referenciados por objetos rastreados (listas, dicionários, atributos)
+    e suas bases, o que cobre os arrays guardados pelo programa.
+    """
+
+    gc.collect()
+    objects = gc.get_objects()
+    counts: dict[str, float] = {name: 0 for name in types}
+    for obj in objects:
+        for name, cls in types.items():
+            if isinstance(obj, cls):
+                counts[name] += 1
+
+    arrays = {id(obj): obj for obj in gc.get_referents(*objects) if isinstance(obj, np.ndarray)}
+    pending = list(arrays.values())
+    while pending:
+        base = pending.pop().base
+        if isinstance(base, np.ndarray) and id(base) not in arrays:
+            arrays[id(base)] = base
+            pending.append(base)
+    del objects, pending
+
+    counts['ndarray'] = len(arrays)
+    # Apenas arrays donos dos dados, para não contar vistas duas vezes
+    counts['ndarray_mb'] = sum(a.nbytes for a in arrays.values() if a.base is None) / 2 ** 20
+    return counts
+
+
+class MemoryProfiler:
+
+    def __init__(self, top: int = 10, frames: int = 1) -> None:
+        """Relatório de memória por geração: pico de memória residente,
+        locais com mais memória alocada (tracemalloc), o crescimento desde o
+        relatório anterior e a contagem de objetos vivos.
+
+        O tracemalloc deixa a execução várias vezes mais lenta; use apenas
+        para investigar o consumo de memória.
+
+        :param top: Número de locais de alocação reportados.
+        :param frames: Profundidade da pilha guardada em cada alocação.
+        """
+
+        self.top: int = top
+        self.frames: int = frames
+        self._started: bool = False
+        self._previous: tracemalloc.Snapshot | None = None
+
+    def start(self) -> 'MemoryProfiler':
+        """Inicia o tracemalloc, se ainda não estiver ativo."""
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+        tracemalloc.reset_peak()
+        self._previous = None
+        return self
+
+    def stop(self) -> None:
+        """Encerra o tracemalloc, se iniciado por este objeto."""
+
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+        self._previous = None
+
+    def report(self) -> dict:
+        """Retorna o relatório desde o último `report` (ou `start`) e
+        reinicia o pico de memória rastreada."""
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        traced, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        report = {
+            'peak_rss_mb': peak_rss_mb(),
+            'rss_mb': current_rss_mb(),
+            'traced_mb': traced / 2 ** 20,
+            'traced_peak_mb': traced_peak / 2 ** 20,
+            'top': [
+                {'site': _site(stat.traceback), 'kb': stat.size / 1024, 'count': stat.count}
+                for stat in snapshot.statistics('lineno')[:self.top]
+            ],
+            'growth': [],
+            'objects': live_objects(),
+        }
+        if self._previous is not None:
+            report['growth'] = [
+                {'site': _site(stat.traceback), 'kb': stat.size_diff / 1024, 'count': stat.count_diff}
+                for stat in snapshot.compare_to(self._previous, 'lineno')[:self.top]
+                if stat.size_diff
+            ]
+        self._previous = snapshot
+        return report
+
+    def __repr__(self) -> str:
+        return f'MemoryProfiler(top={self.top}, frames={self.frames})'
+
+
+def _site(traceback: tracemalloc.Traceback) -> str:
+    frame = traceback[0]
+    return f'{frame.filename}:{frame.lineno}'
+
+
+def format_memory_report(report: dict, top: int = 5) -> str:
+    """Resumo legível de um relatório de `MemoryProfiler.report`."""
+
+    objects = report['objects']
+    lines = [
+        f"Memória: RSS {report['rss_mb'] or 0:.1f} MB (pico {report['peak_rss_mb'] or 0:.1f} MB), "
+        f"rastreada {report['traced_mb']:.1f} MB (pico {report['traced_peak_mb']:.1f} MB)",
+        'Objetos vivos: ' + ', '.join(
+            f'{name} {value:.1f}' if isinstance(value, float) else f'{name} {value}'
+            for name, value in objects.items()
+        ),
+    ]
+    if report['top']:
+        lines.append('Maiores alocações:')
+        lines.extend(f"  {row['kb']:>10.1f} KB {row['count']:>8} {row['site']}" for row in report['top'][:top])
+    if report['growth']:
+        lines.append('Crescimento desde a geração anterior:')
+        lines.extend(f"  {row['kb']:>+10.1f} KB {row['count']:>+8} {row['site']}" for row in report['growth'][:top])
+    return '\n'.join(lines)
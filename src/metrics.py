@@ -0,0 +1,171 @@
+import numbers
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Self
+try:
+    from .budget import current_rss_mb
+except ImportError:
+    # Executado como script: python src/main.py
+    from budget import current_rss_mb
+
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Metrics:
+
+    def __init__(self, prefix: str = 'flappy') -> None:
+        """Contadores e medidores no formato de texto do Prometheus.
+
+        As atualizações são atribuições simples em dicionários, atômicas
+        sob o GIL: o loop de simulação nunca espera por locks, e quem lê
+        (o servidor HTTP) apenas copia os valores no momento da coleta.
+
+        :param prefix: Prefixo do nome de todas as métricas.
+        """
+
+        self.prefix: str = prefix
+        self._counters: dict[tuple[str, Labels], float] = {}
+        self._gauges: dict[tuple[str, Labels], float] = {}
+        self._help: dict[str, str] = {}
+        self._collectors: list[Callable[[], dict[str, float]]] = []
+
+    def describe(self, name: str, help: str) -> None:
+        """Define o texto de ajuda (# HELP) de uma métrica."""
+        self._help[name] = help
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """Incrementa um contador."""
+
+        key = (name, tuple(sorted(labels.items())))
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels: str) -> None:
+        """Define o valor de um medidor."""
+        self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def get(self, name: str, **labels: str) -> float | None:
+        """Retorna o valor atual de um contador ou medidor."""
+
+        key = (name, tuple(sorted(labels.items())))
+        return self._counters.get(key, self._gauges.get(key))
+
+    def add_collector(self, collector: Callable[[], dict[str, float]]) -> None:
+        """Registra uma função chamada a cada coleta, que retorna medidores calculados na hora."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Retorna todas as métricas no formato de texto do Prometheus."""
+
+        gauges = dict(self._gauges)
+        for collector in self._collectors:
+            for name, value in collector().items():
+                gauges[(name, ())] = value
+
+        lines = []
+        for kind, values in (('counter', dict(self._counters)), ('gauge', gauges)):
+            names = sorted({name for name, _ in values})
+            for name in names:
+                full_name = f'{self.prefix}_{name}'
+                if name in self._help:
+                    lines.append(f'# HELP {full_name} {self._help[name]}')
+                lines.append(f'# TYPE {full_name} {kind}')
+                for (metric, labels), value in sorted(values.items()):
+                    if metric != name or value is None:
+                        continue
+                    label_text = ','.join(f'{k}="{v}"' for k, v in labels)
+                    text = format_value(value)
+                    lines.append(f'{full_name}{{{label_text}}} {text}' if labels else f'{full_name} {text}')
+
+        return '\n'.join(lines) + '\n'
+
+    def __repr__(self) -> str:
+        return f'Metrics(prefix={self.prefix!r}, counters={len(self._counters)}, gauges={len(self._gauges)})'
+
+
+def format_value(value: float) -> str:
+    """Valor de uma amostra sem perda de precisão: inteiros com todos os
+    dígitos (contadores grandes não podem ser arredondados, ou `rate()` vê
+    o contador parado) e floats com a representação exata mais curta."""
+
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    return repr(float(value))
+
+
+def rate_collector(metrics: Metrics, counter: str, gauge: str) -> Callable[[], dict[str, float]]:
+    """Cria um coletor que publica em `gauge` a taxa por segundo
+    de `counter` desde a coleta anterior."""
+
+    last = [time.perf_counter(), metrics.get(counter) or 0]
+
+    def collect() -> dict[str, float]:
+        now, value = time.perf_counter(), metrics.get(counter) or 0
+        elapsed = now - last[0]
+        rate = (value - last[1]) / elapsed if elapsed > 0 else 0.0
+        last[:] = now, value
+        return {gauge: rate}
+
+    return collect
+
+
+def memory_collector() -> dict[str, float]:
+    """Coletor da memória residente atual, em MB."""
+
+    rss = current_rss_mb()
+    return {} if rss is None else {'memory_rss_mb': rss}
+
+
+class MetricsServer:
+
+    def __init__(self, metrics: Metrics, host: str = '127.0.0.1', port: int = 9100) -> None:
+        """Servidor HTTP local que expõe `metrics` em /metrics,
+        em uma thread em segundo plano.
+
+        :param metrics: Métricas publicadas.
+        :param host: Endereço de escuta.
+        :param port: Porta de escuta (0 escolhe uma porta livre).
+        """
+
+        self.metrics: Metrics = metrics
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(handler) -> None:
+                if handler.path.split('?')[0] != '/metrics':
+                    handler.send_error(404)
+                    return
+                body = metrics.render().encode()
+                handler.send_response(200)
+                handler.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                handler.send_header('Content-Length', str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, *args) -> None:
+                # Sem log de cada coleta no stderr
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target = self._server.serve_forever, name = 'metrics-server', daemon = True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> Self:
+        """Inicia o servidor e retorna a própria instância."""
+
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Encerra o servidor."""
+
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __repr__(self) -> str:
+        return f'MetricsServer(port={self.port})'
@@ -1,9 +1,33 @@
-from .nn import NeuralNetwork
-from .genetic import crossover, mutate
+from .nn import NeuralNetwork, genome_size
+from .genetic import crossover, mutate, crossover_genomes, mutate_genomes
+from .table import TablePolicy, compile_table
+from .batch import PopulationPolicy, active_neurons
+from .diversity import Diversity, diversity
+from .optim import Optimizer, GeneticOptimizer, EvolutionStrategy, CMAES, make_optimizer
+from .steady import SteadyStateEvolution
+from .store import GenomeStore, OutOfCoreGeneticOptimizer, top_k
 
 
 __all__ = [
     "NeuralNetwork",
+    "genome_size",
     "crossover",
-    "mutate"
+    "mutate",
+    "crossover_genomes",
+    "mutate_genomes",
+    "TablePolicy",
+    "compile_table",
+    "PopulationPolicy",
+    "active_neurons",
+    "Optimizer",
+    "GeneticOptimizer",
+    "EvolutionStrategy",
+    "CMAES",
+    "make_optimizer",
+    "SteadyStateEvolution",
+    "GenomeStore",
+    "OutOfCoreGeneticOptimizer",
+    "top_k",
+    "Diversity",
+    "diversity"
 ]
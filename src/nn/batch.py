@@ -0,0 +1,252 @@
+import numpy as np
+from numpy.typing import NDArray
+from typing import Self
+from .nn import NeuralNetwork, ACTIVATIONS, Topology, genome_size
+
+
+def active_neurons(masks: list[NDArray]) -> list[NDArray]:
+    """Índices dos neurônios da entrada e de cada camada oculta que alcançam
+    a saída por conexões ativas. Os demais não alteram as ações e podem ser
+    removidos das multiplicações, com as linhas e colunas dos seus pesos.
+
+    :param masks: Máscaras booleanas (saída, entrada) das conexões de cada camada.
+    """
+
+    keep = np.arange(masks[-1].shape[0])
+    neurons = []
+    for mask in reversed(masks):
+        keep = np.flatnonzero(mask[keep].any(axis = 0))
+        neurons.append(keep)
+    return neurons[::-1]
+
+
+class _TopologyGroup:
+
+    def __init__(
+            self,
+            topology: Topology,
+            indices: list[int] | NDArray,
+            weights: list[NDArray],
+            bias: list[NDArray],
+            neurons: list[NDArray] | None = None
+    ) -> None:
+        """Parâmetros empilhados das redes de mesma arquitetura.
+
+        :param topology: Arquitetura comum às redes.
+        :param indices: Posição de cada rede na população.
+        :param weights: Pesos (G, saída, entrada) de cada camada, na ordem de `indices`.
+        :param bias: Bias (G, saída, 1) de cada camada.
+        :param neurons: Neurônios mantidos da entrada e de cada camada oculta
+            (ver `active_neurons`), já aplicados a `weights` e `bias`. None: todos.
+        """
+
+        self.topology: Topology = topology
+        self.indices: NDArray = np.asarray(indices, dtype = np.intp)
+        self.weights: list[NDArray] = weights
+        self.bias: list[NDArray] = bias
+        self.neurons: list[NDArray] | None = neurons
+        self.functions = [ACTIVATIONS[name] for name in topology[1]]
+
+    def compact(self, weights: list[NDArray], bias: list[NDArray]) -> tuple[list[NDArray], list[NDArray]]:
+        """Seleciona, nos pesos e bias de uma rede (ou de redes empilhadas
+        no primeiro eixo), as linhas e colunas dos neurônios mantidos."""
+
+        if self.neurons is None:
+            return weights, bias
+        rows = self.neurons[1:] + [slice(None)]
+        return (
+            [w[..., r, :][..., c] for w, r, c in zip(weights, rows, self.neurons)],
+            [b[..., r, :] for b, r in zip(bias, rows)]
+        )
+
+    def predict(self, states: NDArray, rows: NDArray | None = None, batch_size: int | None = None) -> NDArray:
+        """Retorna as ações das redes do grupo.
+
+        :param states: Matriz (G', R, entradas) com R estados de cada rede avaliada.
+        :param rows: Posições (no grupo) das redes avaliadas. None para todas.
+        :param batch_size: Redes por multiplicação. None avalia todas de uma vez.
+        """
+
+        if batch_size is None or len(states) <= batch_size:
+            return self._forward(states, rows)
+        return np.concatenate([
+            self._forward(states[i:i + batch_size], slice(i, i + batch_size) if rows is None else rows[i:i + batch_size])
+            for i in range(0, len(states), batch_size)
+        ])
+
+    def _forward(self, states: NDArray, rows: NDArray | slice | None) -> NDArray:
+
+        # Os R estados de cada rede são as colunas de uma única multiplicação
+        if self.neurons is not None:
+            states = states[..., self.neurons[0]]
+        a = states.transpose(0, 2, 1)
+        for weights, bias, f in zip(self.weights, self.bias, self.functions):
+            if rows is not None:
+                weights, bias = weights[rows], bias[rows]
+            a = f(np.matmul(weights, a) + bias)
+        return a.argmax(axis = 1)
+
+
+class PopulationPolicy:
+
+    def __init__(self, nns: list[NeuralNetwork], batch_size: int | None = None) -> None:
+        """Inferência em lote de uma população de redes.
+
+        As redes são agrupadas por arquitetura e cada grupo é
+        avaliado com multiplicações de matrizes em lote, de modo
+        que o custo em Python cresce com o número de arquiteturas,
+        não com o número de redes.
+
+        Os parâmetros são copiados na construção: crie uma nova
+        instância sempre que a população mudar.
+
+        Em arquiteturas com redes podadas, os neurônios que não alcançam a
+        saída por nenhuma conexão ativa, em nenhuma rede do grupo (ver
+        `active_neurons`), são removidos das matrizes empilhadas, de modo
+        que a inferência multiplica matrizes menores.
+
+        :param nns: População de redes neurais.
+        :param batch_size: Máximo de redes por multiplicação. Lotes menores
+            limitam os arrays intermediários, o que pode aproveitar melhor a
+            cache com populações grandes. None avalia cada arquitetura de uma vez.
+        """
+
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f'O tamanho do lote deve ser ao menos 1, não {batch_size}')
+
+        self.size: int = len(nns)
+        self.batch_size: int | None = batch_size
+
+        indices: dict[Topology, list[int]] = {}
+        for i, nn in enumerate(nns):
+            indices.setdefault(nn.topology, []).append(i)
+
+        # (G, saída, entrada) e (G, saída, 1) por camada
+        groups = []
+        for topology, idx in indices.items():
+            group = _TopologyGroup(topology, idx, [], [])
+            pruned = [nns[i].masks for i in idx if nns[i].masks is not None]
+            if len(pruned) == len(idx):
+                # Conexões ativas em alguma rede do grupo
+                group.neurons = active_neurons([np.logical_or.reduce(layer) for layer in zip(*pruned)])
+            compacted = [group.compact(nns[i].weights, nns[i].bias) for i in idx]
+            group.weights = [np.stack(layer) for layer in zip(*(weights for weights, _ in compacted))]
+            group.bias = [np.stack(layer) for layer in zip(*(bias for _, bias in compacted))]
+            groups.append(group)
+        self._set_groups(groups)
+
+    @classmethod
+    def from_genomes(
+            cls,
+            genomes: NDArray,
+            layers: tuple[int, ...],
+            activations: tuple[str, ...],
+            batch_size: int | None = None,
+            mask: NDArray | None = None
+    ) -> Self:
+        """Cria a política de uma população de mesma arquitetura direto da
+        matriz de genomas (ver `NeuralNetwork.genome`), sem criar as redes,
+        como em blocos de populações grandes demais para uma lista de redes.
+
+        :param genomes: Matriz (N, genes), um genoma por linha.
+        :param layers: Tamanho de cada camada.
+        :param activations: Ativação de cada camada após a entrada.
+        :param batch_size: Ver `PopulationPolicy`.
+        :param mask: Máscara booleana dos genes ativos, comum a todos os
+            genomas (ver `NeuralNetwork.genome_mask`). None para redes densas.
+        """
+
+        genomes = np.asarray(genomes, dtype = float)
+        if genomes.ndim != 2 or genomes.shape[1] != genome_size(layers):
+            raise ValueError(f'Genomas de forma {genomes.shape} incompatíveis com as camadas {layers}.')
+
+        n = len(genomes)
+        weights, bias, masks = [], [], []
+        start = 0
+        for n_in, n_out in zip(layers[:-1], layers[1:]):
+            weights.append(genomes[:, start:start + n_out * n_in].reshape(n, n_out, n_in))
+            if mask is not None:
+                masks.append(mask[start:start + n_out * n_in].reshape(n_out, n_in))
+            start += n_out * n_in
+            bias.append(genomes[:, start:start + n_out].reshape(n, n_out, 1))
+            start += n_out
+
+        group = _TopologyGroup((tuple(layers), tuple(activations)), np.arange(n), [], [])
+        if mask is not None:
+            group.neurons = active_neurons(masks)
+        group.weights, group.bias = group.compact(weights, bias)
+
+        policy = cls([], batch_size)
+        policy.size = n
+        policy._set_groups([group])
+        return policy
+
+    def _set_groups(self, groups: list[_TopologyGroup]) -> None:
+
+        self.groups: list[_TopologyGroup] = groups
+
+        # Grupo e posição no grupo de cada rede, para `replace`
+        self._group: NDArray = np.empty(self.size, dtype = np.intp)
+        self._row: NDArray = np.empty(self.size, dtype = np.intp)
+        for g, group in enumerate(self.groups):
+            self._group[group.indices] = g
+            self._row[group.indices] = np.arange(len(group.indices))
+
+    def replace(self, indices: list[int] | NDArray, nns: list[NeuralNetwork]) -> None:
+        """Substitui as redes nas posições `indices` por `nns`, copiando seus
+        parâmetros, sem reconstruir os grupos.
+
+        :param indices: Posições na população.
+        :param nns: Novas redes, cada uma com a arquitetura da rede que substitui
+            e, em grupos de redes podadas, sem conexões fora das do grupo.
+        """
+
+        for i, nn in zip(indices, nns):
+            group = self.groups[self._group[i]]
+            if nn.topology != group.topology:
+                raise ValueError(f'A rede {i} deve ter a arquitetura {group.topology}, não {nn.topology}')
+            row = self._row[i]
+            for weights, bias, w, b in zip(group.weights, group.bias, *group.compact(nn.weights, nn.bias)):
+                weights[row] = w
+                bias[row] = b
+
+    def predict(self, states: NDArray, alive: NDArray | None = None) -> NDArray:
+        """Retorna a ação de cada rede da população.
+
+        :param states: Matriz (N, entradas) com o estado de cada rede, ou
+            (N, R, entradas) com R estados de cada rede (ex.: um por percurso).
+        :param alive: Máscara booleana (N,) ou (N, R). Redes sem nenhum estado
+            na máscara não são avaliadas, e estados fora dela recebem a ação 0.
+        """
+
+        if len(states) != self.size:
+            raise ValueError(f'O número de estados deve ser igual ao tamanho da população. {len(states)} != {self.size}')
+
+        single = states.ndim == 2
+        if single:
+            states = states[:, None, :]
+            alive = None if alive is None else alive[:, None]
+
+        actions = np.zeros(states.shape[:2], dtype = np.intp)
+        for group in self.groups:
+
+            if alive is None:
+                actions[group.indices] = group.predict(states[group.indices], batch_size = self.batch_size)
+                continue
+
+            rows = np.flatnonzero(alive[group.indices].any(axis = 1))
+            if len(rows) == len(group.indices):
+                actions[group.indices] = group.predict(states[group.indices], batch_size = self.batch_size)
+            elif len(rows):
+                idx = group.indices[rows]
+                actions[idx] = group.predict(states[idx], rows, self.batch_size)
+
+        if alive is not None:
+            actions[~alive] = 0
+        return actions[:, 0] if single else actions
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f'PopulationPolicy(size={self.size}, groups={len(self.groups)}, batch_size={self.batch_size})'
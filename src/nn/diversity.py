@@ -0,0 +1,132 @@
+import numpy as np
+from numpy.typing import NDArray
+from typing import NamedTuple
+
+
+# Até EXACT_LIMIT genomas a distância média entre pares é exata (O(n²));
+# acima disso é estimada em PAIR_SAMPLES pares sorteados, após projetar os
+# genomas em PROJECTION_DIMS dimensões quando forem maiores que isso.
+EXACT_LIMIT: int = 2000
+PAIR_SAMPLES: int = 100_000
+PROJECTION_DIMS: int = 64
+
+# Linhas por bloco no cálculo exato, para limitar a memória
+_CHUNK_SIZE: int = 512
+
+
+class Diversity(NamedTuple):
+    """Estatísticas de diversidade de uma matriz de genomas."""
+
+    mean_distance: float        # Distância euclidiana média entre pares
+    rms_distance: float         # Raiz da distância quadrática média entre pares (exata)
+    mean_gene_variance: float   # Média da variância de cada gene
+    gene_variance: NDArray      # Variância de cada gene
+    duplicates: int             # Genomas idênticos a algum genoma anterior
+    exact: bool                 # Se mean_distance é exata ou estimada
+
+    def __str__(self) -> str:
+        return (
+            f"Diversidade: distância média {self.mean_distance:.4f}{'' if self.exact else ' (aprox.)'}, "
+            f"variância média por gene {self.mean_gene_variance:.4f}, duplicados {self.duplicates}"
+        )
+
+
+def mean_pairwise_distance(genomes: NDArray) -> float:
+    """Distância euclidiana média exata entre todos os pares de genomas."""
+
+    n = len(genomes)
+    if n < 2:
+        return 0.0
+
+    sq_norms = np.einsum('ij,ij->i', genomes, genomes)
+    total = 0.0
+    for start in range(0, n, _CHUNK_SIZE):
+        block = genomes[start:start + _CHUNK_SIZE]
+        sq = sq_norms[start:start + _CHUNK_SIZE, None] + sq_norms[None] - 2 * block @ genomes.T
+        total += np.sqrt(np.maximum(sq, 0)).sum()
+
+    # Cada par aparece duas vezes e a diagonal é zero
+    return float(total / (n * (n - 1)))
+
+
+def estimate_pairwise_distance(
+        genomes: NDArray,
+        samples: int = PAIR_SAMPLES,
+        projection_dims: int = PROJECTION_DIMS,
+        rng: np.random.Generator | None = None
+) -> float:
+    """Estima a distância euclidiana média entre pares de genomas
+    sorteando pares, em uma projeção aleatória gaussiana (Johnson-Lindenstrauss)
+    quando os genomas têm mais de `projection_dims` genes.
+
+    :param genomes: Matriz (N, genes).
+    :param samples: Número de pares sorteados.
+    :param projection_dims: Dimensão da projeção.
+    :param rng: Gerador aleatório.
+    """
+
+    n, dim = genomes.shape
+    if n < 2:
+        return 0.0
+
+    rng = rng or np.random.default_rng()
+    if dim > projection_dims:
+        projection = rng.standard_normal((dim, projection_dims)) / np.sqrt(projection_dims)
+        genomes = genomes @ projection
+
+    # Pares de índices distintos
+    i = rng.integers(n, size = samples)
+    j = (i + rng.integers(1, n, size = samples)) % n
+    return float(np.linalg.norm(genomes[i] - genomes[j], axis = 1).mean())
+
+
+def count_duplicates(genomes: NDArray, rng: np.random.Generator | None = None) -> int:
+    """Conta os genomas idênticos a algum outro genoma anterior.
+
+    As linhas são primeiro resumidas por uma projeção aleatória; apenas
+    as que colidem nela são comparadas byte a byte.
+    """
+
+    if len(genomes) < 2:
+        return 0
+
+    rng = rng or np.random.default_rng()
+    keys = genomes @ rng.standard_normal(genomes.shape[1])
+    _, inverse, counts = np.unique(keys, return_inverse = True, return_counts = True)
+    candidates = np.ascontiguousarray(genomes[counts[inverse] > 1])
+    if not len(candidates):
+        return 0
+
+    rows = candidates.view(np.dtype((np.void, candidates.dtype.itemsize * candidates.shape[1]))).ravel()
+    return len(rows) - len(np.unique(rows))
+
+
+def diversity(
+        genomes: NDArray,
+        exact_limit: int = EXACT_LIMIT,
+        rng: np.random.Generator | None = None
+) -> Diversity:
+    """Calcula as estatísticas de diversidade de uma população.
+
+    :param genomes: Matriz (N, genes), um genoma por linha.
+    :param exact_limit: Maior população com distância média exata.
+    :param rng: Gerador aleatório das estimativas.
+    """
+
+    genomes = np.asarray(genomes, dtype = float)
+    n = len(genomes)
+
+    gene_variance = genomes.var(axis = 0)
+    rms = float(np.sqrt(2 * n / (n - 1) * gene_variance.sum())) if n > 1 else 0.0
+
+    exact = n <= exact_limit
+    mean_distance = mean_pairwise_distance(genomes) if exact else estimate_pairwise_distance(genomes, rng = rng)
+
+    return Diversity(
+        mean_distance = mean_distance,
+        rms_distance = rms,
+        mean_gene_variance = float(gene_variance.mean()),
+        gene_variance = gene_variance,
+        duplicates = count_duplicates(genomes, rng),
+        exact = exact
+    )
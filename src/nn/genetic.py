@@ -1,40 +1,131 @@
 import numpy as np
-import random
-from .nn import NeuralNetwork
+from numpy.typing import NDArray
+from .nn import NeuralNetwork, genome_size
 
 
-def crossover(nn1: NeuralNetwork, nn2: NeuralNetwork) -> NeuralNetwork:
+def crossover(nn1: NeuralNetwork, nn2: NeuralNetwork, rng: np.random.Generator | None = None) -> NeuralNetwork:
+    """Cruza duas redes de mesma arquitetura, sorteando de qual pai vem cada
+    peso e bias em um único bloco de números aleatórios.
+
+    :param rng: Gerador aleatório. Padrão: o gerador global do numpy.
+    """
+
+    if nn1.topology != nn2.topology:
+        raise ValueError(f'Não é possível cruzar redes de arquiteturas diferentes: {nn1.topology} != {nn2.topology}')
+
+    # Redes densas equivalem a máscaras totalmente ativas
+    masks1 = nn1.masks or [np.ones(w.shape, dtype = bool) for w in nn1.weights]
+    masks2 = nn2.masks or [np.ones(w.shape, dtype = bool) for w in nn2.weights]
+    sparse = nn1.masks is not None or nn2.masks is not None
+
+    # Pai de cada parâmetro, consumido camada a camada
+    inherit = (rng or np.random).random(genome_size(nn1.layers)) < 0.5
+    offset = 0
 
     child_weights = []
     child_bias = []
-    for w1, b1, w2, b2 in zip(nn1.weights, nn1.bias, nn2.weights, nn2.bias):
+    child_masks = []
+    for w1, b1, m1, w2, b2, m2 in zip(nn1.weights, nn1.bias, masks1, nn2.weights, nn2.bias, masks2):
 
-        # Cruzamento dos pesos
-        mask = np.random.random(w1.shape) < 0.5
+        # Cruzamento dos pesos, herdando a conexão do mesmo pai do peso
+        mask = inherit[offset:offset + w1.size].reshape(w1.shape)
+        offset += w1.size
         child_weights.append(np.where(mask, w1, w2))
+        child_masks.append(np.where(mask, m1, m2))
 
         # Cruzamento dos bias
-        mask = np.random.random(b1.shape) < 0.5
+        mask = inherit[offset:offset + b1.size].reshape(b1.shape)
+        offset += b1.size
         child_bias.append(np.where(mask, b1, b2))
 
-    return NeuralNetwork(child_weights, child_bias)
+    return NeuralNetwork(
+        child_weights,
+        child_bias,
+        activations = nn1.activations,
+        masks = child_masks if sparse else None
+    )
+
 
+def mutate(nn: NeuralNetwork, rate: float = 0.05, strength: float = 0.1, rng: np.random.Generator | None = None) -> None:
+    """Muta a rede in-place com probabilidade `rate`, sorteando os
+    parâmetros mutados e as mutações em blocos únicos.
 
-def mutate(nn: NeuralNetwork, rate: float = 0.05, strength: float = 0.1) -> None:
+    :param rng: Gerador aleatório. Padrão: o gerador global do numpy.
+    """
 
-    if random.random() > rate:
+    rng = rng or np.random
+    if rng.random() > rate:
         return
 
-    for weights, bias in zip(nn.weights, nn.bias):
+    # Parâmetros que sofrerão mutação e as mutações, consumidos camada a camada
+    size = genome_size(nn.layers)
+    selected = rng.random(size) < rate
+    mutations = rng.normal(0, strength, size)
+    offset = 0
 
-        # Máscara para indicar quais pesos sofrerão mutação
-        mask = np.random.random(weights.shape) < rate
+    masks = nn.masks or [None] * len(nn.weights)
+    for weights, bias, connected in zip(nn.weights, nn.bias, masks):
+
+        # Máscara para indicar quais pesos sofrerão mutação.
+        # Conexões podadas nunca sofrem mutação.
+        block = slice(offset, offset + weights.size)
+        offset += weights.size
+        mask = selected[block].reshape(weights.shape)
+        if connected is not None:
+            mask &= connected
 
         # Mutações para cada peso
-        mutations = np.random.normal(0, strength, weights.shape)
-        weights[mask] += mutations[mask]
+        weights[mask] += mutations[block].reshape(weights.shape)[mask]
 
         # Mutações para cada bias
-        mask = np.random.random(bias.shape) < rate
-        mutations = np.random.normal(0, strength, bias.shape)
-        bias[mask] += mutations[mask]
+        block = slice(offset, offset + bias.size)
+        offset += bias.size
+        mask = selected[block].reshape(bias.shape)
+        bias[mask] += mutations[block].reshape(bias.shape)[mask]
+
+
+def crossover_genomes(parents1: NDArray, parents2: NDArray, rng: np.random.Generator | None = None) -> NDArray:
+    """Versão vetorizada de `crossover` para matrizes de genomas. Genes
+    podados (nulos nos dois pais, ver `mutate_genomes`) continuam nulos.
+
+    :param parents1: Matriz (N, genes) com o primeiro pai de cada filho.
+    :param parents2: Matriz (N, genes) com o segundo pai de cada filho.
+    :param rng: Gerador aleatório. Padrão: o gerador global do numpy.
+    """
+
+    # Cada gene vem de um dos pais com a mesma probabilidade
+    mask = (rng or np.random).random(parents1.shape) < 0.5
+    return np.where(mask, parents1, parents2)
+
+
+def mutate_genomes(
+        genomes: NDArray,
+        rate: float = 0.05,
+        strength: float = 0.1,
+        rng: np.random.Generator | None = None,
+        active: NDArray | None = None
+) -> None:
+    """Versão vetorizada de `mutate` para matrizes de genomas, in-place.
+
+    :param genomes: Matriz (N, genes).
+    :param rate: Probabilidade de um genoma sofrer mutação e, nos
+        genomas escolhidos, de cada gene sofrer mutação.
+    :param strength: Desvio padrão das mutações.
+    :param rng: Gerador aleatório. Padrão: o gerador global do numpy.
+    :param active: Máscara booleana (genes,) dos genes ativos (ver
+        `NeuralNetwork.genome_mask`). Genes podados nunca sofrem mutação.
+    """
+
+    rng = rng or np.random
+
+    # Genomas que sofrerão mutação
+    rows = np.flatnonzero(rng.random(len(genomes)) < rate)
+    if not len(rows):
+        return
+
+    selected = genomes[rows]
+    mask = rng.random(selected.shape) < rate
+    if active is not None:
+        mask &= active
+    selected[mask] += rng.normal(0, strength, int(mask.sum()))
+    genomes[rows] = selected
@@ -1,6 +1,6 @@
 import numpy as np
 from numpy.typing import NDArray
-from typing import Literal
+from typing import Callable, Literal, Self
 
 
 def ReLu(x: NDArray) -> NDArray:
@@ -11,28 +11,299 @@ def sigmoid(x: NDArray) -> NDArray:
     return 1 / (1 + np.exp(-x))
 
 
+def tanh(x: NDArray) -> NDArray:
+    return np.tanh(x)
+
+
+def linear(x: NDArray) -> NDArray:
+    return x
+
+
+ACTIVATIONS: dict[str, Callable[[NDArray], NDArray]] = {
+    'relu': ReLu,
+    'sigmoid': sigmoid,
+    'tanh': tanh,
+    'linear': linear
+}
+
+Topology = tuple[tuple[int, ...], tuple[str, ...]]
+
+# Camadas com pelo menos SPARSE_MIN_WEIGHTS pesos e densidade de no máximo
+# SPARSE_MAX_DENSITY são avaliadas pelo caminho esparso. Abaixo disso a
+# multiplicação densa do numpy é mais rápida, mesmo com muitos zeros.
+SPARSE_MIN_WEIGHTS: int = 1 << 16
+SPARSE_MAX_DENSITY: float = 0.05
+
+
+def genome_size(layers: tuple[int, ...]) -> int:
+    """Número de parâmetros (pesos e bias) de uma rede densa com essas camadas."""
+    return sum(n_out * (n_in + 1) for n_in, n_out in zip(layers[:-1], layers[1:]))
+
+
+class _SparseLayer:
+
+    def __init__(self, mask: NDArray) -> None:
+        """Índices das conexões ativas de uma camada, ordenadas por linha (CSR).
+
+        Apenas a conectividade é guardada: os valores são lidos dos pesos
+        a cada multiplicação, então mutações que preservam a máscara não
+        invalidam a camada.
+
+        :param mask: Máscara booleana (saída, entrada) das conexões ativas.
+        """
+
+        self.shape: tuple[int, int] = mask.shape
+        self.flat: NDArray = np.flatnonzero(mask)
+        rows, self.cols = np.divmod(self.flat, mask.shape[1])
+
+        counts = np.bincount(rows, minlength = mask.shape[0])
+        self.rows: NDArray = np.flatnonzero(counts)
+        self.starts: NDArray = (np.cumsum(counts) - counts)[self.rows]
+
+    def matmul(self, weights: NDArray, a: NDArray) -> NDArray:
+        """Equivalente a `weights @ a` considerando apenas as conexões ativas."""
+
+        out = np.zeros((self.shape[0], a.shape[1]))
+        if len(self.flat):
+            products = weights.ravel()[self.flat, None] * a[self.cols]
+            out[self.rows] = np.add.reduceat(products, self.starts, axis = 0)
+        return out
+
+
 class NeuralNetwork:
 
-    def __init__(self, weights: list[NDArray] | None = None, bias: list[NDArray] | None = None) -> None:
-        """Rede neural para o jogo Flappy Bird."""
+    LAYERS: tuple[int, ...] = (4, 16, 2)
+    ACTIVATIONS: tuple[str, ...] = ('relu', 'sigmoid')
+
+    def __init__(
+            self,
+            weights: list[NDArray] | None = None,
+            bias: list[NDArray] | None = None,
+            layers: tuple[int, ...] | None = None,
+            activations: tuple[str, ...] | None = None,
+            masks: list[NDArray] | None = None,
+            rng: np.random.Generator | None = None
+    ) -> None:
+        """Rede neural para o jogo Flappy Bird.
+
+        :param weights: Pesos de cada camada. Se None, são gerados aleatoriamente.
+        :param bias: Bias de cada camada.
+        :param layers: Tamanho de cada camada, da entrada à saída. Ignorado se `weights` for dado.
+        :param activations: Nome da ativação de cada camada após a entrada.
+            Padrão: 'relu' nas camadas ocultas e 'sigmoid' na saída.
+        :param masks: Máscaras booleanas das conexões ativas de cada camada.
+            None para uma rede densa.
+        :param rng: Gerador dos pesos iniciais. Padrão: o gerador global do numpy.
+        """
 
         if weights is not None:
             self.weights = weights
             self.bias = bias
-            return
+        else:
+            if layers is None:
+                layers = NeuralNetwork.LAYERS
+                activations = activations or NeuralNetwork.ACTIVATIONS
+            if len(layers) < 2:
+                raise ValueError('A rede precisa de ao menos duas camadas (entrada e saída).')
+
+            rng = rng or np.random
+            self.weights = [
+                rng.uniform(-0.5, 0.5, (n_out, n_in))
+                for n_in, n_out in zip(layers[:-1], layers[1:])
+            ]
+            self.bias = [
+                rng.uniform(-0.5, 0.5, (n_out, 1))
+                for n_out in layers[1:]
+            ]
+
+        if activations is None:
+            activations = ('relu',) * (len(self.weights) - 1) + ('sigmoid',)
+        activations = tuple(activations)
+        if len(activations) != len(self.weights):
+            raise ValueError(f'Número de ativações ({len(activations)}) diferente do número de camadas ({len(self.weights)}).')
+        for name in activations:
+            if name not in ACTIVATIONS:
+                raise ValueError(f"Ativação desconhecida '{name}'. Opções: {', '.join(ACTIVATIONS)}")
+
+        self.activations: tuple[str, ...] = activations
+        self._functions = [ACTIVATIONS[name] for name in activations]
+
+        self.masks: list[NDArray] | None = None
+        self._sparse: list[_SparseLayer | None] = [None] * len(self.weights)
+        if masks is not None:
+            self._set_masks(masks)
+
+    @classmethod
+    def from_genome(
+            cls,
+            genome: NDArray,
+            layers: tuple[int, ...] | None = None,
+            activations: tuple[str, ...] | None = None,
+            mask: NDArray | None = None
+    ) -> Self:
+        """Cria uma rede a partir de um genoma gerado por `genome`.
+
+        :param genome: Vetor com os pesos e bias de cada camada, em sequência.
+        :param layers: Tamanho de cada camada. Padrão: NeuralNetwork.LAYERS.
+        :param activations: Ativações de cada camada.
+        :param mask: Máscara booleana dos genes ativos (ver `genome_mask`).
+            None para uma rede densa.
+        """
+
+        if layers is None:
+            layers = NeuralNetwork.LAYERS
+            activations = activations or NeuralNetwork.ACTIVATIONS
+        if len(genome) != genome_size(layers):
+            raise ValueError(f'Genoma de tamanho {len(genome)} incompatível com as camadas {layers}.')
 
-        self.weights = [
-            np.random.uniform(-0.5, 0.5, (16, 4)),
-            np.random.uniform(-0.5, 0.5, (2, 16))
-        ]
-        self.bias = [
-            np.random.uniform(-0.5, 0.5, (16, 1)),
-            np.random.uniform(-0.5, 0.5, (2, 1))
-        ]
+        weights, bias, masks = [], [], []
+        start = 0
+        for n_in, n_out in zip(layers[:-1], layers[1:]):
+            weights.append(genome[start:start + n_out * n_in].reshape(n_out, n_in).copy())
+            if mask is not None:
+                masks.append(mask[start:start + n_out * n_in].reshape(n_out, n_in))
+            start += n_out * n_in
+            bias.append(genome[start:start + n_out].reshape(n_out, 1).copy())
+            start += n_out
+
+        return cls(weights, bias, activations = activations, masks = masks if mask is not None else None)
+
+    def genome(self) -> NDArray:
+        """Retorna os pesos e bias de cada camada, em sequência, como um vetor
+        (pesos podados aparecem como zeros; a conectividade vem de `genome_mask`)."""
+        return np.concatenate([p.ravel() for w, b in zip(self.weights, self.bias) for p in (w, b)])
+
+    def genome_mask(self) -> NDArray:
+        """Retorna a máscara booleana dos genes ativos, na ordem de `genome`:
+        os pesos não podados e todos os bias."""
+
+        masks = self.masks or [np.ones(w.shape, dtype = bool) for w in self.weights]
+        return np.concatenate([
+            p.ravel() for m, b in zip(masks, self.bias) for p in (m, np.ones(b.shape, dtype = bool))
+        ])
+
+    @property
+    def layers(self) -> tuple[int, ...]:
+        """Tamanho de cada camada, da entrada à saída."""
+        return (self.weights[0].shape[1],) + tuple(w.shape[0] for w in self.weights)
+
+    @property
+    def topology(self) -> Topology:
+        """Chave que identifica a arquitetura (camadas e ativações) da rede."""
+        return self.layers, self.activations
+
+    @property
+    def density(self) -> float:
+        """Fração dos pesos que estão ativos."""
+
+        total = sum(w.size for w in self.weights)
+        if self.masks is None:
+            return 1.0
+        return sum(int(m.sum()) for m in self.masks) / total
+
+    @property
+    def num_parameters(self) -> int:
+        """Número de parâmetros ativos (pesos não podados e bias)."""
+
+        biases = sum(b.size for b in self.bias)
+        if self.masks is None:
+            return sum(w.size for w in self.weights) + biases
+        return sum(int(m.sum()) for m in self.masks) + biases
+
+    def prune(self, threshold: float | None = None, sparsity: float | None = None) -> None:
+        """Poda os pesos de menor magnitude. Pesos podados são zerados
+        e permanecem desconectados em cruzamentos e mutações. No
+        treinamento, a máscara de uma população vem de `genome_mask`
+        (ver GeneticOptimizer.set_mask).
+
+        :param threshold: Remove os pesos com magnitude menor que `threshold`.
+        :param sparsity: Remove, em cada camada, os pesos de menor magnitude
+            até que essa fração dos pesos esteja podada.
+        """
+
+        if (threshold is None) == (sparsity is None):
+            raise ValueError('Informe exatamente um entre threshold e sparsity.')
+        if sparsity is not None and not 0 <= sparsity <= 1:
+            raise ValueError(f'sparsity deve estar entre 0 e 1, não {sparsity}')
+
+        masks = self.masks or [np.ones(w.shape, dtype = bool) for w in self.weights]
+        new_masks = []
+        for weights, mask in zip(self.weights, masks):
+
+            magnitude = np.where(mask, np.abs(weights), -1.0)
+            if threshold is not None:
+                new_mask = magnitude >= threshold
+            else:
+                n_pruned = int(round(sparsity * weights.size))
+                new_mask = np.ones(weights.shape, dtype = bool)
+                if n_pruned:
+                    smallest = np.argpartition(magnitude, n_pruned - 1, axis = None)[:n_pruned]
+                    new_mask.flat[smallest] = False
+                new_mask &= mask
+
+            new_masks.append(new_mask)
+
+        self._set_masks(new_masks)
 
     def predict(self, a: NDArray) -> Literal[0, 1]:
 
-        for weights, bias in zip(self.weights[:-1], self.bias[:-1]):
-            a = ReLu(weights @ a + bias)
-        a = sigmoid(self.weights[-1] @ a + self.bias[-1])
+        for weights, bias, f, sparse in zip(self.weights, self.bias, self._functions, self._sparse):
+            z = weights @ a if sparse is None else sparse.matmul(weights, a)
+            a = f(z + bias)
         return a.argmax()
+
+    def predict_batch(self, states: NDArray) -> NDArray:
+        """Retorna a ação para cada linha de `states`.
+
+        :param states: Matriz (N, entradas) com um estado por linha.
+        """
+
+        a = states.T
+        for weights, bias, f, sparse in zip(self.weights, self.bias, self._functions, self._sparse):
+            z = weights @ a if sparse is None else sparse.matmul(weights, a)
+            a = f(z + bias)
+        return a.argmax(axis = 0)
+
+    def _set_masks(self, masks: list[NDArray]) -> None:
+        """Define as máscaras, zera os pesos desconectados e
+        prepara o caminho esparso das camadas elegíveis."""
+
+        if len(masks) != len(self.weights):
+            raise ValueError(f'Número de máscaras ({len(masks)}) diferente do número de camadas ({len(self.weights)}).')
+
+        self.masks = [np.asarray(m, dtype = bool) for m in masks]
+        self._sparse = []
+        for weights, mask in zip(self.weights, self.masks):
+            if mask.shape != weights.shape:
+                raise ValueError(f'Máscara {mask.shape} incompatível com os pesos {weights.shape}.')
+            weights[~mask] = 0
+            eligible = mask.size >= SPARSE_MIN_WEIGHTS and mask.mean() <= SPARSE_MAX_DENSITY
+            self._sparse.append(_SparseLayer(mask) if eligible else None)
+
+    def __getstate__(self) -> dict:
+        """Serializa apenas os pesos ativos de redes podadas."""
+
+        state = {'bias': self.bias, 'activations': self.activations}
+        if self.masks is None:
+            state['weights'] = self.weights
+        else:
+            state['shapes'] = [w.shape for w in self.weights]
+            state['weights'] = [w[m] for w, m in zip(self.weights, self.masks)]
+            state['masks'] = [np.packbits(m, axis = None) for m in self.masks]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+
+        weights, masks = state['weights'], None
+        if 'masks' in state:
+            masks, weights = [], []
+            for shape, values, bits in zip(state['shapes'], state['weights'], state['masks']):
+                mask = np.unpackbits(bits, count = int(np.prod(shape))).astype(bool).reshape(shape)
+                layer = np.zeros(shape)
+                layer[mask] = values
+                masks.append(mask)
+                weights.append(layer)
+        self.__init__(weights, state['bias'], activations = state['activations'], masks = masks)
+
+    def __repr__(self) -> str:
+        return f'NeuralNetwork(layers={self.layers}, activations={self.activations}, density={self.density:.2f})'
@@ -0,0 +1,347 @@
+import numpy as np
+from numpy.typing import NDArray
+from .genetic import crossover_genomes, mutate_genomes
+
+
+class Optimizer:
+
+    def __init__(self, dim: int, population_size: int, rng: np.random.Generator | None = None) -> None:
+        """Interface ask/tell de otimização sobre uma matriz de genomas.
+
+        A cada geração, `ask` retorna a matriz (population_size, dim) de
+        genomas a serem avaliados e `tell` recebe a aptidão de cada linha
+        (maior é melhor).
+
+        :param dim: Número de genes de cada genoma.
+        :param population_size: Número de genomas por geração.
+        :param rng: Gerador aleatório próprio do otimizador. Padrão: um
+            gerador semeado a partir do gerador global do numpy.
+        """
+
+        if population_size < 2:
+            raise ValueError(f'A população deve ter ao menos 2 genomas, não {population_size}')
+
+        self.dim: int = dim
+        self.population_size: int = population_size
+        self.generation: int = 0
+        self.rng: np.random.Generator = rng if rng is not None else np.random.default_rng(np.random.randint(2 ** 32))
+
+        self.best_genome: NDArray | None = None
+        self.best_fitness: float = -np.inf
+
+        # Genes ativos (ver GeneticOptimizer.set_mask); None: todos
+        self.mask: NDArray | None = None
+
+    def ask(self) -> NDArray:
+        """Retorna a matriz (population_size, dim) de genomas a avaliar."""
+        raise NotImplementedError
+
+    def tell(self, fitness: NDArray) -> None:
+        """Atualiza o otimizador com a aptidão dos genomas do último `ask`."""
+        raise NotImplementedError
+
+    def _check_fitness(self, genomes: NDArray, fitness: NDArray) -> NDArray:
+        """Valida `fitness` e atualiza o melhor genoma já avaliado."""
+
+        fitness = np.asarray(fitness, dtype = float)
+        if fitness.shape != (len(genomes),):
+            raise ValueError(f'Esperada uma aptidão por genoma ({len(genomes)}), recebido {fitness.shape}')
+
+        best = int(fitness.argmax())
+        if fitness[best] > self.best_fitness:
+            self.best_fitness = float(fitness[best])
+            self.best_genome = genomes[best].copy()
+
+        self.generation += 1
+        return fitness
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(dim={self.dim}, population_size={self.population_size})'
+
+
+class GeneticOptimizer(Optimizer):
+
+    def __init__(
+            self,
+            dim: int,
+            population_size: int,
+            elite_percentage: float = 0.2,
+            random_percentage: float = 0.1,
+            mutation_rate: float = 0.1,
+            mutation_strength: float = 0.2,
+            rng: np.random.Generator | None = None
+    ) -> None:
+        """Algoritmo genético elitista: mantém as elites, insere genomas
+        aleatórios e completa a população cruzando e mutando elites.
+
+        :param elite_percentage: Percentual dos melhores a serem mantidos.
+        :param random_percentage: Percentual de novos genomas aleatórios.
+        :param mutation_rate: Taxa de mutação.
+        :param mutation_strength: Força da mutação.
+        :param rng: Gerador aleatório (ver `Optimizer`).
+        """
+
+        super().__init__(dim, population_size, rng)
+
+        self.elite_count: int = max(int(population_size * elite_percentage), 1)
+        self.random_count: int = int(population_size * random_percentage)
+        self.crossover_count: int = population_size - self.elite_count - self.random_count
+        if self.crossover_count < 0:
+            raise ValueError('A soma dos percentuais de elite e aleatórios não pode passar de 1.')
+
+        self.mutation_rate: float = mutation_rate
+        self.mutation_strength: float = mutation_strength
+
+        self.genomes: NDArray = self._random_genomes(population_size)
+
+    def ask(self) -> NDArray:
+        return self.genomes
+
+    def tell(self, fitness: NDArray) -> None:
+
+        fitness = self._check_fitness(self.genomes, fitness)
+
+        # Índices dos melhores, do maior para o menor (empates pela posição)
+        ordered_idx = np.argsort(-fitness, kind = 'stable')
+        elites = self.genomes[ordered_idx[:self.elite_count]]
+
+        # Pares de pais distintos entre as elites
+        parents1 = self.rng.integers(self.elite_count, size = self.crossover_count)
+        if self.elite_count > 1:
+            shift = self.rng.integers(1, self.elite_count, size = self.crossover_count)
+            parents2 = (parents1 + shift) % self.elite_count
+        else:
+            parents2 = parents1
+
+        children = crossover_genomes(elites[parents1], elites[parents2], self.rng)
+        mutate_genomes(children, self.mutation_rate, self.mutation_strength, self.rng, self.mask)
+
+        self.genomes = np.concatenate([elites, self._random_genomes(self.random_count), children])
+
+    def set_mask(self, mask: NDArray) -> None:
+        """Restringe a evolução aos genes ativos de `mask` (ver
+        `NeuralNetwork.genome_mask`): os demais são zerados na população e
+        continuam nulos nos genomas aleatórios, filhos, mutações e imigrantes.
+
+        :param mask: Máscara booleana (dim,).
+        """
+
+        mask = np.asarray(mask, dtype = bool)
+        if mask.shape != (self.dim,):
+            raise ValueError(f'Máscara de forma {mask.shape} incompatível com genomas de {self.dim} genes')
+        self.mask = mask
+        self.genomes[:, ~mask] = 0
+
+    def emigrants(self, k: int) -> NDArray:
+        """Retorna cópias dos `k` melhores genomas (as elites da população atual)."""
+        return self.genomes[:min(k, self.elite_count)].copy()
+
+    def immigrate(self, genomes: NDArray) -> None:
+        """Substitui os últimos genomas da população (descendentes e aleatórios) por `genomes`."""
+
+        n = min(len(genomes), self.population_size - self.elite_count)
+        if n:
+            self.genomes[-n:] = genomes[:n]
+            if self.mask is not None:
+                self.genomes[-n:, ~self.mask] = 0
+
+    def _random_genomes(self, n: int) -> NDArray:
+        """Genomas com a mesma distribuição dos pesos iniciais de NeuralNetwork."""
+
+        genomes = self.rng.uniform(-0.5, 0.5, (n, self.dim))
+        if self.mask is not None:
+            genomes[:, ~self.mask] = 0
+        return genomes
+
+
+def centered_ranks(fitness: NDArray) -> NDArray:
+    """Transforma a aptidão em postos centrados em [-0.5, 0.5]."""
+
+    ranks = np.empty(len(fitness))
+    ranks[fitness.argsort()] = np.arange(len(fitness))
+    return ranks / (len(fitness) - 1) - 0.5
+
+
+class EvolutionStrategy(Optimizer):
+
+    def __init__(
+            self,
+            dim: int,
+            population_size: int,
+            sigma: float = 0.1,
+            learning_rate: float = 0.03,
+            weight_decay: float = 0.005,
+            mean: NDArray | None = None,
+            rng: np.random.Generator | None = None
+    ) -> None:
+        """Estratégia evolutiva no estilo OpenAI-ES, com amostragem
+        antitética, aptidão por postos centrados e passo Adam.
+
+        Com população ímpar, o último genoma é a própria média.
+
+        :param sigma: Desvio padrão das perturbações.
+        :param learning_rate: Taxa de aprendizado do Adam.
+        :param weight_decay: Decaimento L2 aplicado à média.
+        :param mean: Média inicial. Padrão: uniforme em [-0.5, 0.5].
+        :param rng: Gerador aleatório (ver `Optimizer`).
+        """
+
+        super().__init__(dim, population_size, rng)
+
+        self.sigma: float = sigma
+        self.learning_rate: float = learning_rate
+        self.weight_decay: float = weight_decay
+        self.mean: NDArray = self.rng.uniform(-0.5, 0.5, dim) if mean is None else np.array(mean, dtype = float)
+
+        self._pairs: int = population_size // 2
+        self._noise: NDArray | None = None
+        self._genomes: NDArray | None = None
+
+        # Estado do Adam
+        self._m: NDArray = np.zeros(dim)
+        self._v: NDArray = np.zeros(dim)
+
+    def ask(self) -> NDArray:
+
+        self._noise = self.rng.standard_normal((self._pairs, self.dim))
+        perturbation = self.sigma * self._noise
+        genomes = [self.mean + perturbation, self.mean - perturbation]
+        if self.population_size % 2:
+            genomes.append(self.mean[None])
+        self._genomes = np.concatenate(genomes)
+        return self._genomes
+
+    def tell(self, fitness: NDArray) -> None:
+
+        if self._noise is None:
+            raise RuntimeError('tell chamado antes de ask.')
+        fitness = self._check_fitness(self._genomes, fitness)
+
+        ranks = centered_ranks(fitness[:2 * self._pairs])
+        weights = ranks[:self._pairs] - ranks[self._pairs:]
+        gradient = weights @ self._noise / (2 * self._pairs * self.sigma)
+
+        # Subida de gradiente com Adam
+        beta1, beta2 = 0.9, 0.999
+        self._m = beta1 * self._m + (1 - beta1) * gradient
+        self._v = beta2 * self._v + (1 - beta2) * gradient ** 2
+        m_hat = self._m / (1 - beta1 ** self.generation)
+        v_hat = self._v / (1 - beta2 ** self.generation)
+        self.mean += self.learning_rate * m_hat / (np.sqrt(v_hat) + 1e-8) - self.weight_decay * self.mean
+
+        self._noise = None
+
+
+class CMAES(Optimizer):
+
+    def __init__(
+            self,
+            dim: int,
+            population_size: int,
+            sigma: float = 0.3,
+            mean: NDArray | None = None,
+            rng: np.random.Generator | None = None
+    ) -> None:
+        """CMA-ES (mu/mu_w, lambda) com atualizações rank-one e rank-mu.
+
+        :param sigma: Passo inicial.
+        :param mean: Média inicial. Padrão: uniforme em [-0.5, 0.5].
+        :param rng: Gerador aleatório (ver `Optimizer`).
+        """
+
+        super().__init__(dim, population_size, rng)
+
+        self.sigma: float = sigma
+        self.mean: NDArray = self.rng.uniform(-0.5, 0.5, dim) if mean is None else np.array(mean, dtype = float)
+
+        # Pesos de recombinação
+        self.mu: int = population_size // 2
+        weights = np.log(self.mu + 0.5) - np.log(np.arange(1, self.mu + 1))
+        self.weights: NDArray = weights / weights.sum()
+        self.mu_eff: float = 1 / np.sum(self.weights ** 2)
+
+        # Constantes de adaptação
+        n = dim
+        self.c_sigma: float = (self.mu_eff + 2) / (n + self.mu_eff + 5)
+        self.d_sigma: float = 1 + 2 * max(0, np.sqrt((self.mu_eff - 1) / (n + 1)) - 1) + self.c_sigma
+        self.c_c: float = (4 + self.mu_eff / n) / (n + 4 + 2 * self.mu_eff / n)
+        self.c_1: float = 2 / ((n + 1.3) ** 2 + self.mu_eff)
+        self.c_mu: float = min(1 - self.c_1, 2 * (self.mu_eff - 2 + 1 / self.mu_eff) / ((n + 2) ** 2 + self.mu_eff))
+        self.chi_n: float = np.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+
+        # Caminhos de evolução e covariância (C = B diag(D²) Bᵀ)
+        self.p_sigma: NDArray = np.zeros(n)
+        self.p_c: NDArray = np.zeros(n)
+        self.C: NDArray = np.eye(n)
+        self.B: NDArray = np.eye(n)
+        self.D: NDArray = np.ones(n)
+        self._eigen_generation: int = 0
+
+        self._z: NDArray | None = None
+        self._y: NDArray | None = None
+        self._genomes: NDArray | None = None
+
+    def ask(self) -> NDArray:
+
+        self._z = self.rng.standard_normal((self.population_size, self.dim))
+        self._y = (self._z * self.D) @ self.B.T
+        self._genomes = self.mean + self.sigma * self._y
+        return self._genomes
+
+    def tell(self, fitness: NDArray) -> None:
+
+        if self._z is None:
+            raise RuntimeError('tell chamado antes de ask.')
+        fitness = self._check_fitness(self._genomes, fitness)
+
+        best = np.argsort(fitness)[::-1][:self.mu]
+        y_w = self.weights @ self._y[best]
+        self.mean = self.mean + self.sigma * y_w
+
+        # Adaptação do passo
+        c_inv_sqrt_y = self.B @ ((self.B.T @ y_w) / self.D)
+        self.p_sigma = (1 - self.c_sigma) * self.p_sigma \
+            + np.sqrt(self.c_sigma * (2 - self.c_sigma) * self.mu_eff) * c_inv_sqrt_y
+        norm_p_sigma = np.linalg.norm(self.p_sigma)
+        self.sigma *= np.exp((self.c_sigma / self.d_sigma) * (norm_p_sigma / self.chi_n - 1))
+
+        # Adaptação da covariância
+        h_sigma = norm_p_sigma / np.sqrt(1 - (1 - self.c_sigma) ** (2 * self.generation)) \
+            < (1.4 + 2 / (self.dim + 1)) * self.chi_n
+        self.p_c = (1 - self.c_c) * self.p_c + h_sigma * np.sqrt(self.c_c * (2 - self.c_c) * self.mu_eff) * y_w
+
+        y_best = self._y[best]
+        rank_mu = (y_best.T * self.weights) @ y_best
+        delta_h = (1 - h_sigma) * self.c_c * (2 - self.c_c)
+        self.C = (1 - self.c_1 - self.c_mu + self.c_1 * delta_h) * self.C \
+            + self.c_1 * np.outer(self.p_c, self.p_c) + self.c_mu * rank_mu
+
+        # A decomposição é O(dim³): refeita apenas a cada poucas gerações
+        if self.generation - self._eigen_generation > 1 / (self.c_1 + self.c_mu) / self.dim / 10:
+            self._eigen_generation = self.generation
+            self.C = np.triu(self.C) + np.triu(self.C, 1).T
+            eigenvalues, self.B = np.linalg.eigh(self.C)
+            self.D = np.sqrt(np.maximum(eigenvalues, 1e-20))
+
+        self._z = None
+
+
+OPTIMIZERS: dict[str, type[Optimizer]] = {
+    'ga': GeneticOptimizer,
+    'es': EvolutionStrategy,
+    'cmaes': CMAES
+}
+
+
+def make_optimizer(name: str, dim: int, population_size: int, **options) -> Optimizer:
+    """Cria o otimizador registrado em OPTIMIZERS com o nome `name`.
+
+    :param name: 'ga', 'es' ou 'cmaes'.
+    :param dim: Número de genes de cada genoma.
+    :param population_size: Número de genomas por geração.
+    :param options: Parâmetros específicos do otimizador.
+    """
+
+    if name not in OPTIMIZERS:
+        raise ValueError(f"Otimizador desconhecido '{name}'. Opções: {', '.join(OPTIMIZERS)}")
+    return OPTIMIZERS[name](dim, population_size, **options)
@@ -0,0 +1,164 @@
+import numpy as np
+from numpy.typing import NDArray
+from .genetic import crossover_genomes, mutate_genomes
+
+
+class SteadyStateEvolution:
+
+    def __init__(
+            self,
+            dim: int,
+            population_size: int,
+            archive_size: int | None = None,
+            random_percentage: float = 0.1,
+            reevaluation: float = 0.1,
+            mutation_rate: float = 0.1,
+            mutation_strength: float = 0.2,
+            rng: np.random.Generator | None = None
+    ) -> None:
+        """Evolução em regime permanente, sem barreira entre gerações.
+
+        Cada vaga da população que termina sua avaliação recebe na hora um
+        novo genoma (`spawn`), e o resultado de cada genoma avaliado é
+        informado por `report`. Os melhores genomas ficam em um arquivo de
+        elites de tamanho fixo, do qual saem os pais dos novos genomas.
+
+        Como a aptidão de uma única avaliação é ruidosa, uma fração
+        `reevaluation` dos novos genomas são cópias de elites do arquivo: a
+        aptidão de cada elite é a média de todas as suas avaliações, e uma
+        elite que teve sorte perde o lugar ao ser reavaliada.
+
+        :param dim: Número de genes de cada genoma.
+        :param population_size: Número de vagas avaliadas ao mesmo tempo.
+        :param archive_size: Número de elites guardadas. Padrão: 20% das vagas.
+        :param random_percentage: Fração dos novos genomas que são aleatórios.
+        :param reevaluation: Fração dos novos genomas que são cópias de elites.
+        :param mutation_rate: Taxa de mutação.
+        :param mutation_strength: Força da mutação.
+        :param rng: Gerador aleatório próprio. Padrão: um gerador semeado a
+            partir do gerador global do numpy.
+        """
+
+        archive_size = archive_size or max(int(population_size * 0.2), 2)
+        if archive_size < 2:
+            raise ValueError(f'O arquivo deve guardar ao menos 2 genomas, não {archive_size}')
+        if random_percentage + reevaluation > 1:
+            raise ValueError('A soma das frações de aleatórios e de reavaliações não pode passar de 1.')
+
+        self.dim: int = dim
+        self.population_size: int = population_size
+        self.archive_size: int = archive_size
+        self.random_percentage: float = random_percentage
+        self.reevaluation: float = reevaluation
+        self.mutation_rate: float = mutation_rate
+        self.mutation_strength: float = mutation_strength
+        self.rng: np.random.Generator = rng if rng is not None else np.random.default_rng(np.random.randint(2 ** 32))
+
+        # Arquivo de elites, ordenado da maior para a menor aptidão média
+        self.genomes: NDArray = np.empty((0, dim))
+        self.fitness: NDArray = np.empty(0)
+        self.evaluations: NDArray = np.empty(0, dtype = int)
+        self.ids: NDArray = np.empty(0, dtype = np.int64)
+
+        self.births: int = 0
+        self.best_genome: NDArray | None = None
+        self.best_fitness: float = -np.inf
+        self._next_id: int = 0
+        self._immigrants: list[NDArray] = []
+
+    def spawn(self, n: int) -> tuple[NDArray, NDArray]:
+        """Cria `n` genomas para vagas livres.
+
+        Com menos de 2 elites no arquivo, os genomas são aleatórios; depois,
+        são imigrantes pendentes, cópias de elites, aleatórios ou filhos de
+        pares de elites distintas sorteadas uniformemente, com mutação.
+
+        :return: O identificador de cada genoma (o da elite, nas cópias) e a
+            matriz (n, dim) de genomas.
+        """
+
+        ids = np.arange(self._next_id, self._next_id + n, dtype = np.int64)
+        self._next_id += n
+        self.births += n
+        if len(self.genomes) < 2:
+            return ids, self._random_genomes(n)
+
+        kind = self.rng.random(n)
+        clones = np.flatnonzero(kind < self.reevaluation)
+        randoms = np.flatnonzero((kind >= self.reevaluation) & (kind < self.reevaluation + self.random_percentage))
+        children = np.flatnonzero(kind >= self.reevaluation + self.random_percentage)
+
+        genomes = np.empty((n, self.dim))
+        elite = self.rng.integers(len(self.genomes), size = len(clones))
+        genomes[clones] = self.genomes[elite]
+        ids[clones] = self.ids[elite]
+        genomes[randoms] = self._random_genomes(len(randoms))
+
+        # Pares de pais distintos entre as elites
+        k = len(self.genomes)
+        parents1 = self.rng.integers(k, size = len(children))
+        parents2 = (parents1 + self.rng.integers(1, k, size = len(children))) % k
+        offspring = crossover_genomes(self.genomes[parents1], self.genomes[parents2], self.rng)
+        mutate_genomes(offspring, self.mutation_rate, self.mutation_strength, self.rng)
+        genomes[children] = offspring
+
+        # Imigrantes substituem os primeiros filhos
+        while self._immigrants and len(children):
+            genomes[children[0]] = self._immigrants.pop(0)
+            children = children[1:]
+        return ids, genomes
+
+    def report(self, ids: NDArray, genomes: NDArray, fitness: NDArray) -> None:
+        """Registra a aptidão de genomas avaliados e atualiza o arquivo de elites.
+
+        :param ids: Identificadores retornados por `spawn`.
+        :param genomes: Matriz (n, dim) com os genomas avaliados.
+        :param fitness: Aptidão de cada genoma (maior é melhor).
+        """
+
+        fitness = np.asarray(fitness, dtype = float)
+        if fitness.shape != (len(genomes),) or len(ids) != len(genomes):
+            raise ValueError(f'Esperada uma aptidão e um identificador por genoma ({len(genomes)})')
+        if not len(fitness):
+            return
+
+        best = int(fitness.argmax())
+        if fitness[best] > self.best_fitness:
+            self.best_fitness = float(fitness[best])
+            self.best_genome = genomes[best].copy()
+
+        # Reavaliações de elites atualizam a média; os demais entram como candidatos
+        in_archive = np.isin(ids, self.ids)
+        for i in np.flatnonzero(in_archive):
+            j = int(np.flatnonzero(self.ids == ids[i])[0])
+            self.evaluations[j] += 1
+            self.fitness[j] += (fitness[i] - self.fitness[j]) / self.evaluations[j]
+
+        new = ~in_archive
+        candidates_ids = np.concatenate([self.ids, ids[new]])
+        candidates = np.concatenate([self.genomes, genomes[new]])
+        candidates_fitness = np.concatenate([self.fitness, fitness[new]])
+        evaluations = np.concatenate([self.evaluations, np.ones(int(new.sum()), dtype = int)])
+
+        # Um mesmo genoma novo pode ter terminado mais de uma vez no lote: fica a primeira
+        _, first = np.unique(candidates_ids, return_index = True)
+        order = first[np.argsort(-candidates_fitness[first], kind = 'stable')][:self.archive_size]
+        self.ids = candidates_ids[order]
+        self.genomes = candidates[order]
+        self.fitness = candidates_fitness[order]
+        self.evaluations = evaluations[order]
+
+    def emigrants(self, k: int) -> NDArray:
+        """Retorna cópias das `k` melhores elites do arquivo."""
+        return self.genomes[:k].copy()
+
+    def immigrate(self, genomes: NDArray) -> None:
+        """Agenda `genomes` para as próximas vagas, no lugar de filhos."""
+        self._immigrants.extend(np.array(genome, dtype = float) for genome in genomes)
+
+    def _random_genomes(self, n: int) -> NDArray:
+        """Genomas com a mesma distribuição dos pesos iniciais de NeuralNetwork."""
+        return self.rng.uniform(-0.5, 0.5, (n, self.dim))
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(dim={self.dim}, population_size={self.population_size}, archive_size={self.archive_size})'
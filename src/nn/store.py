@@ -0,0 +1,251 @@
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+from .genetic import crossover_genomes, mutate_genomes
+from .optim import Optimizer
+
+
+# Genomas lidos ou gravados de uma vez na seleção e no cruzamento
+CHUNK_SIZE: int = 65_536
+
+
+def top_k(values: NDArray, k: int, chunk_size: int = CHUNK_SIZE) -> NDArray:
+    """Índices dos `k` maiores valores, do maior para o menor (empates pela
+    posição), lendo `values` em blocos de `chunk_size`.
+
+    Os candidatos acima do limiar atual ficam em um buffer de 2k + bloco
+    posições que, ao encher, é reduzido aos k maiores, elevando o limiar.
+    Como os blocos chegam em ordem de posição, um valor igual ao limiar
+    perderia o empate e é descartado. A memória não depende do tamanho de
+    `values`, que pode ser um array mapeado em memória.
+
+    :param values: Vetor de valores.
+    :param k: Número de índices.
+    :param chunk_size: Valores lidos por bloco.
+    """
+
+    if not 0 < k <= len(values):
+        raise ValueError(f'k deve estar entre 1 e {len(values)}, não {k}')
+
+    capacity = 2 * k + chunk_size
+    idx = np.empty(capacity, dtype = np.intp)
+    vals = np.empty(capacity)
+    size = 0
+    threshold = None
+
+    for start in range(0, len(values), chunk_size):
+        block = np.asarray(values[start:start + chunk_size], dtype = float)
+        keep = np.arange(len(block)) if threshold is None else np.flatnonzero(block > threshold)
+        idx[size:size + len(keep)] = keep + start
+        vals[size:size + len(keep)] = block[keep]
+        size += len(keep)
+
+        # Redução aos k maiores
+        if size > 2 * k:
+            best = np.lexsort((idx[:size], -vals[:size]))[:k]
+            idx[:k], vals[:k] = idx[best], vals[best]
+            size = k
+            threshold = vals[k - 1]
+
+    idx, vals = idx[:size], vals[:size]
+    return idx[np.lexsort((idx, -vals))[:k]]
+
+
+class GenomeStore:
+
+    def __init__(self, directory: str | Path, population_size: int, dim: int, dtype: DTypeLike = np.float32) -> None:
+        """Matrizes de genomas em arquivos .npy mapeados em memória: a geração
+        atual (`current`) e a próxima (`next`), que trocam de papel a cada
+        `swap`. Apenas as páginas lidas ou gravadas ocupam memória, e o
+        sistema pode descartá-las, de modo que a população é limitada pelo
+        disco, não pela memória.
+
+        Os arquivos são criados em `directory`; arquivos existentes com a
+        mesma forma e tipo são reabertos sem apagar o conteúdo, de modo que
+        criar o armazenamento antes de restaurar um checkpoint (que guarda
+        apenas a referência aos arquivos) não destrói os genomas salvos.
+
+        :param directory: Diretório dos arquivos.
+        :param population_size: Número de genomas.
+        :param dim: Número de genes de cada genoma.
+        :param dtype: Tipo dos genes gravados. float32 ocupa metade do disco.
+        """
+
+        self.directory: Path = Path(directory)
+        self.population_size: int = population_size
+        self.dim: int = dim
+        self.dtype: np.dtype = np.dtype(dtype)
+        self._current: int = 0
+
+        self.directory.mkdir(parents = True, exist_ok = True)
+        self._arrays: list[np.memmap] = [self._open(path, create = True) for path in self.paths]
+
+    @property
+    def paths(self) -> tuple[Path, Path]:
+        """Arquivos das duas gerações."""
+        return self.directory / 'genomes-0.npy', self.directory / 'genomes-1.npy'
+
+    @property
+    def current(self) -> np.memmap:
+        """Matriz (population_size, dim) da geração atual."""
+        return self._arrays[self._current]
+
+    @property
+    def next(self) -> np.memmap:
+        """Matriz (population_size, dim) da próxima geração, gravada antes de `swap`."""
+        return self._arrays[1 - self._current]
+
+    def swap(self) -> None:
+        """Grava a próxima geração no disco e a torna a atual."""
+
+        self.next.flush()
+        self._current = 1 - self._current
+
+    def flush(self) -> None:
+        for array in self._arrays:
+            array.flush()
+
+    def _open(self, path: Path, create: bool = False) -> np.memmap:
+        """Abre (ou, com `create`, cria se preciso) o arquivo `path` para leitura e escrita."""
+
+        shape = (self.population_size, self.dim)
+        if path.exists():
+            array = np.load(path, mmap_mode = 'r+')
+            if array.shape == shape and array.dtype == self.dtype:
+                return array
+            if not create:
+                raise ValueError(f'O arquivo de genomas {path} não tem a forma {shape} e o tipo {self.dtype}')
+            del array
+        elif not create:
+            raise FileNotFoundError(f'Arquivo de genomas {path} não encontrado')
+        return np.lib.format.open_memmap(path, mode = 'w+', dtype = self.dtype, shape = shape)
+
+    def __getstate__(self) -> dict:
+        # Apenas a referência aos arquivos, não os genomas
+        self.flush()
+        state = self.__dict__.copy()
+        del state['_arrays']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._arrays = [self._open(path) for path in self.paths]
+
+    def __repr__(self) -> str:
+        return f'GenomeStore({str(self.directory)!r}, population_size={self.population_size}, dim={self.dim}, dtype={self.dtype})'
+
+
+class OutOfCoreGeneticOptimizer(Optimizer):
+
+    def __init__(
+            self,
+            dim: int,
+            population_size: int,
+            directory: str | Path,
+            elite_percentage: float = 0.2,
+            random_percentage: float = 0.1,
+            mutation_rate: float = 0.1,
+            mutation_strength: float = 0.2,
+            chunk_size: int = CHUNK_SIZE,
+            dtype: DTypeLike = np.float32,
+            rng: np.random.Generator | None = None
+    ) -> None:
+        """O algoritmo genético de GeneticOptimizer para populações maiores
+        que a memória, com os genomas em um GenomeStore.
+
+        `ask` retorna a matriz mapeada em memória, para ser lida em blocos;
+        `tell` seleciona as elites com `top_k` e grava a próxima geração em
+        blocos de `chunk_size` genomas (elites, filhos e aleatórios), sem
+        carregar a população. A população inicial aleatória é gravada no
+        primeiro `ask`, para não sobrescrever os arquivos de um checkpoint.
+        Com um único bloco e dtype float64, as gerações são idênticas às de
+        GeneticOptimizer com o mesmo gerador, que também desempata as
+        elites pela posição.
+
+        :param directory: Diretório dos arquivos de genomas.
+        :param elite_percentage: Percentual dos melhores a serem mantidos.
+        :param random_percentage: Percentual de novos genomas aleatórios.
+        :param mutation_rate: Taxa de mutação.
+        :param mutation_strength: Força da mutação.
+        :param chunk_size: Genomas por bloco lido ou gravado.
+        :param dtype: Tipo dos genes gravados (ver GenomeStore).
+        :param rng: Gerador aleatório (ver `Optimizer`).
+        """
+
+        super().__init__(dim, population_size, rng)
+
+        if chunk_size < 1:
+            raise ValueError(f'O tamanho do bloco deve ser ao menos 1, não {chunk_size}')
+
+        self.elite_count: int = max(int(population_size * elite_percentage), 1)
+        self.random_count: int = int(population_size * random_percentage)
+        self.crossover_count: int = population_size - self.elite_count - self.random_count
+        if self.crossover_count < 0:
+            raise ValueError('A soma dos percentuais de elite e aleatórios não pode passar de 1.')
+
+        self.mutation_rate: float = mutation_rate
+        self.mutation_strength: float = mutation_strength
+        self.chunk_size: int = chunk_size
+
+        self.store: GenomeStore = GenomeStore(directory, population_size, dim, dtype)
+        self._initialized: bool = False
+
+    def ask(self) -> NDArray:
+
+        if not self._initialized:
+            for start, n in self._blocks(0, self.population_size):
+                self.store.current[start:start + n] = self._random_genomes(n)
+            self._initialized = True
+        return self.store.current
+
+    def tell(self, fitness: NDArray) -> None:
+
+        current, following = self.ask(), self.store.next
+        fitness = self._check_fitness(current, fitness)
+        self.best_genome = np.asarray(self.best_genome, dtype = float)
+        elite_idx = top_k(fitness, self.elite_count, self.chunk_size)
+
+        # Elites no início da próxima geração, lidas em ordem crescente de posição
+        for start, n in self._blocks(0, self.elite_count):
+            idx = elite_idx[start:start + n]
+            order = np.argsort(idx)
+            following[start + order] = current[idx[order]]
+        elites = following[:self.elite_count]
+
+        # Filhos de pares de elites distintas, depois dos aleatórios
+        for start, n in self._blocks(self.elite_count + self.random_count, self.population_size):
+            parents1 = self.rng.integers(self.elite_count, size = n)
+            if self.elite_count > 1:
+                shift = self.rng.integers(1, self.elite_count, size = n)
+                parents2 = (parents1 + shift) % self.elite_count
+            else:
+                parents2 = parents1
+
+            children = crossover_genomes(elites[parents1], elites[parents2], self.rng)
+            mutate_genomes(children, self.mutation_rate, self.mutation_strength, self.rng)
+            following[start:start + n] = children
+
+        for start, n in self._blocks(self.elite_count, self.elite_count + self.random_count):
+            following[start:start + n] = self._random_genomes(n)
+
+        self.store.swap()
+
+    def emigrants(self, k: int) -> NDArray:
+        """Retorna cópias dos `k` melhores genomas (as elites da população atual)."""
+        return np.array(self.ask()[:min(k, self.elite_count)], dtype = float)
+
+    def immigrate(self, genomes: NDArray) -> None:
+        """Substitui os últimos genomas da população (descendentes e aleatórios) por `genomes`."""
+
+        n = min(len(genomes), self.population_size - self.elite_count)
+        if n:
+            self.ask()[-n:] = genomes[:n]
+
+    def _blocks(self, start: int, stop: int):
+        """Início e tamanho de cada bloco de [start, stop)."""
+        return ((i, min(self.chunk_size, stop - i)) for i in range(start, stop, self.chunk_size))
+
+    def _random_genomes(self, n: int) -> NDArray:
+        """Genomas com a mesma distribuição dos pesos iniciais de NeuralNetwork."""
+        return self.rng.uniform(-0.5, 0.5, (n, self.dim))
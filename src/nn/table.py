@@ -0,0 +1,180 @@
+import numpy as np
+from numpy.typing import NDArray
+from pathlib import Path
+from typing import Literal, Self
+from .nn import NeuralNetwork
+
+
+# Limites do espaço de observação do FlappyBird (ver FlappyBird.get_states):
+# distância x em [0, (800 - 440) / 800], distâncias verticais para as aberturas
+# com o meio do pássaro em [0, 560] e a abertura em [0, 300] / [150, 450],
+# e velocidade entre LIFT (-10) e a velocidade de queda máxima (~24).
+OBSERVATION_LOW: tuple[float, ...] = (0.0, -560 / 600, -410 / 600, -10 / 600)
+OBSERVATION_HIGH: tuple[float, ...] = (360 / 800, 300 / 600, 450 / 600, 24 / 600)
+
+# Número de estados avaliados por lote ao compilar a tabela
+_CHUNK_SIZE: int = 1 << 16
+
+
+class TablePolicy:
+
+    def __init__(
+            self,
+            bits: bytes,
+            resolution: tuple[int, ...],
+            low: tuple[float, ...],
+            high: tuple[float, ...]
+    ) -> None:
+        """Política que responde por consulta a uma tabela de decisão quantizada.
+
+        :param bits: Ações de cada célula, compactadas em bits (np.packbits).
+        :param resolution: Número de células em cada dimensão da observação.
+        :param low: Limite inferior de cada dimensão.
+        :param high: Limite superior de cada dimensão.
+        """
+
+        if not len(resolution) == len(low) == len(high):
+            raise ValueError('resolution, low e high devem ter o mesmo tamanho.')
+        if len(bits) * 8 < int(np.prod(resolution)):
+            raise ValueError('A tabela não cobre todas as células da resolução.')
+
+        self.bits: bytes = bytes(bits)
+        self.resolution: tuple[int, ...] = tuple(int(r) for r in resolution)
+        self.low: tuple[float, ...] = tuple(float(x) for x in low)
+        self.high: tuple[float, ...] = tuple(float(x) for x in high)
+
+        # Pré-calculados para que predict use apenas aritmética escalar
+        self._scale: tuple[float, ...] = tuple(
+            r / (h - l) for r, l, h in zip(self.resolution, self.low, self.high)
+        )
+        self._last: tuple[int, ...] = tuple(r - 1 for r in self.resolution)
+        self._strides: tuple[int, ...] = tuple(
+            int(np.prod(self.resolution[i+1:])) for i in range(len(self.resolution))
+        )
+        self._dims = tuple(zip(range(len(self.resolution)), self.low, self._scale, self._last, self._strides))
+
+    @classmethod
+    def from_network(
+            cls,
+            nn: NeuralNetwork,
+            resolution: int | tuple[int, ...] = 16,
+            low: tuple[float, ...] = OBSERVATION_LOW,
+            high: tuple[float, ...] = OBSERVATION_HIGH
+    ) -> Self:
+        """Compila `nn` em uma tabela avaliando a rede no centro de cada célula.
+
+        :param nn: Rede neural treinada.
+        :param resolution: Células por dimensão, um int para todas ou uma por dimensão.
+        :param low: Limite inferior de cada dimensão.
+        :param high: Limite superior de cada dimensão.
+        """
+
+        if isinstance(resolution, int):
+            resolution = (resolution,) * len(low)
+
+        centers = [
+            l + (np.arange(r) + 0.5) * (h - l) / r
+            for r, l, h in zip(resolution, low, high)
+        ]
+
+        size = int(np.prod(resolution))
+        actions = np.empty(size, dtype = np.uint8)
+        for start in range(0, size, _CHUNK_SIZE):
+            flat = np.arange(start, min(start + _CHUNK_SIZE, size))
+            idx = np.unravel_index(flat, resolution)
+            states = np.stack([c[i] for c, i in zip(centers, idx)], axis = 1)
+            actions[start:start + len(flat)] = nn.predict_batch(states)
+
+        return cls(np.packbits(actions).tobytes(), resolution, low, high)
+
+    def predict(self, a: NDArray) -> Literal[0, 1]:
+        """Retorna a ação da célula que contém o estado `a`.
+
+        :param a: Estado com uma entrada por dimensão, em qualquer formato (ex.: (4, 1)).
+        """
+
+        flat = 0
+        for i, low, scale, last, stride in self._dims:
+            j = int((a.item(i) - low) * scale)
+            if j < 0:
+                j = 0
+            elif j > last:
+                j = last
+            flat += j * stride
+        return (self.bits[flat >> 3] >> (7 - (flat & 7))) & 1
+
+    def predict_batch(self, states: NDArray) -> NDArray:
+        """Retorna a ação para cada linha de `states`.
+
+        :param states: Matriz (N, entradas) com um estado por linha.
+        """
+
+        low = np.asarray(self.low)
+        scale = np.asarray(self._scale)
+        idx = ((states - low) * scale).astype(np.int64)
+        np.clip(idx, 0, self._last, out = idx)
+        flat = idx @ np.asarray(self._strides)
+        table = np.frombuffer(self.bits, dtype = np.uint8)
+        return (table[flat >> 3] >> (7 - (flat & 7))) & 1
+
+    def disagreement(self, nn: NeuralNetwork, states: NDArray) -> float:
+        """Retorna a fração de `states` em que a tabela e `nn` escolhem ações diferentes.
+
+        :param nn: Rede neural de referência.
+        :param states: Matriz (N, entradas) com um estado por linha.
+        """
+        return float(np.mean(self.predict_batch(states) != nn.predict_batch(states)))
+
+    def save(self, path: str | Path) -> None:
+        """Salva a tabela em `path` (formato .npz)."""
+
+        np.savez(
+            path,
+            bits = np.frombuffer(self.bits, dtype = np.uint8),
+            resolution = np.array(self.resolution),
+            low = np.array(self.low),
+            high = np.array(self.high)
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        """Carrega uma tabela salva com `save`."""
+
+        with np.load(path) as data:
+            return cls(
+                data['bits'].tobytes(),
+                tuple(data['resolution'].tolist()),
+                tuple(data['low'].tolist()),
+                tuple(data['high'].tolist())
+            )
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.bits)
+
+    def __repr__(self) -> str:
+        return f'TablePolicy(resolution={self.resolution}, nbytes={self.nbytes})'
+
+
+def compile_table(
+        nn: NeuralNetwork,
+        resolution: int | tuple[int, ...] = 16,
+        low: tuple[float, ...] = OBSERVATION_LOW,
+        high: tuple[float, ...] = OBSERVATION_HIGH,
+        num_samples: int = 100_000,
+        seed: int | None = None
+) -> tuple[TablePolicy, float]:
+    """Compila `nn` em uma TablePolicy e retorna a política junto da taxa
+    de discordância medida em `num_samples` estados uniformes dentro dos limites.
+
+    :param nn: Rede neural treinada.
+    :param resolution: Células por dimensão.
+    :param low: Limite inferior de cada dimensão.
+    :param high: Limite superior de cada dimensão.
+    :param num_samples: Número de estados aleatórios usados na comparação.
+    :param seed: Semente dos estados aleatórios.
+    """
+
+    policy = TablePolicy.from_network(nn, resolution, low, high)
+    states = np.random.default_rng(seed).uniform(low, high, (num_samples, len(low)))
+    return policy, policy.disagreement(nn, states)
@@ -0,0 +1,223 @@
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+
+
+MODES = ('cprofile', 'sample')
+
+
+def _label(filename: str, lineno: int, name: str) -> str:
+    """Nome de uma função em uma pilha colapsada (sem ';' nem espaços)."""
+
+    if filename == '~':
+        # Funções embutidas do cProfile, ex.: <built-in method numpy.dot>
+        return name.replace(' ', '_').replace(';', ',')
+    return f'{name} ({Path(filename).name}:{lineno})'.replace(' ', '_').replace(';', ',')
+
+
+def collapse_pstats(stats: pstats.Stats, max_depth: int = 64, min_fraction: float = 1e-4) -> dict[str, float]:
+    """Converte estatísticas do cProfile em pilhas colapsadas (para flame graphs).
+
+    O cProfile guarda apenas pares chamador -> chamado; as pilhas são
+    reconstruídas distribuindo o tempo próprio de cada função entre seus
+    chamadores na proporção do tempo acumulado de cada chamada, como
+    fazem os conversores de pstats para flame graphs.
+
+    :param stats: Estatísticas do cProfile.
+    :param max_depth: Profundidade máxima das pilhas.
+    :param min_fraction: Ramos com menos que esta fração do tempo total são
+        descartados, o que limita o número de pilhas.
+    :return: Pilha ('raiz;...;função') -> segundos.
+    """
+
+    table = stats.stats
+    stacks: dict[str, float] = {}
+    min_seconds = min_fraction * sum(timing[2] for timing in table.values())
+
+    def expand(func, seconds: float, path: list) -> None:
+        callers = table[func][4] if func in table else {}
+        callers = {caller: timing[3] for caller, timing in callers.items() if caller not in path}
+        total = sum(callers.values())
+        if not callers or total <= 0 or len(path) >= max_depth:
+            key = ';'.join(_label(*f) for f in reversed(path))
+            stacks[key] = stacks.get(key, 0.0) + seconds
+            return
+        for caller, cumulative in callers.items():
+            share = seconds * cumulative / total
+            if share >= min_seconds:
+                expand(caller, share, path + [caller])
+
+    for func, (_, _, tottime, _, _) in table.items():
+        if tottime > 0 and tottime >= min_seconds:
+            expand(func, tottime, [func])
+    return stacks
+
+
+class _Sampler:
+
+    def __init__(self, interval: float) -> None:
+        """Amostra a pilha da thread que o iniciou a cada `interval` segundos,
+        em uma thread em segundo plano, sem instrumentar as chamadas."""
+
+        self.interval: float = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples: int = 0
+        self._thread_id: int = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target = self._run, name = 'sampler', daemon = True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame: FrameType | None = sys._current_frames().get(self._thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(_label(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if names:
+                self.stacks[';'.join(reversed(names))] += 1
+                self.samples += 1
+
+
+class GenerationProfiler:
+
+    def __init__(
+            self,
+            mode: str = 'cprofile',
+            start: int = 1,
+            generations: int = 5,
+            output: str | Path = 'profile',
+            interval: float = 0.005
+    ) -> None:
+        """Perfila uma janela de gerações do treinamento.
+
+        Com 'cprofile', todas as chamadas são medidas (mais lento) e são
+        gravados `<output>.pstats` e `<output>.collapsed`; com 'sample', a
+        pilha é amostrada a cada `interval` segundos (pouco custo) e são
+        gravados `<output>.collapsed` e `<output>.txt`, com as funções de mais
+        amostras. As pilhas colapsadas (uma linha 'a;b;c valor' por pilha) são
+        a entrada do flamegraph.pl e do speedscope. O perfilador apenas
+        observa: não altera as sequências aleatórias nem a simulação.
+
+        :param mode: 'cprofile' ou 'sample'.
+        :param start: Primeira geração perfilada.
+        :param generations: Número de gerações perfiladas.
+        :param output: Prefixo dos arquivos gerados.
+        :param interval: Intervalo entre amostras, em segundos ('sample').
+        """
+
+        if mode not in MODES:
+            raise ValueError(f"Modo de perfilamento desconhecido '{mode}'. Opções: {', '.join(MODES)}")
+        if generations < 1:
+            raise ValueError(f'A janela deve ter ao menos uma geração, não {generations}')
+
+        self.mode: str = mode
+        self.start: int = start
+        self.generations: int = generations
+        self.output: Path = Path(output)
+        self.interval: float = interval
+
+        self.files: list[Path] = []
+        self._profile: cProfile.Profile | None = None
+        self._sampler: _Sampler | None = None
+        self._elapsed: float = 0.0
+        self._started_at: float = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None or self._sampler is not None
+
+    @property
+    def end(self) -> int:
+        """Última geração perfilada."""
+        return self.start + self.generations - 1
+
+    def before_generation(self, generation: int) -> None:
+        """Inicia a captura na primeira geração da janela."""
+
+        if generation != self.start or self.active or self.files:
+            return
+        if self.mode == 'cprofile':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = _Sampler(self.interval)
+            self._sampler.start()
+        self._started_at = time.perf_counter()
+
+    def after_generation(self, generation: int) -> None:
+        """Encerra a captura e grava os arquivos na última geração da janela."""
+
+        if generation >= self.end:
+            self.close()
+
+    def close(self) -> list[Path]:
+        """Encerra a captura, se ativa, grava os arquivos e os retorna."""
+
+        if not self.active:
+            return self.files
+        self._elapsed = time.perf_counter() - self._started_at
+        self.output.parent.mkdir(parents = True, exist_ok = True)
+
+        if self._profile is not None:
+            self._profile.disable()
+            self.files = self._write_cprofile(self._profile)
+            self._profile = None
+        else:
+            self._sampler.stop()
+            self.files = self._write_samples(self._sampler)
+            self._sampler = None
+        return self.files
+
+    def _write_cprofile(self, profile: cProfile.Profile) -> list[Path]:
+
+        pstats_path = self._path('.pstats')
+        profile.dump_stats(pstats_path)
+
+        stats = pstats.Stats(profile, stream = io.StringIO())
+        collapsed_path = self._path('.collapsed')
+        stacks = collapse_pstats(stats)
+        with open(collapsed_path, 'w') as f:
+            # Valores inteiros em microssegundos, como esperam os geradores de flame graph
+            for stack, seconds in sorted(stacks.items()):
+                micros = round(seconds * 1e6)
+                if micros:
+                    f.write(f'{stack} {micros}\n')
+        return [pstats_path, collapsed_path]
+
+    def _write_samples(self, sampler: _Sampler) -> list[Path]:
+
+        collapsed_path = self._path('.collapsed')
+        with open(collapsed_path, 'w') as f:
+            for stack, count in sorted(sampler.stacks.items()):
+                f.write(f'{stack} {count}\n')
+
+        # Funções com mais amostras no topo da pilha (tempo próprio)
+        own = Counter()
+        for stack, count in sampler.stacks.items():
+            own[stack.rsplit(';', 1)[-1]] += count
+        summary_path = self._path('.txt')
+        with open(summary_path, 'w') as f:
+            f.write(f'{sampler.samples} amostras em {self._elapsed:.2f}s (intervalo {self.interval * 1e3:g} ms)\n')
+            for name, count in own.most_common(30):
+                f.write(f'{count:>8} {100 * count / max(sampler.samples, 1):>6.1f}%  {name}\n')
+        return [collapsed_path, summary_path]
+
+    def _path(self, suffix: str) -> Path:
+        return self.output.with_name(self.output.name + suffix)
+
+    def __repr__(self) -> str:
+        return f'GenerationProfiler(mode={self.mode!r}, start={self.start}, generations={self.generations})'
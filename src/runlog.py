@@ -0,0 +1,128 @@
+import json
+import os
+import time
+import numpy as np
+from numpy.typing import NDArray
+from pathlib import Path
+from typing import Self
+
+
+PERCENTILES = (0, 10, 25, 50, 75, 90, 100)
+
+
+def fitness_summary(fitness: NDArray, bins: int = 16) -> dict:
+    """Resume uma distribuição de aptidões em histograma e percentis.
+
+    :param fitness: Aptidão de cada indivíduo.
+    :param bins: Número de intervalos do histograma.
+    """
+
+    fitness = np.asarray(fitness, dtype = float)
+    counts, edges = np.histogram(fitness, bins = bins)
+    return {
+        'mean': float(fitness.mean()),
+        'std': float(fitness.std()),
+        'percentiles': dict(zip(map(str, PERCENTILES), np.percentile(fitness, PERCENTILES).tolist())),
+        'histogram': {'counts': counts.tolist(), 'edges': edges.tolist()},
+    }
+
+
+class RunLog:
+
+    def __init__(
+            self,
+            path: str | Path,
+            max_bytes: int = 64 * 2 ** 20,
+            backups: int = 5,
+            buffer_size: int = 2 ** 16,
+            flush_interval: float = 5.0
+    ) -> None:
+        """Log JSON-lines do treinamento, um registro por linha.
+
+        A escrita passa por um buffer, descarregado quando enche, a cada
+        `flush_interval` segundos e ao fechar. Quando o arquivo passa de
+        `max_bytes` ele é rotacionado como no logging do Python:
+        run.jsonl -> run.jsonl.1 -> run.jsonl.2 ..., mantendo `backups` arquivos antigos.
+
+        :param path: Arquivo do log.
+        :param max_bytes: Tamanho máximo de cada arquivo (0 desativa a rotação).
+        :param backups: Número de arquivos rotacionados mantidos.
+        :param buffer_size: Tamanho do buffer de escrita, em bytes.
+        :param flush_interval: Intervalo máximo entre descargas do buffer, em segundos.
+        """
+
+        self.path: Path = Path(path)
+        self.max_bytes: int = max_bytes
+        self.backups: int = backups
+        self.buffer_size: int = buffer_size
+        self.flush_interval: float = flush_interval
+
+        self._file = open(self.path, 'a', buffering = buffer_size, encoding = 'utf-8')
+        self._size: int = self._file.tell()
+        self._last_flush: float = time.monotonic()
+
+    def write(self, record: dict) -> None:
+        """Acrescenta um registro ao log."""
+
+        line = json.dumps(record, separators = (',', ':')) + '\n'
+        if self.max_bytes and self._size and self._size + len(line) > self.max_bytes:
+            self.rotate()
+
+        self._file.write(line)
+        self._size += len(line)
+
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Descarrega o buffer no arquivo."""
+
+        self._file.flush()
+        self._last_flush = time.monotonic()
+
+    def rotate(self) -> None:
+        """Fecha o arquivo atual, desloca os antigos e abre um arquivo vazio."""
+
+        self._file.close()
+        if self.backups > 0:
+            for i in range(self.backups - 1, 0, -1):
+                source = self.path.with_name(f'{self.path.name}.{i}')
+                if source.exists():
+                    os.replace(source, self.path.with_name(f'{self.path.name}.{i + 1}'))
+            os.replace(self.path, self.path.with_name(f'{self.path.name}.1'))
+        else:
+            self.path.unlink()
+
+        self._file = open(self.path, 'a', buffering = self.buffer_size, encoding = 'utf-8')
+        self._size = 0
+
+    def close(self) -> None:
+        """Descarrega o buffer e fecha o arquivo."""
+
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'RunLog(path={str(self.path)!r}, max_bytes={self.max_bytes}, backups={self.backups})'
+
+
+def read_run_log(path: str | Path) -> list[dict]:
+    """Lê os registros de um log, incluindo os arquivos rotacionados, do mais antigo ao mais recente."""
+
+    path = Path(path)
+    backups = [p for p in path.parent.glob(f'{path.name}.*') if p.suffix[1:].isdigit()]
+    backups.sort(key = lambda p: int(p.suffix[1:]), reverse = True)
+
+    records = []
+    for file in backups + [path]:
+        if file.exists():
+            with open(file, encoding = 'utf-8') as f:
+                records.extend(json.loads(line) for line in f if line.strip())
+    return records
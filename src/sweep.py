@@ -0,0 +1,173 @@
+import contextlib
+import csv
+import io
+import itertools
+import json
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+try:
+    from .main import FlappyBirdAI
+except ImportError:
+    # Executado como script: python src/main.py
+    from main import FlappyBirdAI
+
+
+RESULT_COLUMNS = ('run', 'seed', 'best_score', 'best_steps', 'generations', 'generations_to_target', 'wall_time', 'stop_reason', 'error')
+
+
+def grid_configs(params: dict[str, list]) -> list[dict]:
+    """Retorna todas as combinações dos valores de `params`.
+
+    :param params: Valores possíveis de cada parâmetro, ex.: {'MUTATION_RATE': [0.05, 0.1]}.
+    """
+
+    names = list(params)
+    return [dict(zip(names, values)) for values in itertools.product(*(params[name] for name in names))]
+
+
+def random_configs(params: dict[str, list | dict], samples: int, seed: int | None = None) -> list[dict]:
+    """Sorteia `samples` configurações.
+
+    Cada parâmetro é uma lista de valores possíveis ou um intervalo
+    {'low': a, 'high': b, 'log': bool}; intervalos com limites inteiros
+    geram inteiros.
+
+    :param params: Espaço de busca de cada parâmetro.
+    :param samples: Número de configurações.
+    :param seed: Semente do sorteio.
+    """
+
+    rng = np.random.default_rng(seed)
+    configs = []
+    for _ in range(samples):
+        config = {}
+        for name, space in params.items():
+            if isinstance(space, dict):
+                low, high = space['low'], space['high']
+                if space.get('log', False):
+                    value = float(np.exp(rng.uniform(np.log(low), np.log(high))))
+                else:
+                    value = float(rng.uniform(low, high))
+                if isinstance(low, int) and isinstance(high, int):
+                    value = int(round(value))
+            else:
+                value = space[rng.integers(len(space))]
+            config[name] = value
+        configs.append(config)
+    return configs
+
+
+def load_spec(path: str | Path) -> dict:
+    """Lê uma especificação de busca em JSON:
+
+        {
+            "mode": "grid" | "random",
+            "params": {"MUTATION_RATE": [0.05, 0.1], "ELITE_PERCENTAGE": {"low": 0.1, "high": 0.4}},
+            "samples": 20,          (apenas "random")
+            "seed": 0,
+            "base": {"MAX_GENERATIONS": 30, "MAX_WALL_TIME": 600}
+        }
+    """
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def spec_configs(spec: dict) -> list[dict]:
+    """Expande uma especificação (ver `load_spec`) nas configurações a executar."""
+
+    mode = spec.get('mode', 'grid')
+    if mode == 'grid':
+        configs = grid_configs(spec['params'])
+    elif mode == 'random':
+        configs = random_configs(spec['params'], spec['samples'], spec.get('seed'))
+    else:
+        raise ValueError(f"Modo de busca desconhecido '{mode}'. Opções: grid, random")
+
+    base = spec.get('base', {})
+    return [base | config for config in configs]
+
+
+def _run_config(run: int, config: dict, seed: int) -> dict:
+    """Treina uma configuração sem interface gráfica e retorna seu resultado."""
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ai = FlappyBirdAI(gui = False, verbose = False, config = {'SEED': seed} | config)
+        ai.run()
+
+    return {
+        'run': run,
+        'seed': seed,
+        'best_score': ai.best_score_ever,
+        'best_steps': ai.best_steps_ever,
+        'generations': ai.generation,
+        'generations_to_target': ai.generation if ai.time_to_target is not None else None,
+        'wall_time': round(time.perf_counter() - start, 3),
+        'stop_reason': ai.stop_reason,
+    } | config
+
+
+def run_sweep(
+        configs: list[dict],
+        output: str | Path,
+        workers: int | None = None,
+        seed: int = 0,
+        verbose: bool = True
+) -> list[dict]:
+    """Treina cada configuração em um pool de processos e escreve uma
+    linha em `output` (CSV) assim que cada treinamento termina. Um
+    treinamento que falha não interrompe a busca: sua linha traz a
+    configuração e a exceção na coluna `error`.
+
+    :param configs: Configurações de FlappyBirdAI a treinar.
+    :param output: Arquivo CSV com os resultados.
+    :param workers: Máximo de treinamentos simultâneos. Padrão: número de CPUs.
+    :param seed: Semente base; a execução i usa seed + i.
+    :param verbose: Exibe cada resultado ao terminar.
+    """
+
+    # Valida as configurações antes de iniciar os processos
+    for config in configs:
+        unknown = [name for name in config if not name.isupper() or not hasattr(FlappyBirdAI, name)]
+        if unknown:
+            raise ValueError(f'Parâmetros de treinamento desconhecidos: {unknown}')
+
+    params = sorted({name for config in configs for name in config})
+    columns = list(RESULT_COLUMNS) + params
+    workers = workers or os.cpu_count() or 1
+
+    results = []
+    with open(output, 'w', newline = '') as f, ProcessPoolExecutor(max_workers = workers) as executor:
+
+        writer = csv.DictWriter(f, fieldnames = columns)
+        writer.writeheader()
+        f.flush()
+
+        futures = {
+            executor.submit(_run_config, i, config, seed + i): (i, config) for i, config in enumerate(configs)
+        }
+        for future in as_completed(futures):
+            run, config = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'run': run, 'seed': seed + run, 'error': f'{type(e).__name__}: {e}'} | config
+            results.append(result)
+            writer.writerow({name: result.get(name) for name in columns})
+            f.flush()
+
+            if verbose:
+                if result.get('error') is not None:
+                    print(f"[{len(results)}/{len(configs)}] Execução {run} falhou: {result['error']}")
+                else:
+                    print(
+                        f"[{len(results)}/{len(configs)}] Execução {run}: "
+                        f"pontuação {result['best_score']}, {result['generations']} gerações, "
+                        f"{result['wall_time']:.1f}s"
+                    )
+
+    return sorted(results, key = lambda r: r['run'])
@@ -1,9 +1,16 @@
+import os
 import pytest
 from unittest.mock import patch
 
 import pygame as pg
 from typing import Self
 
+# Os testes não leem nem gravam o cache de assets do usuário
+os.environ['FLAPPY_ASSET_CACHE'] = ''
+
+
+# Função original, antes de ser substituída por MockMask na sessão de testes
+_from_surface = pg.mask.from_surface
 
 class MockMask:
     _collides: bool = False
@@ -40,3 +47,18 @@ def setup():
 def default_bird():
     from src.env import Bird
     return Bird()
+
+
+@pytest.fixture
+def real_masks():
+    """Usa as imagens e máscaras de colisão reais, restaurando os caches ao final."""
+
+    from src.env import Bird, Pipe
+    names = [(Bird, '_IMAGE'), (Bird, '_MASK'), (Pipe, '_IMAGE_UPPER'), (Pipe, '_IMAGE_LOWER'), (Pipe, '_MASK_UPPER'), (Pipe, '_MASK_LOWER')]
+    cached = [getattr(cls, name) for cls, name in names]
+    for cls, name in names:
+        setattr(cls, name, None)
+    with patch('pygame.mask.from_surface', _from_surface):
+        yield
+    for (cls, name), value in zip(names, cached):
+        setattr(cls, name, value)
@@ -0,0 +1,75 @@
+import numpy as np
+import pygame as pg
+
+from src.env import Bird, Pipe, CollisionTable
+from src.env import assets
+from src.env.assets import AssetCache, asset_key, load_image
+from src.env.utils import load_img, Image
+
+
+def test_get_builds_once(tmp_path):
+    cache = AssetCache(tmp_path / 'assets.bin')
+    calls = []
+
+    def build():
+        calls.append(1)
+        return np.arange(12, dtype = np.int32).reshape(3, 4)
+
+    first = cache.get('a', 'k1', build)
+    second = AssetCache(tmp_path / 'assets.bin').get('a', 'k1', build)
+
+    assert len(calls) == 1
+    assert isinstance(second, np.memmap)
+    assert second.tolist() == first.tolist() == np.arange(12).reshape(3, 4).tolist()
+
+
+def test_key_change_rebuilds_entry(tmp_path):
+    cache = AssetCache(tmp_path / 'assets.bin')
+    cache.get('a', 'k1', lambda: np.zeros(3))
+    cache.get('b', 'k1', lambda: np.ones(5, dtype = bool))
+    assert cache.get('a', 'k2', lambda: np.full(3, 7.0)).tolist() == [7.0] * 3
+
+    # A outra entrada é preservada ao regravar o arquivo
+    reloaded = AssetCache(tmp_path / 'assets.bin')
+    assert reloaded.get('b', 'k1', lambda: np.zeros(5, dtype = bool)).all()
+    assert reloaded.get('a', 'k2', lambda: np.zeros(3)).tolist() == [7.0] * 3
+
+
+def test_corrupt_file_ignored(tmp_path):
+    path = tmp_path / 'assets.bin'
+    path.write_bytes(b'lixo')
+    assert AssetCache(path).get('a', 'k', lambda: np.ones(2)).tolist() == [1.0, 1.0]
+
+    header = b'{"version": -1, "entries": {}}'
+    path.write_bytes(AssetCache.MAGIC + len(header).to_bytes(4, 'little') + header)
+    assert AssetCache(path).get('a', 'k', lambda: np.ones(2)).tolist() == [1.0, 1.0]
+
+
+def test_asset_key():
+    assert asset_key(Image.BIRD, (10, 10)) == asset_key(Image.BIRD, (10, 10))
+    assert asset_key(Image.BIRD, (10, 10)) != asset_key(Image.BIRD, (10, 11))
+    assert asset_key(Image.BIRD, (10, 10)) != asset_key(Image.PIPE, (10, 10))
+
+
+def test_load_image_matches_load_img(tmp_path, monkeypatch):
+    monkeypatch.setenv('FLAPPY_ASSET_CACHE', str(tmp_path / 'assets.bin'))
+    for path, size in [(Image.PIPE, Pipe.SIZE), (Image.BACKGROUND, (80, 60))]:
+        expected = load_img(path, size)
+        for _ in range(2):
+            image = load_image(path, size)
+            assert image.get_size() == expected.get_size()
+            assert pg.image.tobytes(image, 'RGBA') == pg.image.tobytes(expected, 'RGBA')
+    assert assets.get_cache().path == tmp_path / 'assets.bin'
+
+
+def test_collision_table_cached(tmp_path, monkeypatch, real_masks):
+    masks = Bird.get_mask(), Pipe.get_mask_upper(), Pipe.get_mask_lower()
+    expected = CollisionTable(*masks)
+
+    monkeypatch.setenv('FLAPPY_ASSET_CACHE', str(tmp_path / 'assets.bin'))
+    CollisionTable(*masks, cached = True)
+    table = CollisionTable(*masks, cached = True)
+
+    assert isinstance(table.upper, np.memmap)
+    assert np.array_equal(table.upper, expected.upper)
+    assert np.array_equal(table.lower, expected.lower)
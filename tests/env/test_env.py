@@ -1,4 +1,5 @@
 import pytest
+import random
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -88,6 +89,52 @@ class TestFlappyBird:
         env.step([False])
         assert env.score == 1  # Score deve aumentar quando o pipe é passado
 
+    def test_step_decision_interval(self):
+        """Com decision_interval k, um step avança k ticks de física."""
+
+        random.seed(0)
+        env = FlappyBird(num_birds = 2, gui = True, decision_interval = 3)
+        random.seed(0)
+        reference = FlappyBird(num_birds = 2, gui = False)
+
+        env.ui.update.reset_mock()
+        env.step([True, False])
+        for _ in range(3):
+            reference.step([True, False])
+
+        assert env.steps == 3
+        assert [bird.y for bird in env.birds] == [bird.y for bird in reference.birds]
+        assert env.birds[0].velocity_y == reference.birds[0].velocity_y
+        assert env.ui.update.call_count == 3
+
+    def test_step_flap_once(self):
+        """Com flap_once, o pulo é aplicado apenas no primeiro tick."""
+
+        env = FlappyBird(num_birds = 1, gui = False, decision_interval = 2, flap_once = True)
+        env.step([True])
+        assert env.steps == 2
+        assert env.birds[0].velocity_y == Bird.LIFT + Bird.GRAVITY
+
+    def test_step_decision_interval_stops_when_done(self):
+        """Os ticks restantes não são simulados se todos os pássaros morrerem."""
+
+        env = FlappyBird(num_birds = 1, gui = False, decision_interval = 1000)
+        env.step([False])
+        assert env.done
+        assert env.steps < 1000
+        assert env.birds[0].steps == env.steps - 1
+
+    def test_step_ticks(self):
+        """`ticks` substitui o intervalo de decisão em uma etapa."""
+
+        env = FlappyBird(num_birds = 1, gui = False, decision_interval = 4)
+        env.step([False], 2)
+        assert env.steps == 2
+
+    def test_invalid_decision_interval(self):
+        with pytest.raises(ValueError, match = 'intervalo de decisão'):
+            FlappyBird(num_birds = 1, decision_interval = 0)
+
     def test_get_states(self):
         """Testa o método get_states."""
         
@@ -140,4 +187,26 @@ class TestFlappyBird:
         """Testa a representação em string."""
 
         env = FlappyBird(num_birds=3, gui=False)
-        assert repr(env) == 'FlappyBird(birds_alive=3, score=0)'
\ No newline at end of file
+        assert repr(env) == 'FlappyBird(birds_alive=3, score=0)'
+
+    def test_alive(self):
+        """Testa a máscara de pássaros vivos."""
+
+        env = FlappyBird(num_birds = 3, gui = False)
+        env.birds[1].kill()
+        assert env.alive.tolist() == [True, False, True]
+
+    def test_respawn(self):
+        """Os pássaros substituídos começam vivos na abertura do próximo cano."""
+
+        env = FlappyBird(num_birds = 3, gui = False)
+        for _ in range(30):
+            env.step([0, 0, 0])
+        env.birds[1].kill()
+        states = env.respawn([1])
+
+        bird = env.birds[1]
+        assert bird.is_alive and bird.steps == 0 and bird.score == 0
+        assert bird.y == FlappyBird.spawn_y(env._next_pipes[0])
+        assert states.shape == (3, 4)
+        assert env.steps == 30
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from src.env import ObservationHistory
+from src.main import FlappyBirdAI
+
+
+def test_push_order():
+    """As observações devem sair da mais antiga à mais recente."""
+
+    history = ObservationHistory(num_birds = 2, length = 3, num_features = 4)
+    history.reset(np.zeros((2, 4)))
+    assert history.stacked.shape == (2, 3, 4)
+
+    for i in range(1, 6):
+        history.push(np.full((2, 4), i))
+        expected = [max(j, 0) for j in range(i - 2, i + 1)]
+        assert history.stacked[:, :, 0].tolist() == [expected, expected]
+
+
+def test_views_share_buffer():
+    """As visões não devem copiar o histórico."""
+
+    history = ObservationHistory(num_birds = 5, length = 4)
+    history.reset(np.random.random((5, 4)))
+    for _ in range(7):
+        flat = history.push(np.random.random((5, 4)))
+        assert np.shares_memory(flat, history._buffer)
+        assert np.shares_memory(history.stacked, history._buffer)
+    assert flat.shape == (5, 16)
+    assert np.array_equal(flat[:, -4:], history.stacked[:, -1])
+
+
+def test_reset_rows():
+    """Apenas as linhas reiniciadas perdem as observações antigas."""
+
+    history = ObservationHistory(num_birds = 3, length = 2, num_features = 1)
+    history.reset(np.zeros((3, 1)))
+    history.push(np.ones((3, 1)))
+    flat = history.reset_rows(np.array([1]), np.full((3, 1), 5.0))
+    assert flat.tolist() == [[0, 1], [5, 5], [0, 1]]
+
+
+def test_invalid_length():
+    with pytest.raises(ValueError):
+        ObservationHistory(num_birds = 2, length = 0)
+
+
+def test_training_with_history():
+    """Com HISTORY_LENGTH, a entrada das redes deve ser 4 × K."""
+
+    ai = FlappyBirdAI(gui = False, verbose = False, config = {'NUM_BIRDS': 6, 'MAX_TIME': 50, 'HISTORY_LENGTH': 3})
+    ai.run_generation(1)
+
+    assert ai.TOPOLOGIES[0][0] == (12, 16, 2)
+    assert all(nn.layers[0] == 12 for nn in ai.nns)
+    assert FlappyBirdAI.TOPOLOGIES[0][0] == (4, 16, 2)
@@ -1,9 +1,10 @@
+import numpy as np
 import pytest
 from unittest.mock import Mock, patch
 from ..conftest import MockMask
 
 import pygame as pg
-from src.env.pipe import Pipe, Pipes
+from src.env.pipe import Pipe, Pipes, Difficulty
 from src.env.utils import SCREEN_WIDTH
 from collections import deque
 
@@ -18,7 +19,7 @@ class TestPipe:
         mock_surface.get_width.return_value = Pipe.WIDTH
         mock_surface.get_height.return_value = Pipe.HEIGHT
 
-        with patch('src.env.pipe.load_img', return_value = mock_surface):
+        with patch('src.env.pipe.load_image', return_value = mock_surface):
             yield mock_surface
 
     def test_init(self):
@@ -90,6 +91,9 @@ class TestPipe:
         y = Pipe.random_y()
         assert Pipe.MIN_Y <= y <= Pipe.MAX_Y
 
+        y = Pipe.random_y(np.random.default_rng(0))
+        assert isinstance(y, int) and Pipe.MIN_Y <= y <= Pipe.MAX_Y
+
 
     def test_update(self, ):
         """Testa a atualização da posição do Pipe."""
@@ -99,6 +103,11 @@ class TestPipe:
         pipe.update()
         assert pipe.x == x + Pipe.VELOCITY_X
 
+        pipe = Pipe(x = x, y_lower = 400, gap = 200, velocity_x = -5)
+        pipe.update()
+        assert pipe.x == x - 5
+        assert pipe.y_lower - (pipe.y_upper + Pipe.HEIGHT) == 200
+
 
     def test_render(self, mock_surface):
         """Testa o método render."""
@@ -171,6 +180,33 @@ class TestPipes:
         assert last_pipe in pipes
         assert len(pipes) == initial_len + 1
 
+    def test_rng_blocks(self):
+        """Com um gerador próprio, as alturas são reproduzíveis e sorteadas em blocos."""
+
+        def heights(pipes):
+            ys = []
+            for _ in range(2 * Pipes.HEIGHTS_BLOCK):
+                pipes.pipes.append(Pipe(0, pipes._random_y()))
+                ys.append(pipes[-1].y_lower)
+            return ys
+
+        ys = heights(Pipes(rng = np.random.default_rng(7)))
+        assert ys == heights(Pipes(rng = np.random.default_rng(7)))
+        assert all(Pipe.MIN_Y <= y <= Pipe.MAX_Y for y in ys)
+        assert len(set(ys)) > 1
+
+    def test_from_difficulty(self):
+        """Os canos criados devem seguir a abertura, a distância e a velocidade dadas."""
+
+        difficulty = Difficulty(gap = 250, distance = 300, velocity_x = -2)
+        pipes = Pipes.from_difficulty(difficulty, np.random.default_rng(0))
+        for _ in range(500):
+            pipes.update()
+
+        assert all(pipe.gap == 250 and pipe.velocity_x == -2 for pipe in pipes)
+        assert all(250 <= pipe.y_lower <= Pipe.HEIGHT - 250 for pipe in pipes)
+        assert all(b.x - a.x == Pipe.WIDTH + 300 for a, b in zip(pipes.pipes, list(pipes.pipes)[1:]))
+
     def test_render(self):
         """Testa o método render."""
 
@@ -0,0 +1,58 @@
+import numpy as np
+
+from src.env import FlappyBird, PhaseTimer
+from src.main import FlappyBirdAI
+
+
+def test_add():
+    timer = PhaseTimer()
+    start = timer.now()
+    t = timer.add('a', start)
+    assert t >= start
+    timer.add('a', t)
+    timer.add('a.b', t)
+
+    assert timer.counts == {'a': 2, 'a.b': 1}
+    assert set(timer.as_dict()) == {'a', 'a.b'}
+    assert all(seconds >= 0 for seconds in timer.as_dict().values())
+
+    report = timer.report().splitlines()
+    assert report[0].startswith('Fase')
+    assert report[2].startswith('  b')
+
+    timer.reset()
+    assert timer.as_dict() == {}
+
+
+def test_step_phases():
+    """O ambiente deve medir as fases de step apenas com um timer configurado."""
+
+    env = FlappyBird(num_birds = 3, gui = False)
+    env.step(np.zeros(3))
+
+    timer = env.timer = PhaseTimer()
+    for _ in range(5):
+        env.step(np.zeros(3))
+
+    for phase in ('step', 'step.pipes_update', 'step.get_next_pipes', 'step.birds_update', 'step.get_states'):
+        assert timer.counts[phase] == 5
+    assert timer.counts['step.birds_update.collisions'] >= 5
+    assert timer.totals['step'] >= timer.totals['step.birds_update']
+
+
+def test_training_timing():
+    """Com TIMING, cada geração guarda o tempo de suas fases."""
+
+    ai = FlappyBirdAI(gui = False, verbose = False, config = {'NUM_BIRDS': 5, 'MAX_TIME': 50, 'TIMING': True})
+    ai.run_generation(1)
+    ai.run_generation(2)
+
+    assert len(ai.timings) == 2
+    timings = ai.timings[-1]
+    for phase in ('decode', 'simulate', 'simulate.inference', 'step', 'stats', 'breed'):
+        assert phase in timings
+    assert ai.timer.counts['simulate.inference'] == ai.env.steps
+
+    ai = FlappyBirdAI(gui = False, verbose = False, config = {'NUM_BIRDS': 5, 'MAX_TIME': 50})
+    ai.run_generation(1)
+    assert ai.timer is None and ai.timings == []
@@ -0,0 +1,68 @@
+import pytest
+
+from src.env import Bird, Pipe
+from src.env.pipe import Pipes
+from src.env.ui import FlappyBirdUI
+
+
+@pytest.fixture
+def ui(monkeypatch, real_masks):
+    monkeypatch.setenv('SDL_VIDEODRIVER', 'dummy')
+    ui = FlappyBirdUI()
+    yield ui
+    ui.close()
+
+
+def test_converted_images(ui):
+    """As imagens devem estar no formato da tela."""
+
+    screen = ui._screen
+    assert Bird.get_image().get_bitsize() == screen.get_bitsize()
+    assert Pipe.get_image_upper().get_bitsize() == screen.get_bitsize()
+
+
+def test_glyph_cache(ui):
+    """Cada dígito deve ser renderizado uma única vez e o texto só recalculado quando muda."""
+
+    ui.update(birds_alive = 100, score = 10)
+    text = ui._text_birds_alive
+    assert set(ui._glyphs) == {'0', '1'}
+    assert ui._text_birds_alive[1][0] is ui._text_birds_alive[2][0]
+
+    ui.update(birds_alive = 100, score = 11)
+    assert ui._text_birds_alive is text
+    assert set(ui._glyphs) == {'0', '1'}
+
+
+def test_birds_at_same_height_drawn_once(ui):
+
+    birds = [Bird() for _ in range(10)]
+    birds[0].y = 100
+    pipes = Pipes()
+
+    sequence = ui.blits(birds, pipes)
+    bird_blits = [blit for blit in sequence if blit[0] is Bird.get_image()]
+    assert len(bird_blits) == 2
+    assert len(sequence) == 2 + 2 * len(pipes) + len(ui._text_score) + len(ui._text_birds_alive)
+
+
+@pytest.mark.parametrize('scroll', (True, False))
+def test_render(ui, monkeypatch, scroll):
+    """Com o fundo parado, apenas as regiões alteradas devem ser atualizadas."""
+
+    monkeypatch.setattr(FlappyBirdUI, 'SCROLL_BACKGROUND', scroll)
+    monkeypatch.setattr(FlappyBirdUI, 'FPS', 0)
+    birds = [Bird() for _ in range(5)]
+    pipes = Pipes()
+
+    for _ in range(3):
+        for bird in birds:
+            bird.y += 1
+        pipes.update()
+        ui.update(len(birds), 0)
+        ui.render(birds, pipes)
+
+    assert (ui._dirty == []) == scroll
+    if not scroll:
+        area = sum(rect.width * rect.height for rect in ui._dirty)
+        assert 0 < area < ui._screen.get_width() * ui._screen.get_height()
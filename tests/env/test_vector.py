@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from src.env import Bird, Pipe, CollisionTable, VectorFlappyBird
+from src.env.env import EnvClosedError
+
+
+class TestCollisionTable:
+
+    def test_matches_collided(self, real_masks):
+        """A tabela deve reproduzir Bird._collided, inclusive com y fracionário."""
+
+        table = CollisionTable.get()
+        pipe = Pipe(Bird.X + 10, 300)
+        ys = np.arange(-60, Bird.FLOOR + 20, 0.5)
+
+        expected = []
+        for y in ys:
+            bird = Bird()
+            bird.y = float(y)
+            expected.append(bird._collided(pipe))
+
+        assert table.collided(ys, pipe).tolist() == expected
+        assert table.collided(ys, pipe).any() and not table.collided(ys, pipe).all()
+
+    def test_rebuilt_when_masks_change(self, real_masks):
+        table = CollisionTable.get()
+        assert CollisionTable.get() is table
+        Bird._MASK = None
+        assert CollisionTable.get() is not table
+
+
+class TestVectorFlappyBird:
+
+    def test_step(self):
+        env = VectorFlappyBird(num_birds = 3)
+        states = env.step(np.array([1, 0, 0]))
+
+        assert states.shape == (3, 4)
+        assert env.velocities.tolist() == [Bird.LIFT, Bird.GRAVITY, Bird.GRAVITY]
+        assert env.steps == 1
+        with pytest.raises(ValueError):
+            env.step(np.zeros(2))
+
+    def test_done(self):
+        env = VectorFlappyBird(num_birds = 2)
+        env.close()
+        assert env.done
+        with pytest.raises(EnvClosedError):
+            env.step(np.zeros(2))
+
+        env.reset()
+        assert env.alive.all() and env.steps == 0
+
+
+def test_courses_match_reference(real_masks):
+    """Cada percurso semeado deve reproduzir o FlappyBird de referência com a mesma semente."""
+
+    from src.env import FlappyBird
+
+    population, seeds = 6, [3, 11, 42]
+    env = VectorFlappyBird(population * len(seeds), len(seeds), seeds)
+    references = [FlappyBird(population, rng = np.random.default_rng(seed)) for seed in seeds]
+
+    rng = np.random.default_rng(0)
+    while not env.done:
+        actions = (rng.random((population, len(seeds))) < 0.05).astype(int)
+        env.step(actions.reshape(-1))
+        for reference, course_actions in zip(references, actions.T):
+            if reference.birds_alive:
+                reference.step(course_actions)
+
+    steps = env.bird_steps.reshape(population, len(seeds))
+    for c, reference in enumerate(references):
+        assert steps[:, c].tolist() == [bird.steps for bird in reference.birds]
+        assert env.scores[c] == reference.score
+    assert env.steps > 100
+
+
+def test_respawn_matches_reference(real_masks):
+    """`respawn` deve recolocar os pássaros como FlappyBird.respawn."""
+
+    from src.env import FlappyBird
+
+    ref = FlappyBird(3, rng = np.random.default_rng(3))
+    env = VectorFlappyBird(3, 1, [3])
+    for i in range(30):
+        actions = [int(i % 12 == 0), 0, int(i % 12 == 0)]
+        ref.step(actions)
+        env.step(np.array(actions))
+
+    expected = ref.respawn([0, 2])
+    states = env.respawn(np.array([0, 2]))
+    assert np.allclose(states, expected)
+    assert env.alive.tolist() == [True, ref.birds[1].is_alive, True]
+    assert env.bird_steps[[0, 2]].tolist() == [0, 0]
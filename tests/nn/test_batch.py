@@ -0,0 +1,163 @@
+import pytest
+
+import numpy as np
+from src.nn import NeuralNetwork, PopulationPolicy, active_neurons
+
+
+@pytest.fixture
+def population():
+    """População com três arquiteturas intercaladas."""
+
+    topologies = [
+        ((4, 16, 2), ('relu', 'sigmoid')),
+        ((4, 8, 8, 2), ('tanh', 'relu', 'sigmoid')),
+        ((4, 2), ('linear',)),
+    ]
+    return [
+        NeuralNetwork(layers = layers, activations = activations)
+        for layers, activations in (topologies[i % 3] for i in range(30))
+    ]
+
+
+def test_groups(population):
+    """Testa o agrupamento por arquitetura."""
+
+    policy = PopulationPolicy(population)
+    assert len(policy) == 30
+    assert len(policy.groups) == 3
+    assert sorted(len(g.indices) for g in policy.groups) == [10, 10, 10]
+
+
+def test_predict_matches_networks(population):
+    """As ações em lote devem ser iguais às de cada rede individualmente."""
+
+    states = np.random.uniform(-1, 1, (30, 4))
+    expected = [nn.predict(state.reshape(-1, 1)) for nn, state in zip(population, states)]
+    assert PopulationPolicy(population).predict(states).tolist() == expected
+
+
+def test_predict_alive_mask(population):
+    """Redes mortas não são avaliadas e recebem ação 0."""
+
+    states = np.random.uniform(-1, 1, (30, 4))
+    alive = np.zeros(30, dtype = bool)
+    alive[[1, 4, 5, 17, 29]] = True
+
+    actions = PopulationPolicy(population).predict(states, alive)
+    for i, (nn, state) in enumerate(zip(population, states)):
+        expected = nn.predict(state.reshape(-1, 1)) if alive[i] else 0
+        assert actions[i] == expected
+
+
+def test_predict_invalid_size(population):
+    with pytest.raises(ValueError):
+        PopulationPolicy(population).predict(np.zeros((3, 4)))
+
+
+def test_predict_many_states(population):
+    """Com (N, R, entradas), cada rede deve avaliar seus R estados."""
+
+    policy = PopulationPolicy(population)
+    states = np.random.random((30, 5, 4))
+    expected = np.array([[nn.predict(state[:, None]) for state in per_nn] for nn, per_nn in zip(population, states)])
+    assert np.array_equal(policy.predict(states), expected)
+
+    alive = np.random.random((30, 5)) < 0.5
+    alive[3] = False
+    actions = policy.predict(states, alive)
+    assert np.array_equal(actions[alive], expected[alive])
+    assert not actions[~alive].any()
+
+
+@pytest.mark.parametrize('batch_size', [1, 3, 7, 100])
+def test_predict_batch_size(population, batch_size):
+    """Avaliar em lotes menores não deve alterar as ações."""
+
+    states = np.random.random((30, 5, 4))
+    alive = np.random.random((30, 5)) < 0.5
+    policy = PopulationPolicy(population)
+    batched = PopulationPolicy(population, batch_size = batch_size)
+
+    assert np.array_equal(batched.predict(states), policy.predict(states))
+    assert np.array_equal(batched.predict(states, alive), policy.predict(states, alive))
+    with pytest.raises(ValueError):
+        PopulationPolicy(population, batch_size = 0)
+
+
+def test_replace(population):
+    """`replace` deve ter o mesmo efeito que reconstruir a política."""
+
+    policy = PopulationPolicy(population)
+    new = [NeuralNetwork(layers = population[i].layers, activations = population[i].activations) for i in (1, 3, 5)]
+    policy.replace([1, 3, 5], new)
+
+    expected = list(population)
+    expected[1], expected[3], expected[5] = new
+    states = np.random.uniform(-1, 1, (30, 4))
+    assert policy.predict(states).tolist() == PopulationPolicy(expected).predict(states).tolist()
+
+    with pytest.raises(ValueError):
+        policy.replace([0], [NeuralNetwork(layers = (4, 2), activations = ('linear',))])
+
+
+def test_from_genomes():
+    """A política criada dos genomas deve ser igual à das redes."""
+
+    layers, activations = (4, 8, 3, 2), ('tanh', 'relu', 'sigmoid')
+    nns = [NeuralNetwork(layers = layers, activations = activations) for _ in range(12)]
+    genomes = np.stack([nn.genome() for nn in nns]).astype(np.float32)
+
+    policy = PopulationPolicy.from_genomes(genomes, layers, activations, batch_size = 5)
+    expected = PopulationPolicy([NeuralNetwork.from_genome(g.astype(float), layers, activations) for g in genomes])
+    states = np.random.uniform(-1, 1, (12, 4))
+    alive = np.arange(12) % 3 > 0
+    assert len(policy) == 12
+    assert policy.predict(states, alive).tolist() == expected.predict(states, alive).tolist()
+
+    with pytest.raises(ValueError):
+        PopulationPolicy.from_genomes(genomes[:, 1:], layers, activations)
+
+
+def test_active_neurons():
+    """Neurônios sem caminho ativo até a saída são removidos."""
+
+    masks = [
+        np.array([[1, 0, 0], [0, 1, 0], [1, 0, 0]], dtype = bool),
+        np.array([[1, 0, 0], [0, 0, 1]], dtype = bool),
+    ]
+    assert [n.tolist() for n in active_neurons(masks)] == [[0], [0, 2]]
+
+
+def test_pruned_population(population):
+    """Com redes podadas, as matrizes do grupo encolhem e as ações não mudam."""
+
+    for nn in population:
+        nn.prune(sparsity = 0.8)
+    policy = PopulationPolicy(population)
+    dense = PopulationPolicy([NeuralNetwork(nn.weights, nn.bias, activations = nn.activations) for nn in population])
+    assert all(group.neurons is not None for group in policy.groups)
+
+    states = np.random.uniform(-1, 1, (30, 5, 4))
+    alive = np.random.random((30, 5)) < 0.5
+    assert np.array_equal(policy.predict(states, alive), dense.predict(states, alive))
+
+    new = NeuralNetwork(population[0].weights, population[0].bias, activations = population[0].activations, masks = population[0].masks)
+    policy.replace([3], [new])
+    population[3] = new
+    assert np.array_equal(policy.predict(states), PopulationPolicy(population).predict(states))
+
+
+def test_from_genomes_mask():
+    """Genomas com uma máscara comum usam as matrizes compactadas."""
+
+    layers, activations = (4, 16, 2), ('relu', 'sigmoid')
+    nn = NeuralNetwork(layers = layers, activations = activations)
+    nn.prune(sparsity = 0.9)
+    mask = nn.genome_mask()
+    genomes = np.random.uniform(-0.5, 0.5, (10, len(mask))) * mask
+
+    policy = PopulationPolicy.from_genomes(genomes, layers, activations, mask = mask)
+    expected = PopulationPolicy.from_genomes(genomes, layers, activations)
+    assert policy.groups[0].weights[0].shape[1] < 16
+    states = np.random.uniform(-1, 1, (10, 4))
+    assert np.array_equal(policy.predict(states), expected.predict(states))
@@ -0,0 +1,62 @@
+import pytest
+
+import numpy as np
+from src.nn import diversity
+from src.nn.diversity import mean_pairwise_distance, estimate_pairwise_distance, count_duplicates
+
+
+def brute_force_distance(genomes):
+    n = len(genomes)
+    return np.mean([
+        np.linalg.norm(genomes[i] - genomes[j])
+        for i in range(n) for j in range(n) if i != j
+    ])
+
+
+def test_mean_pairwise_distance():
+    genomes = np.random.default_rng(0).normal(size = (60, 7))
+    assert mean_pairwise_distance(genomes) == pytest.approx(brute_force_distance(genomes))
+    assert mean_pairwise_distance(genomes[:1]) == 0
+
+
+def test_estimate_pairwise_distance():
+    """A estimativa (com e sem projeção) deve ficar próxima do valor exato."""
+
+    rng = np.random.default_rng(1)
+    genomes = rng.normal(size = (1500, 200))
+    exact = mean_pairwise_distance(genomes)
+
+    assert estimate_pairwise_distance(genomes, rng = rng) == pytest.approx(exact, rel = 0.05)
+    assert estimate_pairwise_distance(genomes, projection_dims = 500, rng = rng) == pytest.approx(exact, rel = 0.02)
+
+
+def test_count_duplicates():
+    genomes = np.random.default_rng(2).normal(size = (100, 5))
+    genomes[10] = genomes[3]
+    genomes[20] = genomes[3]
+    genomes[50] = genomes[7]
+    assert count_duplicates(genomes) == 3
+    assert count_duplicates(np.unique(genomes, axis = 0)) == 0
+
+
+def test_diversity():
+    """Testa as estatísticas agregadas e a troca para o modo aproximado."""
+
+    genomes = np.random.default_rng(3).normal(size = (300, 10))
+    stats = diversity(genomes)
+    assert stats.exact
+    assert stats.gene_variance.shape == (10,)
+    assert stats.mean_gene_variance == pytest.approx(genomes.var(axis = 0).mean())
+    assert stats.duplicates == 0
+
+    # Raiz da distância quadrática média exata
+    sq = np.mean([np.sum((a - b) ** 2) for a in genomes[:50] for b in genomes[:50]]) * 50 / 49
+    assert diversity(genomes[:50]).rms_distance == pytest.approx(np.sqrt(sq))
+
+    approx = diversity(genomes, exact_limit = 100)
+    assert not approx.exact
+    assert approx.mean_distance == pytest.approx(stats.mean_distance, rel = 0.05)
+
+    # População convergida
+    assert diversity(np.ones((20, 4))).duplicates == 19
+    assert diversity(np.ones((20, 4))).mean_distance == pytest.approx(0)
@@ -0,0 +1,219 @@
+import pytest
+
+import numpy as np
+from src.nn import NeuralNetwork, crossover, mutate
+
+
+def test_default_topology():
+    """Testa a arquitetura padrão 4 -> 16 -> 2."""
+
+    nn = NeuralNetwork()
+    assert nn.layers == (4, 16, 2)
+    assert nn.activations == ('relu', 'sigmoid')
+    assert [w.shape for w in nn.weights] == [(16, 4), (2, 16)]
+    assert [b.shape for b in nn.bias] == [(16, 1), (2, 1)]
+
+
+def test_custom_topology():
+    """Testa a criação de uma rede com camadas e ativações configuradas."""
+
+    nn = NeuralNetwork(layers = (4, 32, 8, 2), activations = ('tanh', 'relu', 'linear'))
+    assert nn.layers == (4, 32, 8, 2)
+    assert nn.topology == ((4, 32, 8, 2), ('tanh', 'relu', 'linear'))
+    assert nn.predict(np.zeros((4, 1))) in (0, 1)
+
+    # Ativações padrão para camadas configuradas
+    assert NeuralNetwork(layers = (4, 8, 8, 2)).activations == ('relu', 'relu', 'sigmoid')
+
+
+@pytest.mark.parametrize(
+    ('layers', 'activations'),
+    (
+        ((4,), None),
+        ((4, 8, 2), ('relu',)),
+        ((4, 8, 2), ('relu', 'softplus')),
+    )
+)
+def test_invalid_topology(layers, activations):
+    with pytest.raises(ValueError):
+        NeuralNetwork(layers = layers, activations = activations)
+
+
+def test_predict_batch_matches_predict():
+    """Testa se predict_batch equivale a predict aplicado a cada linha."""
+
+    nn = NeuralNetwork(layers = (4, 12, 6, 2))
+    states = np.random.uniform(-1, 1, (50, 4))
+    expected = [nn.predict(state.reshape(-1, 1)) for state in states]
+    assert nn.predict_batch(states).tolist() == expected
+
+
+def test_crossover_keeps_topology():
+    """O filho herda a arquitetura; arquiteturas diferentes não cruzam."""
+
+    nn1 = NeuralNetwork(layers = (4, 8, 2), activations = ('tanh', 'sigmoid'))
+    nn2 = NeuralNetwork(layers = (4, 8, 2), activations = ('tanh', 'sigmoid'))
+    assert crossover(nn1, nn2).topology == nn1.topology
+
+    with pytest.raises(ValueError):
+        crossover(nn1, NeuralNetwork())
+
+
+def test_prune_threshold():
+    """Pesos com magnitude abaixo do limite são zerados e desconectados."""
+
+    nn = NeuralNetwork()
+    small = [np.abs(w) < 0.25 for w in nn.weights]
+    nn.prune(threshold = 0.25)
+
+    for weights, mask, expected in zip(nn.weights, nn.masks, small):
+        assert (mask == ~expected).all()
+        assert (weights[expected] == 0).all()
+    assert nn.density < 1
+    assert nn.num_parameters == sum(int(m.sum()) for m in nn.masks) + 18
+
+
+def test_prune_sparsity():
+    """Cada camada deve ficar com a fração de pesos podados pedida."""
+
+    nn = NeuralNetwork(layers = (4, 20, 10, 2))
+    nn.prune(sparsity = 0.5)
+    for weights, mask in zip(nn.weights, nn.masks):
+        assert mask.sum() == weights.size - round(0.5 * weights.size)
+
+    # Podas sucessivas nunca reconectam pesos
+    before = [m.copy() for m in nn.masks]
+    nn.prune(sparsity = 0.25)
+    assert all((m <= b).all() for m, b in zip(nn.masks, before))
+
+
+@pytest.mark.parametrize(('threshold', 'sparsity'), ((None, None), (0.1, 0.5), (None, 1.5)))
+def test_prune_invalid(threshold, sparsity):
+    with pytest.raises(ValueError):
+        NeuralNetwork().prune(threshold = threshold, sparsity = sparsity)
+
+
+def test_genetic_preserves_masks():
+    """Cruzamento e mutação não devem reativar conexões podadas."""
+
+    from src.nn import mutate
+
+    nn1 = NeuralNetwork()
+    nn2 = NeuralNetwork()
+    nn1.prune(sparsity = 0.5)
+    nn2.prune(sparsity = 0.5)
+
+    child = crossover(nn1, nn2)
+    assert child.masks is not None
+    for w, m, m1, m2 in zip(child.weights, child.masks, nn1.masks, nn2.masks):
+        assert (m <= (m1 | m2)).all()
+        assert (w[~m] == 0).all()
+
+    for _ in range(20):
+        mutate(child, rate = 1, strength = 1)
+    for w, m in zip(child.weights, child.masks):
+        assert (w[~m] == 0).all()
+
+    # Redes densas continuam densas
+    assert crossover(NeuralNetwork(), NeuralNetwork()).masks is None
+
+
+def test_genome_mask_roundtrip():
+    """A máscara do genoma recria a rede podada, com os bias sempre ativos."""
+
+    nn = NeuralNetwork(layers = (4, 8, 2))
+    assert nn.genome_mask().all()
+    nn.prune(sparsity = 0.5)
+
+    mask = nn.genome_mask()
+    assert mask.sum() == nn.num_parameters
+    copy = NeuralNetwork.from_genome(nn.genome(), nn.layers, nn.activations, mask)
+    for m1, m2 in zip(copy.masks, nn.masks):
+        assert (m1 == m2).all()
+    assert (nn.genome()[~mask] == 0).all()
+
+
+def test_training_pruning():
+    """Após PRUNE_GENERATION, a máscara vale para toda a população nas
+    gerações seguintes e a inferência em lote usa matrizes menores."""
+
+    from src.main import FlappyBirdAI
+    from src.nn import PopulationPolicy, genome_size
+
+    config = {
+        'NUM_BIRDS': 20, 'MAX_TIME': 100, 'SEED': 0, 'PRUNE_SPARSITY': 0.8, 'PRUNE_GENERATION': 1,
+        'TOPOLOGIES': [((4, 16, 2), ('relu', 'sigmoid')), ((4, 8, 8, 2), ('relu', 'relu', 'sigmoid'))],
+    }
+    ai = FlappyBirdAI(gui = False, verbose = False, config = config)
+    ai.run_generation(1)
+    masks = [optimizer.mask.copy() for optimizer in ai.optimizers]
+    for (layers, _), mask in zip(ai.TOPOLOGIES, masks):
+        assert mask.sum() < genome_size(layers)
+
+    for generation in (2, 3):
+        ai.run_generation(generation)
+        for optimizer, mask in zip(ai.optimizers, masks):
+            assert np.array_equal(optimizer.mask, mask)
+            assert not optimizer.ask()[:, ~mask].any()
+        assert all(nn.masks is not None for nn in ai.nns)
+
+    dense = PopulationPolicy([NeuralNetwork(nn.weights, nn.bias, activations = nn.activations) for nn in ai.nns])
+    policy = PopulationPolicy(ai.nns)
+    assert sum(w[0].size for g in policy.groups for w in g.weights) < sum(w[0].size for g in dense.groups for w in g.weights)
+    states = np.random.uniform(-1, 1, (20, 4))
+    assert np.array_equal(policy.predict(states), dense.predict(states))
+    assert ai.best_nn.num_parameters < genome_size(ai.best_nn.layers)
+
+    with pytest.raises(ValueError):
+        FlappyBirdAI(gui = False, verbose = False, config = config | {'OPTIMIZER': 'es'})
+
+
+def test_sparse_inference_matches_dense(monkeypatch):
+    """O caminho esparso deve dar o mesmo resultado que o denso."""
+
+    import src.nn.nn as nn_module
+
+    nn = NeuralNetwork(layers = (4, 64, 64, 2))
+    nn.prune(sparsity = 0.9)
+    states = np.random.uniform(-1, 1, (40, 4))
+    dense = nn.predict_batch(states)
+
+    monkeypatch.setattr(nn_module, 'SPARSE_MIN_WEIGHTS', 0)
+    monkeypatch.setattr(nn_module, 'SPARSE_MAX_DENSITY', 1.0)
+    nn.prune(sparsity = 0.9)
+    assert all(layer is not None for layer in nn._sparse)
+
+    assert (nn.predict_batch(states) == dense).all()
+    assert [nn.predict(s.reshape(-1, 1)) for s in states] == dense.tolist()
+
+
+def test_pickle_pruned_network():
+    """Redes podadas são serializadas apenas com os pesos ativos."""
+
+    import pickle
+
+    nn = NeuralNetwork(layers = (4, 128, 2))
+    dense_size = len(pickle.dumps(nn))
+    nn.prune(sparsity = 0.9)
+    data = pickle.dumps(nn)
+    assert len(data) < dense_size / 2
+
+    loaded = pickle.loads(data)
+    assert loaded.topology == nn.topology
+    for w1, w2, m1, m2 in zip(loaded.weights, nn.weights, loaded.masks, nn.masks):
+        assert (w1 == w2).all()
+        assert (m1 == m2).all()
+
+
+def test_genetic_reproducible_with_generator():
+    """Com o mesmo Generator, inicialização, cruzamento e mutação se repetem."""
+
+    def evolve(seed):
+        rng = np.random.default_rng(seed)
+        nn1, nn2 = NeuralNetwork(rng = rng), NeuralNetwork(rng = rng)
+        child = crossover(nn1, nn2, rng)
+        mutate(child, rate = 1.0, rng = rng)
+        return child.genome()
+
+    assert np.array_equal(evolve(3), evolve(3))
+    assert not np.array_equal(evolve(3), evolve(4))
@@ -0,0 +1,125 @@
+import pytest
+
+import numpy as np
+from src.nn import NeuralNetwork, genome_size, make_optimizer
+from src.nn.optim import GeneticOptimizer, EvolutionStrategy, CMAES, centered_ranks
+
+
+def sphere(genomes, target):
+    return -((genomes - target) ** 2).sum(axis = 1)
+
+
+def test_genome_roundtrip():
+    """Testa a conversão entre rede e genoma."""
+
+    nn = NeuralNetwork(layers = (4, 6, 3, 2))
+    genome = nn.genome()
+    assert genome.shape == (genome_size((4, 6, 3, 2)),)
+
+    copy = NeuralNetwork.from_genome(genome, nn.layers, nn.activations)
+    for w1, w2 in zip(nn.weights, copy.weights):
+        assert (w1 == w2).all()
+    for b1, b2 in zip(nn.bias, copy.bias):
+        assert (b1 == b2).all()
+
+    with pytest.raises(ValueError):
+        NeuralNetwork.from_genome(genome[:-1], nn.layers)
+
+
+@pytest.mark.parametrize('name', ('ga', 'es', 'cmaes'))
+def test_optimizers_improve(name):
+    """Todos os otimizadores devem aproximar o máximo de uma função simples."""
+
+    np.random.seed(0)
+    target = np.linspace(-1, 1, 10)
+    optimizer = make_optimizer(name, 10, 31)
+
+    initial = None
+    for _ in range(100):
+        genomes = optimizer.ask()
+        assert genomes.shape == (31, 10)
+        fitness = sphere(genomes, target)
+        initial = fitness.max() if initial is None else initial
+        optimizer.tell(fitness)
+
+    assert optimizer.generation == 100
+    assert optimizer.best_fitness > initial
+    assert optimizer.best_fitness > -0.5
+    assert sphere(optimizer.best_genome[None], target)[0] == optimizer.best_fitness
+
+
+def test_genetic_optimizer_keeps_elites():
+    """As elites devem ser mantidas intactas na próxima geração."""
+
+    optimizer = GeneticOptimizer(5, 10, elite_percentage = 0.2, random_percentage = 0.1)
+    genomes = optimizer.ask().copy()
+    fitness = np.arange(10.0)
+    optimizer.tell(fitness)
+
+    new = optimizer.ask()
+    assert len(new) == 10
+    assert (new[0] == genomes[9]).all()
+    assert (new[1] == genomes[8]).all()
+
+
+def test_genetic_optimizer_mask():
+    """Com uma máscara, os genes inativos continuam nulos a cada geração."""
+
+    optimizer = GeneticOptimizer(12, 20, rng = np.random.default_rng(0))
+    mask = np.arange(12) % 3 > 0
+    optimizer.set_mask(mask)
+    for _ in range(5):
+        genomes = optimizer.ask()
+        assert not genomes[:, ~mask].any()
+        assert genomes[:, mask].all()
+        optimizer.tell(genomes.sum(axis = 1))
+
+    optimizer.immigrate(np.ones((2, 12)))
+    assert not optimizer.ask()[:, ~mask].any()
+    with pytest.raises(ValueError):
+        optimizer.set_mask(np.ones(5, dtype = bool))
+
+
+def test_es_antithetic():
+    """As perturbações do OpenAI-ES devem vir em pares simétricos."""
+
+    optimizer = EvolutionStrategy(4, 7)
+    genomes = optimizer.ask()
+    assert np.allclose(genomes[:3] + genomes[3:6], 2 * optimizer.mean)
+    assert (genomes[6] == optimizer.mean).all()
+
+
+def test_tell_before_ask():
+    with pytest.raises(RuntimeError):
+        CMAES(3, 6).tell(np.zeros(6))
+
+
+def test_tell_invalid_fitness():
+    optimizer = make_optimizer('ga', 3, 6)
+    optimizer.ask()
+    with pytest.raises(ValueError):
+        optimizer.tell(np.zeros(5))
+
+
+def test_unknown_optimizer():
+    with pytest.raises(ValueError):
+        make_optimizer('sgd', 3, 6)
+
+
+def test_centered_ranks():
+    assert centered_ranks(np.array([3.0, -1.0, 10.0])).tolist() == [0.0, -0.5, 0.5]
+
+
+@pytest.mark.parametrize('name', ('ga', 'es', 'cmaes'))
+def test_optimizer_rng_reproducible(name):
+    """Com Generators de mesma semente, os otimizadores produzem os mesmos genomas."""
+
+    def run(seed):
+        optimizer = make_optimizer(name, 6, 12, rng = np.random.default_rng(seed))
+        for _ in range(3):
+            genomes = optimizer.ask().copy()
+            optimizer.tell(-np.sum(genomes ** 2, axis = 1))
+        return optimizer.ask()
+
+    assert np.array_equal(run(5), run(5))
+    assert not np.array_equal(run(5), run(6))
@@ -0,0 +1,146 @@
+import pytest
+
+import numpy as np
+from src.nn import SteadyStateEvolution
+
+
+def sphere(genomes, target):
+    return -((genomes - target) ** 2).sum(axis = 1)
+
+
+def test_first_spawns_are_random():
+    """Sem elites no arquivo, os genomas são aleatórios e com identificadores novos."""
+
+    evolution = SteadyStateEvolution(5, 10, rng = np.random.default_rng(0))
+    ids, genomes = evolution.spawn(4)
+    assert ids.tolist() == [0, 1, 2, 3]
+    assert genomes.shape == (4, 5)
+    assert np.abs(genomes).max() <= 0.5
+    assert evolution.births == 4
+
+
+def test_archive_keeps_best():
+    """O arquivo guarda as `archive_size` melhores, em ordem decrescente."""
+
+    evolution = SteadyStateEvolution(3, 10, archive_size = 3, rng = np.random.default_rng(0))
+    ids, genomes = evolution.spawn(6)
+    fitness = np.array([5.0, 1.0, 9.0, 3.0, 7.0, 0.0])
+    evolution.report(ids, genomes, fitness)
+
+    assert evolution.fitness.tolist() == [9.0, 7.0, 5.0]
+    assert evolution.ids.tolist() == [2, 4, 0]
+    assert np.array_equal(evolution.genomes, genomes[[2, 4, 0]])
+    assert evolution.best_fitness == 9.0
+    assert np.array_equal(evolution.best_genome, genomes[2])
+
+
+def test_reevaluation_averages_fitness():
+    """Uma cópia de elite mantém seu identificador e atualiza a aptidão média."""
+
+    evolution = SteadyStateEvolution(3, 10, archive_size = 2, random_percentage = 0, reevaluation = 1,
+                                     rng = np.random.default_rng(0))
+    ids, genomes = evolution.spawn(2)
+    evolution.report(ids, genomes, np.array([10.0, 4.0]))
+
+    clone_ids, clones = evolution.spawn(3)
+    assert set(clone_ids.tolist()) <= {0, 1}
+    for i, genome in zip(clone_ids, clones):
+        assert np.array_equal(genome, genomes[i])
+
+    # A elite que teve sorte perde o lugar ao ser reavaliada
+    evolution.report(np.array([0]), genomes[:1], np.array([-10.0]))
+    assert evolution.ids.tolist() == [1, 0]
+    assert evolution.fitness.tolist() == [4.0, 0.0]
+    assert evolution.evaluations.tolist() == [1, 2]
+
+
+def test_duplicates_in_batch():
+    """Um identificador repetido no lote ocupa uma única vaga do arquivo."""
+
+    evolution = SteadyStateEvolution(2, 10, archive_size = 3, rng = np.random.default_rng(0))
+    ids, genomes = evolution.spawn(2)
+    evolution.report(ids[[0, 0, 1]], genomes[[0, 0, 1]], np.array([3.0, 3.0, 1.0]))
+    assert evolution.ids.tolist() == [0, 1]
+
+
+def test_immigrants_replace_children():
+    evolution = SteadyStateEvolution(4, 10, random_percentage = 0, reevaluation = 0, rng = np.random.default_rng(0))
+    ids, genomes = evolution.spawn(4)
+    evolution.report(ids, genomes, np.arange(4.0))
+
+    immigrant = np.full(4, 9.0)
+    evolution.immigrate([immigrant])
+    _, children = evolution.spawn(3)
+    assert np.array_equal(children[0], immigrant)
+    assert not evolution._immigrants
+    assert np.array_equal(evolution.emigrants(1)[0], genomes[3])
+
+
+def test_improves():
+    """A evolução deve aproximar o máximo de uma função simples."""
+
+    target = np.linspace(-1, 1, 8)
+    evolution = SteadyStateEvolution(8, 30, reevaluation = 0, rng = np.random.default_rng(0))
+    ids, genomes = evolution.spawn(30)
+    initial = sphere(genomes, target).max()
+    for _ in range(300):
+        evolution.report(ids, genomes, sphere(genomes, target))
+        ids, genomes = evolution.spawn(10)
+
+    assert evolution.best_fitness > initial
+    assert evolution.best_fitness > -0.5
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        SteadyStateEvolution(3, 10, archive_size = 1)
+    with pytest.raises(ValueError):
+        SteadyStateEvolution(3, 10, random_percentage = 0.6, reevaluation = 0.6)
+    evolution = SteadyStateEvolution(3, 10)
+    ids, genomes = evolution.spawn(2)
+    with pytest.raises(ValueError):
+        evolution.report(ids, genomes, np.zeros(3))
+
+
+def test_training_steady_state(tmp_path):
+    """Cada geração tem NUM_BIRDS nascimentos, sem reiniciar o percurso,
+    e o treinamento continua a partir de um checkpoint."""
+
+    from src.main import FlappyBirdAI
+
+    config = {
+        'NUM_BIRDS': 12, 'MAX_TIME': 60, 'SEED': 0, 'STEADY_STATE': True, 'HISTORY_LENGTH': 2,
+        'TOPOLOGIES': [((4, 8, 2), ('relu', 'sigmoid')), ((4, 2), ('sigmoid',))],
+    }
+    ai = FlappyBirdAI(gui = False, verbose = False, config = config)
+    assert all(isinstance(optimizer, SteadyStateEvolution) for optimizer in ai.optimizers)
+
+    for generation in (1, 2, 3):
+        ai.run_generation(generation)
+        assert len(ai.steps) == len(ai.scores) == len(ai.nns) >= 12
+        assert ai.steps.max() <= 60
+    assert sum(optimizer.births for optimizer in ai.optimizers) >= 12 * 4
+    assert all(len(optimizer.genomes) >= 2 for optimizer in ai.optimizers)
+    assert ai.best_steps_ever > 0
+
+    path = tmp_path / 'checkpoint.pkl'
+    ai.save_checkpoint(path)
+    resumed = FlappyBirdAI(gui = False, verbose = False, config = config)
+    resumed.load_checkpoint(path)
+    resumed.run_generation(4)
+    assert resumed.optimizers[0].births > ai.optimizers[0].births
+
+    with pytest.raises(ValueError):
+        FlappyBirdAI(gui = False, verbose = False, config = config | {'OPTIMIZER': 'es'})
+
+
+def test_training_steady_state_decision_interval():
+    """Com intervalo de decisão, nenhum pássaro passa de MAX_TIME steps."""
+
+    from src.main import FlappyBirdAI
+
+    config = {'NUM_BIRDS': 10, 'MAX_TIME': 30, 'SEED': 0, 'STEADY_STATE': True, 'DECISION_INTERVAL': 7}
+    ai = FlappyBirdAI(gui = False, verbose = False, config = config)
+    for generation in (1, 2, 3):
+        ai.run_generation(generation)
+        assert ai.steps.max() <= 30
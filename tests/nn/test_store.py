@@ -0,0 +1,137 @@
+import pickle
+
+import pytest
+
+import numpy as np
+from src.nn import GenomeStore, GeneticOptimizer, OutOfCoreGeneticOptimizer, top_k
+
+
+@pytest.mark.parametrize('k', (1, 7, 50, 200))
+def test_top_k_matches_sort(k):
+    """Os índices devem ser os k maiores, do maior para o menor, com empates pela posição."""
+
+    values = np.random.default_rng(k).integers(0, 40, 200).astype(float)
+    expected = np.lexsort((np.arange(200), -values))[:k]
+    assert top_k(values, k, chunk_size = 16).tolist() == expected.tolist()
+
+
+def test_top_k_memmap(tmp_path):
+    values = np.lib.format.open_memmap(tmp_path / 'values.npy', mode = 'w+', dtype = np.float32, shape = (1000,))
+    values[:] = np.random.default_rng(0).random(1000)
+    assert top_k(values, 10, chunk_size = 64).tolist() == np.argsort(-values)[:10].tolist()
+
+    with pytest.raises(ValueError):
+        top_k(values, 0)
+
+
+def test_store_swap_and_pickle(tmp_path):
+    """O checkpoint guarda apenas a referência aos arquivos, que são reabertos."""
+
+    store = GenomeStore(tmp_path / 'pop', 6, 3)
+    store.current[:] = 1
+    store.next[:] = 2
+    store.swap()
+    assert store.current.dtype == np.float32
+    assert (store.current == 2).all() and (store.next == 1).all()
+
+    data = pickle.dumps(store)
+    assert len(data) < 1000
+    loaded = pickle.loads(data)
+    assert (loaded.current == 2).all() and (loaded.next == 1).all()
+
+    # Um armazenamento novo no mesmo diretório não apaga os arquivos
+    GenomeStore(tmp_path / 'pop', 6, 3)
+    assert (pickle.loads(data).current == 2).all()
+
+    np.lib.format.open_memmap(store.paths[0], mode = 'w+', dtype = np.float32, shape = (5, 3)).flush()
+    with pytest.raises(ValueError):
+        pickle.loads(data)
+
+
+@pytest.mark.parametrize('tied', (False, True))
+def test_single_chunk_matches_genetic_optimizer(tmp_path, tied):
+    """Com um único bloco e float64, as gerações devem ser as do GeneticOptimizer,
+    inclusive com empates na aptidão."""
+
+    reference = GeneticOptimizer(5, 20, rng = np.random.default_rng(3))
+    optimizer = OutOfCoreGeneticOptimizer(5, 20, tmp_path, dtype = np.float64, rng = np.random.default_rng(3))
+
+    rng = np.random.default_rng(0)
+    for _ in range(5):
+        assert np.array_equal(optimizer.ask(), reference.ask())
+        fitness = (rng.integers(0, 5, 20) if tied else rng.permutation(20)).astype(float)
+        reference.tell(fitness)
+        optimizer.tell(fitness)
+    assert np.array_equal(optimizer.best_genome, reference.best_genome)
+    assert np.array_equal(optimizer.emigrants(3), reference.emigrants(3))
+
+
+def test_chunked_improves(tmp_path):
+    """Em blocos, a evolução deve aproximar o máximo de uma função simples."""
+
+    target = np.linspace(-1, 1, 10)
+    optimizer = OutOfCoreGeneticOptimizer(10, 61, tmp_path, chunk_size = 8, rng = np.random.default_rng(0))
+
+    initial = None
+    for _ in range(100):
+        genomes = optimizer.ask()
+        assert isinstance(genomes, np.memmap) and genomes.shape == (61, 10)
+        fitness = -((genomes - target) ** 2).sum(axis = 1)
+        initial = fitness.max() if initial is None else initial
+        optimizer.tell(fitness)
+
+    assert optimizer.best_fitness > initial
+    assert optimizer.best_fitness > -0.5
+    assert optimizer.ask()[:optimizer.elite_count].dtype == np.float32
+
+
+def test_immigrate(tmp_path):
+    optimizer = OutOfCoreGeneticOptimizer(4, 10, tmp_path)
+    optimizer.immigrate(np.ones((2, 4)))
+    assert (optimizer.ask()[-2:] == 1).all()
+
+    with pytest.raises(ValueError):
+        OutOfCoreGeneticOptimizer(4, 10, tmp_path, chunk_size = 0)
+
+
+def test_training_out_of_core(tmp_path):
+    """A aptidão não depende do tamanho dos blocos, e o treinamento
+    continua a partir de um checkpoint com os mesmos arquivos."""
+
+    from src.main import FlappyBirdAI
+
+    config = {
+        'NUM_BIRDS': 25, 'MAX_TIME': 200, 'SEED': 1, 'HISTORY_LENGTH': 2,
+        'TOPOLOGIES': [((4, 8, 2), ('relu', 'sigmoid')), ((4, 2), ('sigmoid',))],
+    }
+    chunked = FlappyBirdAI(gui = False, verbose = False, config = config | {
+        'POPULATION_PATH': str(tmp_path / 'chunked'), 'EVALUATION_CHUNK': 4
+    })
+    whole = FlappyBirdAI(gui = False, verbose = False, config = config | {
+        'POPULATION_PATH': str(tmp_path / 'whole'), 'EVALUATION_CHUNK': 100
+    })
+    assert chunked.env.num_birds == 4 and whole.env.num_birds == 25
+
+    for generation in (1, 2, 3):
+        chunked.run_generation(generation)
+        whole.run_generation(generation)
+        assert len(chunked.steps) == 25
+        assert chunked.steps.tolist() == whole.steps.tolist()
+        assert chunked.generation_bird_steps == whole.generation_bird_steps == chunked.steps.sum()
+    assert chunked.generation_steps > whole.generation_steps
+    assert chunked.best_nn.genome().tolist() == whole.best_nn.genome().tolist()
+    assert chunked.best_steps_ever >= chunked.steps.max()
+
+    path = tmp_path / 'checkpoint.pkl'
+    chunked.save_checkpoint(path)
+    assert path.stat().st_size < 100_000
+    resumed = FlappyBirdAI(gui = False, verbose = False, config = config | {
+        'POPULATION_PATH': str(tmp_path / 'chunked'), 'EVALUATION_CHUNK': 4
+    })
+    resumed.load_checkpoint(path)
+    resumed.run_generation(4)
+    whole.run_generation(4)
+    assert resumed.steps.tolist() == whole.steps.tolist()
+
+    with pytest.raises(ValueError):
+        FlappyBirdAI(gui = False, verbose = False, config = config | {'POPULATION_PATH': str(tmp_path), 'OPTIMIZER': 'es'})
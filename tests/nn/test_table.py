@@ -0,0 +1,75 @@
+import pytest
+
+import numpy as np
+from src.nn import NeuralNetwork, TablePolicy, compile_table
+from src.nn.table import OBSERVATION_LOW, OBSERVATION_HIGH
+
+
+@pytest.fixture
+def nn():
+    np.random.seed(0)
+    return NeuralNetwork()
+
+
+def test_from_network_size(nn):
+    """Testa o tamanho da tabela compactada em bits."""
+
+    policy = TablePolicy.from_network(nn, resolution = 8)
+    assert policy.resolution == (8, 8, 8, 8)
+    assert policy.nbytes == 8 ** 4 // 8
+
+
+def test_predict_matches_network_at_centers(nn):
+    """No centro de cada célula a tabela deve concordar com a rede."""
+
+    resolution = (3, 4, 5, 6)
+    policy = TablePolicy.from_network(nn, resolution = resolution)
+
+    low = np.array(OBSERVATION_LOW)
+    high = np.array(OBSERVATION_HIGH)
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        cell = np.array([rng.integers(r) for r in resolution])
+        state = low + (cell + 0.5) * (high - low) / resolution
+        assert policy.predict(state.reshape(-1, 1)) == nn.predict(state.reshape(-1, 1))
+
+
+def test_predict_batch_matches_predict(nn):
+    """Testa se predict_batch e predict concordam, inclusive fora dos limites."""
+
+    policy = TablePolicy.from_network(nn, resolution = 6)
+    states = np.random.default_rng(2).uniform(-1, 1, (200, 4))
+    batch = policy.predict_batch(states)
+    assert all(batch[i] == policy.predict(state) for i, state in enumerate(states))
+
+
+def test_compile_table_disagreement(nn):
+    """A discordância deve cair com o aumento da resolução."""
+
+    _, coarse = compile_table(nn, resolution = 2, num_samples = 20_000, seed = 0)
+    _, fine = compile_table(nn, resolution = 24, num_samples = 20_000, seed = 0)
+    assert 0 <= fine <= coarse <= 1
+    assert fine < 0.05
+
+
+def test_save_load(nn, tmp_path):
+    """Testa se a tabela é preservada ao salvar e carregar."""
+
+    policy = TablePolicy.from_network(nn, resolution = 5)
+    path = tmp_path / 'policy.npz'
+    policy.save(path)
+    loaded = TablePolicy.load(path)
+
+    assert loaded.bits == policy.bits
+    assert loaded.resolution == policy.resolution
+    assert loaded.low == policy.low
+    assert loaded.high == policy.high
+
+
+def test_invalid_table():
+    """Testa a validação dos parâmetros."""
+
+    with pytest.raises(ValueError):
+        TablePolicy(b'\x00', (4, 4), (0, 0), (1, 1))
+    with pytest.raises(ValueError):
+        TablePolicy(b'\x00' * 2, (4, 4), (0,), (1, 1))
@@ -0,0 +1,87 @@
+import json
+import pytest
+
+from src.autotune import Trial, autotune, choose, load_config, save_config
+from src.main import FlappyBirdAI, main
+
+
+def trial(birds: int, throughput: float) -> Trial:
+    return Trial('pássaros', birds, None, 1, throughput, 50.0, 1)
+
+
+def test_choose():
+    """O primeiro candidato próximo o bastante da maior vazão é o escolhido."""
+
+    trials = [trial(100, 50), trial(500, 92), trial(1000, 100)]
+    assert choose(trials, 0.9).num_birds == 500
+    assert choose(trials, 0.95).num_birds == 1000
+
+
+def test_autotune(tmp_path):
+    recommendation = autotune(
+        {'MAX_TIME': 50}, seconds = 0.2, bird_counts = (8, 16), batch_sizes = (None, 4), max_workers = 2, verbose = False
+    )
+
+    assert recommendation['NUM_BIRDS'] in (8, 16)
+    assert recommendation['INFERENCE_BATCH_SIZE'] in (None, 4)
+    assert recommendation['workers'] in (1, 2)
+    stages = [t['stage'] for t in recommendation['trials']]
+    assert stages.count('pássaros') == 2 and stages.count('lote') == 1
+    assert all(t['bird_steps_per_second'] > 0 for t in recommendation['trials'])
+
+    path = tmp_path / 'tune.json'
+    save_config(recommendation, path)
+    config, workers = load_config(path)
+    assert config == {'NUM_BIRDS': recommendation['NUM_BIRDS'], 'INFERENCE_BATCH_SIZE': recommendation['INFERENCE_BATCH_SIZE']}
+    assert workers == recommendation['workers']
+
+
+def test_load_config_unknown(tmp_path):
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({'NUM_BIRDS': 10, 'NUM_BIRBS': 10}))
+    with pytest.raises(ValueError):
+        load_config(path)
+
+
+def test_main_config(tmp_path):
+    """O arquivo define os parâmetros; opções da linha de comando explícitas prevalecem."""
+
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({'NUM_BIRDS': 6, 'MAX_TIME': 20, 'MAX_GENERATIONS': 5, 'INFERENCE_BATCH_SIZE': 4}))
+
+    with pytest.MonkeyPatch.context() as m:
+        runs = []
+        m.setattr(FlappyBirdAI, 'run', lambda self: runs.append(self))
+        main(['--headless', '--config', str(path), '--generations', '2'])
+    ai = runs[0]
+    assert (ai.NUM_BIRDS, ai.MAX_TIME, ai.INFERENCE_BATCH_SIZE) == (6, 20, 4)
+    assert ai.MAX_GENERATIONS == 2
+
+    # Um valor explícito igual ao padrão também prevalece
+    with pytest.MonkeyPatch.context() as m:
+        runs = []
+        m.setattr(FlappyBirdAI, 'run', lambda self: runs.append(self))
+        main(['--headless', '--config', str(path), '--generation-steps', str(FlappyBirdAI.MAX_TIME)])
+    assert (runs[0].MAX_TIME, runs[0].MAX_GENERATIONS) == (FlappyBirdAI.MAX_TIME, 5)
+
+
+def test_main_config_islands(tmp_path):
+    """As ilhas recebem a configuração do arquivo e da linha de comando."""
+
+    from src.islands import IslandModel, IslandResult
+
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({'NUM_BIRDS': 6, 'MAX_TIME': 20, 'MAX_GENERATIONS': 5}))
+
+    with pytest.MonkeyPatch.context() as m:
+        models = []
+        m.setattr(IslandModel, 'run', lambda self, generations: models.append((self, generations)))
+        m.setattr(IslandModel, 'best', property(lambda self: IslandResult(1, 120, 3, None)))
+        main(['--islands', '2', '--config', str(path), '--history', '2'])
+
+    model, generations = models[0]
+    assert generations == 5
+    assert (model.config['NUM_BIRDS'], model.config['MAX_TIME'], model.config['HISTORY_LENGTH']) == (6, 20, 2)
+
+    with pytest.raises(SystemExit):
+        main(['--islands', '2', '--checkpoint', str(tmp_path / 'run.pkl')])
@@ -0,0 +1,68 @@
+import pytest
+
+from src.benchmark import BENCHMARKS, Case, compare, format_comparison, load_results, main, measure, measure_allocations, run_benchmarks, save_results
+
+
+def test_measure():
+    calls = []
+    resets = []
+    case = Case(lambda: calls.append(1), lambda: resets.append(1), max_calls = 3)
+
+    median, best = measure(case, min_time = 0.01, repeat = 4)
+    assert 0 < best <= median
+    # Calibração + 4 amostras de no máximo 3 chamadas
+    assert len(resets) == 5
+    assert len(calls) == 1 + 4 * 3
+
+
+def test_run_benchmarks(tmp_path):
+    results = run_benchmarks(sizes = (5, 10), min_time = 0.001, repeat = 1, verbose = False)
+
+    names = {r['name'] for r in results}
+    assert names == set(BENCHMARKS)
+    assert {r['size'] for r in results if r['name'] == 'env.step'} == {5, 10}
+    assert {r['size'] for r in results if r['name'] == 'pipes.update'} == {1}
+
+    path = tmp_path / 'bench.json'
+    save_results(results, path)
+    assert load_results(path) == results
+
+    with pytest.raises(ValueError):
+        run_benchmarks(names = ['desconhecido'])
+
+
+def test_compare(tmp_path):
+    baseline = [{'name': 'a', 'size': 10, 'seconds': 1.0}, {'name': 'b', 'size': 10, 'seconds': 1.0}]
+    current = [{'name': 'a', 'size': 10, 'seconds': 1.05}, {'name': 'b', 'size': 10, 'seconds': 2.0}, {'name': 'c', 'size': 1, 'seconds': 1.0}]
+
+    comparison = compare(baseline, current, threshold = 0.1)
+    assert [(row['name'], row['regression']) for row in comparison] == [('a', False), ('b', True)]
+    assert comparison[1]['ratio'] == 2.0
+
+    save_results(baseline, tmp_path / 'baseline.json')
+    save_results(current, tmp_path / 'current.json')
+    assert main(['compare', str(tmp_path / 'baseline.json'), str(tmp_path / 'current.json')]) == 1
+    assert main(['compare', str(tmp_path / 'baseline.json'), str(tmp_path / 'baseline.json')]) == 0
+
+
+def test_measure_allocations():
+    leaked = []
+    retained, peak = measure_allocations(Case(lambda: leaked.append(bytearray(10_000))), calls = 10)
+    assert retained >= 1
+    assert peak >= 10_000
+
+    retained, peak = measure_allocations(Case(lambda: bytearray(10_000)), calls = 10)
+    assert retained < 1
+    assert peak >= 10_000
+
+
+def test_compare_allocations():
+    baseline = [{'name': 'a', 'size': 10, 'seconds': 1.0, 'peak_bytes': 10_000.0, 'blocks_per_call': 0.0}]
+    same = [{'name': 'a', 'size': 10, 'seconds': 1.0, 'peak_bytes': 10_500.0, 'blocks_per_call': 0.2}]
+    more = [{'name': 'a', 'size': 10, 'seconds': 1.0, 'peak_bytes': 40_000.0, 'blocks_per_call': 0.0}]
+    leak = [{'name': 'a', 'size': 10, 'seconds': 1.0, 'peak_bytes': 10_000.0, 'blocks_per_call': 5.0}]
+
+    assert not compare(baseline, same)[0]['regression']
+    assert compare(baseline, more)[0]['regression']
+    assert compare(baseline, leak)[0]['regression']
+    assert 'memória' in format_comparison(compare(baseline, more))
@@ -0,0 +1,116 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.budget import Budget, peak_rss_mb
+from src.main import FlappyBirdAI
+
+
+def test_budget_unlimited():
+    budget = Budget()
+    budget.add_steps(10 ** 9)
+    assert budget.exhausted() is None
+
+
+def test_budget_steps():
+    """O limite de steps considera também os steps da geração em andamento."""
+
+    budget = Budget(total_steps = 100)
+    budget.add_steps(60)
+    assert budget.exhausted() is None
+    assert budget.exhausted(pending_steps = 40) is not None
+
+    budget.start()
+    assert budget.steps == 0
+
+
+def test_budget_wall_time():
+    budget = Budget(wall_time = 10)
+    with patch('src.budget.time.perf_counter', return_value = budget._start + 11):
+        assert 'tempo' in budget.exhausted()
+
+
+def test_budget_rss():
+    if peak_rss_mb() is None:
+        pytest.skip('Plataforma sem informação de memória')
+    assert Budget(max_rss_mb = 1).exhausted() is not None
+    assert Budget(max_rss_mb = 10 ** 9).exhausted() is None
+
+
+@pytest.mark.parametrize('platform, ru_maxrss', (('linux', 512 * 1024), ('darwin', 512 * 2 ** 20)))
+def test_peak_rss_units(platform, ru_maxrss):
+    """ru_maxrss é dado em KB no Linux e em bytes no macOS."""
+
+    if peak_rss_mb() is None:
+        pytest.skip('Plataforma sem informação de memória')
+    with patch('src.budget.sys.platform', platform), \
+            patch('src.budget.resource.getrusage', return_value = SimpleNamespace(ru_maxrss = ru_maxrss)):
+        assert peak_rss_mb() == 512
+
+
+def test_generation_step_cap():
+    """Nenhuma geração deve passar de MAX_TIME steps."""
+
+    ai = FlappyBirdAI(gui = False, verbose = False, config = {'NUM_BIRDS': 4, 'MAX_TIME': 5})
+    ai.run_generation(1)
+    assert ai.env.steps <= 5
+    assert ai.budget.steps == ai.env.steps
+    assert ai.generation == 1
+
+
+def test_run_stops_on_budget_and_saves_checkpoint(tmp_path, capsys):
+    """O treinamento termina ao esgotar o orçamento e salva o checkpoint."""
+
+    path = tmp_path / 'checkpoint.pkl'
+    config = {
+        'NUM_BIRDS': 4,
+        'MAX_GENERATIONS': 1000,
+        'MAX_TIME': 10,
+        'MAX_TOTAL_STEPS': 25,
+        'CHECKPOINT_PATH': str(path)
+    }
+    ai = FlappyBirdAI(gui = False, verbose = False, config = config)
+    ai.run()
+
+    assert ai.stop_reason is not None
+    assert ai.generation < 1000
+    assert ai.budget.steps >= 25
+    assert path.exists()
+    assert 'Orçamento esgotado' in capsys.readouterr().out
+
+    resumed = FlappyBirdAI(gui = False, verbose = False, config = {'NUM_BIRDS': 4})
+    resumed.load_checkpoint(path)
+    assert resumed.generation == ai.generation
+    assert resumed.best_steps_ever == ai.best_steps_ever
+    assert len(resumed.optimizers) == len(ai.optimizers)
+
+
+def test_seed_reproducible():
+    """Com a mesma SEED, o treinamento se repete geração a geração."""
+
+    def run(seed):
+        ai = FlappyBirdAI(gui = False, verbose = False, config = {'NUM_BIRDS': 8, 'MAX_TIME': 200, 'SEED': seed})
+        steps = []
+        for generation in range(1, 4):
+            ai.run_generation(generation)
+            steps.append(ai.steps.tolist())
+        return steps
+
+    assert run(1) == run(1)
+
+
+def test_invalid_config():
+    with pytest.raises(ValueError):
+        FlappyBirdAI(gui = False, config = {'NUM_PASSAROS': 4})
+
+
+def test_seed_reproducible_diversity():
+    """As estimativas de diversidade (populações acima do limite exato) também se repetem."""
+
+    def run(seed):
+        ai = FlappyBirdAI(gui = False, verbose = False, config = {'NUM_BIRDS': 2500, 'MAX_TIME': 1, 'SEED': seed})
+        ai.run_generation(1)
+        assert not ai.diversity[0].exact
+        return [stats.mean_distance for stats in ai.diversity]
+
+    assert run(1) == run(1)
@@ -0,0 +1,64 @@
+import pytest
+from functools import partial
+
+from src.conformance import check_conformance, run_conformance, main
+from src.env import FlappyBird, VectorFlappyBird, Difficulty
+
+
+def test_vector_engine_conforms(real_masks):
+    """O motor vetorizado deve ser idêntico ao de referência, com máscaras reais."""
+
+    assert check_conformance(VectorFlappyBird, seeds = range(5), num_birds = 32) == []
+
+
+@pytest.mark.parametrize('flap_once', [False, True])
+def test_vector_engine_conforms_with_decision_interval(real_masks, flap_once):
+
+    interval = {'decision_interval': 3, 'flap_once': flap_once}
+    divergences = check_conformance(
+        partial(VectorFlappyBird, **interval),
+        seeds = range(3),
+        make_reference = partial(FlappyBird, **interval),
+        num_birds = 16
+    )
+    assert divergences == []
+
+
+def test_vector_engine_conforms_with_difficulty(real_masks):
+
+    difficulty = {'difficulty': Difficulty(gap = 210, distance = 250, velocity_x = -4)}
+    divergences = check_conformance(
+        partial(VectorFlappyBird, **difficulty),
+        seeds = range(3),
+        make_reference = partial(FlappyBird, **difficulty),
+        num_birds = 16
+    )
+    assert divergences == []
+
+
+def test_reports_first_divergence(real_masks):
+
+    class Drifting(VectorFlappyBird):
+        def step(self, actions):
+            states = super().step(actions)
+            if self.steps == 7:
+                self.velocities[3] += 0.25
+            return states
+
+    divergence = run_conformance(Drifting, num_birds = 8, seed = 1)
+    assert divergence is not None
+    assert divergence.step == 7 and divergence.field == 'velocity'
+    assert divergence.birds.tolist() == [3]
+    assert 'step 7' in str(divergence)
+
+
+def test_reference_against_itself(real_masks):
+    """Os percursos sorteados devem ser iguais mesmo com os steps intercalados."""
+
+    assert run_conformance(FlappyBird, num_birds = 8, seed = 2) is None
+
+
+def test_main(real_masks, capsys):
+    assert main(['--seeds', '2', '--birds', '8']) == 0
+    assert '2/2' in capsys.readouterr().out
+    assert main(['--seeds', '1', '--birds', '8', '--decision-interval', '4', '--flap-once']) == 0
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from src.curriculum import Curriculum
+from src.env import Difficulty
+from src.main import FlappyBirdAI
+from src.runlog import read_run_log
+
+
+def test_levels_interpolate_to_target():
+    easy = Difficulty(gap = 250, distance = 300, velocity_x = -2)
+    curriculum = Curriculum(easy, levels = 3, promote_score = 5, patience = None)
+
+    assert curriculum.difficulty == easy
+    assert curriculum.update(np.array([1, 5, 2]))
+    assert curriculum.difficulty == Difficulty(gap = 200, distance = 250, velocity_x = -2)
+    assert not curriculum.update(np.array([4, 0]))
+    assert curriculum.update(np.array([9]))
+
+    assert curriculum.final and curriculum.difficulty == Difficulty()
+    assert not curriculum.update(np.array([100]))
+    assert curriculum.as_dict() == {'level': 2, 'levels': 3} | Difficulty()._asdict()
+
+
+def test_patience():
+    """Sem alcançar a pontuação, o nível sobe após `patience` gerações."""
+
+    curriculum = Curriculum(Difficulty(gap = 300), levels = 2, promote_score = 10, patience = 3)
+    assert [curriculum.update(np.zeros(4)) for _ in range(3)] == [False, False, True]
+    assert curriculum.final
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        Curriculum(Difficulty(), levels = 0)
+    with pytest.raises(ValueError):
+        Curriculum(Difficulty(), patience = 0)
+
+
+def test_training_curriculum(tmp_path):
+    """O ambiente usa o percurso do nível atual, que é gravado no log, e
+    só o percurso padrão conta para o melhor desempenho."""
+
+    path = tmp_path / 'run.jsonl'
+    config = {
+        'NUM_BIRDS': 10, 'MAX_TIME': 100, 'MAX_GENERATIONS': 4, 'SEED': 0, 'RUN_LOG_PATH': str(path),
+        'CURRICULUM': True, 'CURRICULUM_LEVELS': 3, 'CURRICULUM_PROMOTE_SCORE': 10 ** 6, 'CURRICULUM_PATIENCE': 1,
+    }
+    ai = FlappyBirdAI(gui = False, verbose = False, config = config)
+    ai.run_generation(1)
+    assert ai.env.pipes[0].gap == FlappyBirdAI.CURRICULUM_EASY['gap']
+    assert ai.best_steps_ever == 0
+    ai.run_generation(2)
+    ai.run_generation(3)
+    assert ai.env.difficulty == Difficulty() and ai.best_steps_ever > 0
+    ai.run_log.close()
+
+    levels = [record['difficulty']['level'] for record in read_run_log(path)]
+    assert levels == [0, 1, 2]
+    assert read_run_log(path)[0]['difficulty']['gap'] == FlappyBirdAI.CURRICULUM_EASY['gap']
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from src.fitness import aggregate_fitness, trimmed_mean
+from src.main import FlappyBirdAI, main
+
+
+def test_aggregate_fitness():
+    values = np.array([[1, 2, 3, 4, 100], [5, 5, 5, 5, 5]])
+
+    assert aggregate_fitness(values, 'mean').tolist() == [22, 5]
+    assert aggregate_fitness(values, 'min').tolist() == [1, 5]
+    assert aggregate_fitness(values, 'trimmed_mean', trim = 0.2).tolist() == [3, 5]
+    with pytest.raises(ValueError):
+        aggregate_fitness(values, 'median')
+
+
+def test_trimmed_mean():
+    assert trimmed_mean(np.arange(10), trim = 0) == 4.5
+    assert trimmed_mean(np.array([0, 1, 1, 1, 50]), trim = 0.2) == 1
+    with pytest.raises(ValueError):
+        trimmed_mean(np.arange(4), trim = 0.5)
+
+
+def test_training_with_courses():
+    """Com NUM_COURSES, toda a população percorre os mesmos percursos em uma simulação."""
+
+    config = {'NUM_BIRDS': 8, 'NUM_COURSES': 3, 'FITNESS_AGGREGATION': 'min', 'MAX_TIME': 100}
+    ai = FlappyBirdAI(gui = False, verbose = False, config = config)
+    ai.run_generation(1)
+    ai.run_generation(2)
+
+    assert ai.env.num_birds == 24
+    assert ai.steps.shape == (8,)
+    assert np.array_equal(ai.steps, ai.env.bird_steps.reshape(8, 3).min(axis = 1))
+    assert ai.best_steps_ever >= ai.steps.max()
+
+    with pytest.raises(ValueError):
+        FlappyBirdAI(gui = True, verbose = False, config = {'NUM_COURSES': 2})
+    with pytest.raises(ValueError):
+        FlappyBirdAI(gui = False, verbose = False, config = {'FITNESS_AGGREGATION': 'median'})
+
+
+def test_main_courses_requires_headless(capsys):
+    with pytest.raises(SystemExit):
+        main(['--courses', '4'])
+    assert '--headless' in capsys.readouterr().err
@@ -0,0 +1,61 @@
+import pytest
+
+import numpy as np
+from src.islands import IslandModel, neighbors
+from src.nn import GeneticOptimizer
+
+
+@pytest.mark.parametrize(
+    ('topology', 'expected'),
+    (
+        ('ring', [[1], [2], [3], [0]]),
+        ('full', [[1, 2, 3], [0, 2, 3], [0, 1, 3], [0, 1, 2]]),
+    )
+)
+def test_neighbors(topology, expected):
+    assert [neighbors(i, 4, topology) for i in range(4)] == expected
+
+
+def test_neighbors_invalid():
+    with pytest.raises(ValueError):
+        neighbors(0, 4, 'star')
+    assert neighbors(0, 1, 'ring') == []
+
+
+def test_migration_between_optimizers():
+    """Os migrantes são as elites da origem e substituem os últimos do destino."""
+
+    source = GeneticOptimizer(3, 10)
+    target = GeneticOptimizer(3, 10)
+    source.tell(np.arange(10.0))
+
+    migrants = source.emigrants(2)
+    assert (migrants == source.genomes[:2]).all()
+
+    target.immigrate(migrants)
+    assert (target.genomes[-2:] == migrants).all()
+
+
+def test_invalid_model():
+    with pytest.raises(ValueError):
+        IslandModel(config = {'OPTIMIZER': 'es'})
+    with pytest.raises(ValueError):
+        IslandModel(topology = 'star')
+
+
+def test_run():
+    """Testa uma execução curta com duas ilhas e migração."""
+
+    model = IslandModel(
+        num_islands = 2,
+        migration_interval = 1,
+        config = {'NUM_BIRDS': 6},
+        seed = 0
+    )
+    results = model.run(generations = 2, verbose = False)
+
+    assert [r.island for r in results] == [0, 1]
+    assert len(model.history) == 4
+    assert {(s.island, s.generation) for s in model.history} == {(0, 1), (0, 2), (1, 1), (1, 2)}
+    assert all(r.best_genome is not None for r in results)
+    assert model.best in results
@@ -0,0 +1,41 @@
+from src.env import Bird, FlappyBird
+from src.main import FlappyBirdAI
+from src.memory import MemoryProfiler, format_memory_report, live_objects
+from src.runlog import read_run_log
+
+
+def test_live_objects():
+    before = live_objects()
+    env = FlappyBird(num_birds = 7)
+    after = live_objects()
+
+    assert after['Bird'] - before['Bird'] == 7
+    assert after['Pipe'] - before['Pipe'] == len(env.pipes)
+    assert after['ndarray'] >= 0 and after['ndarray_mb'] >= 0
+
+
+def test_memory_profiler():
+    profiler = MemoryProfiler(top = 3).start()
+    try:
+        first = profiler.report()
+        birds = [Bird() for _ in range(500)]
+        second = profiler.report()
+    finally:
+        profiler.stop()
+
+    assert first['growth'] == []
+    assert len(second['top']) <= 3
+    assert second['growth'] and second['growth'][0]['kb'] > 0
+    assert second['objects']['Bird'] >= len(birds)
+    assert 'Objetos vivos' in format_memory_report(second)
+
+
+def test_memory_report_in_run_log(tmp_path):
+    path = tmp_path / 'run.jsonl'
+    config = {'NUM_BIRDS': 5, 'MAX_TIME': 30, 'MAX_GENERATIONS': 2, 'RUN_LOG_PATH': str(path), 'MEMORY_REPORT': True}
+    ai = FlappyBirdAI(gui = False, verbose = False, config = config)
+    ai.run()
+
+    records = read_run_log(path)
+    assert all('memory' in record for record in records)
+    assert records[-1]['memory']['objects']['NeuralNetwork'] >= 5
@@ -0,0 +1,103 @@
+import pytest
+import urllib.error
+import urllib.request
+
+from src.metrics import Metrics, MetricsServer, rate_collector
+from src.main import FlappyBirdAI
+
+
+def test_render():
+    """Testa o formato de texto do Prometheus."""
+
+    metrics = Metrics()
+    metrics.describe('steps_total', 'Steps simulados.')
+    metrics.inc('steps_total')
+    metrics.inc('steps_total', 2)
+    metrics.set('phase_seconds', 0.5, phase = 'simulate')
+    metrics.set('phase_seconds', 0.25, phase = 'breed')
+
+    lines = metrics.render().splitlines()
+    assert '# HELP flappy_steps_total Steps simulados.' in lines
+    assert '# TYPE flappy_steps_total counter' in lines
+    assert 'flappy_steps_total 3' in lines
+    assert '# TYPE flappy_phase_seconds gauge' in lines
+    assert 'flappy_phase_seconds{phase="simulate"} 0.5' in lines
+    assert 'flappy_phase_seconds{phase="breed"} 0.25' in lines
+    assert metrics.get('phase_seconds', phase = 'breed') == 0.25
+
+
+def test_render_large_values():
+    """Contadores grandes e floats devem ser escritos sem arredondamento."""
+
+    metrics = Metrics()
+    metrics.inc('bird_steps_total', 98765432)
+    metrics.inc('bird_steps_total', 1)
+    metrics.set('fitness_mean', 1234567.125)
+
+    samples = dict(line.split(' ') for line in metrics.render().splitlines() if not line.startswith('#'))
+    assert samples['flappy_bird_steps_total'] == '98765433'
+    assert int(samples['flappy_bird_steps_total']) == metrics.get('bird_steps_total')
+    assert float(samples['flappy_fitness_mean']) == 1234567.125
+
+
+def test_rate_collector():
+    metrics = Metrics()
+    metrics.inc('steps_total', 100)
+    metrics.add_collector(rate_collector(metrics, 'steps_total', 'steps_per_second'))
+    assert 'flappy_steps_per_second 0' in metrics.render()
+
+
+def test_server():
+    """O endpoint /metrics deve responder com as métricas atuais."""
+
+    metrics = Metrics()
+    metrics.set('birds_alive', 42)
+    server = MetricsServer(metrics, port = 0).start()
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{server.port}/metrics') as response:
+            body = response.read().decode()
+            assert response.headers['Content-Type'].startswith('text/plain')
+        assert 'flappy_birds_alive 42' in body
+
+        metrics.set('birds_alive', 7)
+        with urllib.request.urlopen(f'http://127.0.0.1:{server.port}/metrics') as response:
+            assert 'flappy_birds_alive 7' in response.read().decode()
+
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f'http://127.0.0.1:{server.port}/outro')
+    finally:
+        server.close()
+
+
+def test_training_metrics():
+    """O treinamento deve publicar as métricas de cada geração."""
+
+    ai = FlappyBirdAI(gui = False, verbose = False, config = {'NUM_BIRDS': 5, 'MAX_TIME': 50, 'METRICS_PORT': 0})
+    try:
+        ai.run_generation(1)
+        text = ai.metrics.render()
+    finally:
+        ai.metrics_server.close()
+
+    assert 'flappy_generations_total 1' in text
+    assert f'flappy_steps_total {ai.env.steps}' in text
+    assert 'flappy_phase_seconds{phase="simulate"}' in text
+    assert 'flappy_memory_rss_mb' in text
+    assert ai.metrics.get('fitness_best') == max(bird.steps for bird in ai.env.birds)
+
+
+def test_training_metrics_decision_interval():
+    """Com intervalo de decisão, a geração para em MAX_TIME e os steps de
+    pássaros não contam os ticks após a morte no meio do intervalo."""
+
+    config = {'NUM_BIRDS': 8, 'MAX_TIME': 20, 'DECISION_INTERVAL': 8, 'SEED': 0, 'METRICS_PORT': 0}
+    for steady in (False, True):
+        ai = FlappyBirdAI(gui = False, verbose = False, config = config | {'STEADY_STATE': steady})
+        try:
+            ai.run_generation(1)
+        finally:
+            ai.metrics_server.close()
+
+        if not steady:
+            assert ai.generation_steps == 20
+        assert ai.metrics.get('bird_steps_total') == ai.generation_bird_steps
@@ -0,0 +1,61 @@
+import pstats
+
+import pytest
+
+from src.main import FlappyBirdAI
+from src.profiling import GenerationProfiler, collapse_pstats
+
+
+def run(seed, **config):
+    ai = FlappyBirdAI(gui = False, verbose = False, config = {'NUM_BIRDS': 6, 'MAX_TIME': 150, 'MAX_GENERATIONS': 3, 'SEED': seed} | config)
+    ai.run()
+    return ai
+
+
+@pytest.mark.parametrize('mode', ['cprofile', 'sample'])
+def test_profile_window_keeps_results(tmp_path, mode):
+    """O perfilamento grava os arquivos da janela sem alterar o treinamento."""
+
+    output = tmp_path / 'perfil'
+    profiled = run(4, PROFILE = mode, PROFILE_START = 2, PROFILE_GENERATIONS = 1, PROFILE_OUTPUT = str(output), PROFILE_INTERVAL = 0.001)
+    plain = run(4)
+
+    assert profiled.steps.tolist() == plain.steps.tolist()
+    assert profiled.best_steps_ever == plain.best_steps_ever
+
+    files = profiled.profiler.files
+    assert (tmp_path / 'perfil.collapsed') in files
+    for line in (tmp_path / 'perfil.collapsed').read_text().splitlines():
+        stack, value = line.rsplit(' ', 1)
+        assert ' ' not in stack and int(value) > 0
+    if mode == 'cprofile':
+        stats = pstats.Stats(str(tmp_path / 'perfil.pstats'))
+        assert any(name == 'run_generation' for _, _, name in stats.stats)
+    else:
+        assert 'amostras' in (tmp_path / 'perfil.txt').read_text()
+
+
+def test_collapse_pstats_preserves_time():
+    import cProfile
+
+    def leaf():
+        return sum(range(20_000))
+
+    def branch():
+        return leaf() + leaf()
+
+    profile = cProfile.Profile()
+    profile.runcall(branch)
+    stats = pstats.Stats(profile)
+
+    stacks = collapse_pstats(stats, min_fraction = 0)
+    total = sum(timing[2] for timing in stats.stats.values())
+    assert sum(stacks.values()) == pytest.approx(total)
+    assert any(stack.rsplit(';', 1)[-1].startswith('leaf_') and 'branch_' in stack for stack in stacks)
+
+
+def test_invalid_profiler():
+    with pytest.raises(ValueError):
+        GenerationProfiler('perf')
+    with pytest.raises(ValueError):
+        GenerationProfiler(generations = 0)
@@ -0,0 +1,72 @@
+import json
+import numpy as np
+
+from src.runlog import RunLog, fitness_summary, read_run_log
+from src.main import FlappyBirdAI
+
+
+def test_fitness_summary():
+    summary = fitness_summary(np.arange(101), bins = 4)
+
+    assert summary['mean'] == 50
+    assert summary['percentiles']['50'] == 50
+    assert summary['percentiles']['0'] == 0 and summary['percentiles']['100'] == 100
+    assert sum(summary['histogram']['counts']) == 101
+    assert len(summary['histogram']['edges']) == 5
+    json.dumps(summary)
+
+
+def test_write_and_rotate(tmp_path):
+    """Os registros devem ser preservados, em ordem, entre os arquivos rotacionados."""
+
+    path = tmp_path / 'run.jsonl'
+    with RunLog(path, max_bytes = 200, backups = 10) as log:
+        for i in range(50):
+            log.write({'generation': i, 'value': 'x' * 10})
+
+    assert path.with_name('run.jsonl.1').exists()
+    assert all(f.stat().st_size <= 200 for f in tmp_path.iterdir())
+    assert [r['generation'] for r in read_run_log(path)] == list(range(50))
+
+
+def test_rotate_discards_oldest(tmp_path):
+    path = tmp_path / 'run.jsonl'
+    with RunLog(path, max_bytes = 100, backups = 2) as log:
+        for i in range(50):
+            log.write({'generation': i})
+
+    assert sorted(f.name for f in tmp_path.iterdir()) == ['run.jsonl', 'run.jsonl.1', 'run.jsonl.2']
+    generations = [r['generation'] for r in read_run_log(path)]
+    assert generations[-1] == 49
+    assert generations == list(range(generations[0], 50))
+
+
+def test_append(tmp_path):
+    """Um novo log no mesmo arquivo continua o anterior."""
+
+    path = tmp_path / 'run.jsonl'
+    with RunLog(path) as log:
+        log.write({'generation': 1})
+    with RunLog(path) as log:
+        log.write({'generation': 2})
+
+    assert [r['generation'] for r in read_run_log(path)] == [1, 2]
+
+
+def test_training_run_log(tmp_path):
+    """O treinamento deve escrever um registro por geração."""
+
+    path = tmp_path / 'run.jsonl'
+    config = {'NUM_BIRDS': 10, 'MAX_TIME': 50, 'MAX_GENERATIONS': 3, 'RUN_LOG_PATH': str(path)}
+    ai = FlappyBirdAI(gui = False, verbose = False, config = config)
+    ai.run()
+
+    records = read_run_log(path)
+    assert [r['generation'] for r in records] == [1, 2, 3]
+
+    record = records[-1]
+    assert record['birds'] == 10
+    assert record['best_steps'] == max(bird.steps for bird in ai.env.birds)
+    assert sum(record['fitness']['histogram']['counts']) == 10
+    assert record['optimizers'][0]['elite'] + record['optimizers'][0]['random'] + record['optimizers'][0]['crossover'] == 10
+    assert record['wall_time'] > 0 and record['steps_per_second'] > 0
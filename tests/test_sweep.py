@@ -0,0 +1,116 @@
+import pytest
+import csv
+import json
+
+from src.sweep import grid_configs, random_configs, spec_configs, load_spec, run_sweep
+
+
+def test_grid_configs():
+    configs = grid_configs({'MUTATION_RATE': [0.1, 0.2], 'NUM_BIRDS': [10, 20, 30]})
+    assert len(configs) == 6
+    assert {'MUTATION_RATE': 0.2, 'NUM_BIRDS': 30} in configs
+
+
+def test_random_configs():
+    """Valores sorteados devem respeitar listas, intervalos e inteiros."""
+
+    params = {
+        'MUTATION_RATE': {'low': 0.01, 'high': 0.5, 'log': True},
+        'NUM_BIRDS': {'low': 10, 'high': 50},
+        'OPTIMIZER': ['ga', 'es'],
+    }
+    configs = random_configs(params, 30, seed = 0)
+    assert len(configs) == 30
+    for config in configs:
+        assert 0.01 <= config['MUTATION_RATE'] <= 0.5
+        assert isinstance(config['NUM_BIRDS'], int) and 10 <= config['NUM_BIRDS'] <= 50
+        assert config['OPTIMIZER'] in ('ga', 'es')
+
+    assert random_configs(params, 5, seed = 1) == random_configs(params, 5, seed = 1)
+
+
+def test_spec_configs(tmp_path):
+    """A configuração base é aplicada a todas as combinações."""
+
+    path = tmp_path / 'spec.json'
+    path.write_text(json.dumps({
+        'mode': 'grid',
+        'params': {'MUTATION_RATE': [0.1, 0.2]},
+        'base': {'MAX_GENERATIONS': 3}
+    }))
+    configs = spec_configs(load_spec(path))
+    assert configs == [
+        {'MAX_GENERATIONS': 3, 'MUTATION_RATE': 0.1},
+        {'MAX_GENERATIONS': 3, 'MUTATION_RATE': 0.2},
+    ]
+
+    with pytest.raises(ValueError):
+        spec_configs({'mode': 'bayes', 'params': {}})
+
+
+def test_run_sweep(tmp_path):
+    """Cada configuração gera uma linha no CSV de resultados."""
+
+    output = tmp_path / 'results.csv'
+    configs = grid_configs({'NUM_BIRDS': [4, 6], 'MAX_GENERATIONS': [2], 'MAX_TIME': [50]})
+    results = run_sweep(configs, output, workers = 2, verbose = False)
+
+    assert [r['run'] for r in results] == [0, 1]
+    assert all(r['generations'] == 2 for r in results)
+
+    with open(output) as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2
+    assert {row['NUM_BIRDS'] for row in rows} == {'4', '6'}
+    assert 'wall_time' in rows[0]
+
+
+def test_run_sweep_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        run_sweep([{'NUM_PASSAROS': 4}], tmp_path / 'results.csv')
+
+
+def test_run_sweep_error(tmp_path):
+    """Uma configuração que falha gera uma linha com o erro, sem interromper as demais."""
+
+    output = tmp_path / 'results.csv'
+    configs = [
+        {'NUM_BIRDS': 4, 'MAX_GENERATIONS': 2, 'MAX_TIME': 50},
+        {'NUM_BIRDS': 4, 'MAX_GENERATIONS': 2, 'MAX_TIME': 50, 'OPTIMIZER': 'bayes'},
+    ]
+    results = run_sweep(configs, output, workers = 2, verbose = False)
+
+    assert [r['run'] for r in results] == [0, 1]
+    assert results[0]['generations'] == 2 and results[0].get('error') is None
+    assert results[1]['error'].startswith('ValueError')
+
+    with open(output) as f:
+        rows = sorted(csv.DictReader(f), key = lambda row: row['run'])
+    assert rows[0]['error'] == ''
+    assert rows[1]['OPTIMIZER'] == 'bayes' and 'bayes' in rows[1]['error']
+
+
+def test_main_sweep_options(tmp_path, monkeypatch):
+    """Apenas as opções explícitas e o arquivo de configuração vão para cada execução."""
+
+    import src.sweep
+    from src.main import main
+
+    spec = tmp_path / 'spec.json'
+    spec.write_text(json.dumps({'params': {'MUTATION_RATE': [0.1, 0.2]}, 'base': {'MAX_TIME': 300}}))
+    config = tmp_path / 'config.json'
+    config.write_text(json.dumps({'NUM_BIRDS': 6, 'MAX_GENERATIONS': 7}))
+
+    calls = []
+    monkeypatch.setattr(src.sweep, 'run_sweep', lambda configs, *args, **kwargs: calls.append(configs))
+    main(['--sweep', str(spec), '--generations', '5', '--generation-steps', '200'])
+    main(['--sweep', str(spec), '--config', str(config), '--history', '2'])
+
+    assert calls[0] == [
+        {'MAX_GENERATIONS': 5, 'MAX_TIME': 300, 'MUTATION_RATE': 0.1},
+        {'MAX_GENERATIONS': 5, 'MAX_TIME': 300, 'MUTATION_RATE': 0.2},
+    ]
+    assert calls[1][0] == {'NUM_BIRDS': 6, 'MAX_GENERATIONS': 7, 'HISTORY_LENGTH': 2, 'MAX_TIME': 300, 'MUTATION_RATE': 0.1}
+
+    with pytest.raises(SystemExit):
+        main(['--sweep', str(spec), '--run-log', str(tmp_path / 'run.jsonl')])